@@ -28,15 +28,21 @@ Most users will want to look at TestWithFixtures and Fixture, to start with.
 from fixtures._version import __version__
 
 __all__ = [
+    "AsyncFixture",
+    "AsyncTimeout",
     "ByteStream",
     "CompoundFixture",
     "DetailStream",
     "EnvironmentVariable",
     "EnvironmentVariableFixture",
+    "EnvironmentVariables",
     "FakeLogger",
     "FakePopen",
     "Fixture",
+    "FixtureGraph",
+    "FixturePool",
     "FunctionFixture",
+    "IsolatedEnvironment",
     "LogHandler",
     "LoggerFixture",
     "MethodFixture",
@@ -44,19 +50,24 @@ __all__ = [
     "MockPatchMultiple",
     "MockPatchObject",
     "MonkeyPatch",
+    "MonkeyPatchSet",
     "MultipleExceptions",
     "NestedTempfile",
     "PackagePathEntry",
     "PopenFixture",
+    "PopenRecorder",
     "PythonPackage",
     "PythonPathEntry",
     "SetupError",
     "StringStream",
     "TempDir",
+    "TempDirPool",
+    "TempDirReaper",
     "TempHomeDir",
     "TestWithFixtures",
     "Timeout",
     "TimeoutException",
+    "TimingCollector",
     "WarningsCapture",
     "WarningsFilter",
     "__version__",
@@ -64,6 +75,7 @@ __all__ = [
 
 
 from fixtures.fixture import (  # noqa: E402
+    AsyncFixture,
     CompoundFixture,
     Fixture,
     FunctionFixture,
@@ -72,29 +84,39 @@ from fixtures.fixture import (  # noqa: E402
     SetupError,
 )
 from fixtures._fixtures import (  # noqa: E402
+    AsyncTimeout,
     ByteStream,
     DetailStream,
     EnvironmentVariable,
     EnvironmentVariableFixture,
+    EnvironmentVariables,
     FakeLogger,
     FakePopen,
+    IsolatedEnvironment,
     LoggerFixture,
     LogHandler,
     MockPatch,
     MockPatchMultiple,
     MockPatchObject,
     MonkeyPatch,
+    MonkeyPatchSet,
     NestedTempfile,
     PackagePathEntry,
     PopenFixture,
+    PopenRecorder,
     PythonPackage,
     PythonPathEntry,
     StringStream,
     TempDir,
+    TempDirPool,
+    TempDirReaper,
     TempHomeDir,
     Timeout,
     TimeoutException,
+    TimingCollector,
     WarningsCapture,
     WarningsFilter,
 )
+from fixtures.graph import FixtureGraph  # noqa: E402
+from fixtures.pool import FixturePool  # noqa: E402
 from fixtures.testcase import TestWithFixtures  # noqa: E402
@@ -17,28 +17,36 @@
 """Included fixtures."""
 
 __all__ = [
+    "AsyncTimeout",
     "ByteStream",
     "DetailStream",
     "EnvironmentVariable",
     "EnvironmentVariableFixture",
+    "EnvironmentVariables",
     "FakeLogger",
     "FakePopen",
+    "IsolatedEnvironment",
     "LoggerFixture",
     "LogHandler",
     "MockPatch",
     "MockPatchMultiple",
     "MockPatchObject",
     "MonkeyPatch",
+    "MonkeyPatchSet",
     "NestedTempfile",
     "PackagePathEntry",
     "PopenFixture",
+    "PopenRecorder",
     "PythonPackage",
     "PythonPathEntry",
     "StringStream",
     "TempDir",
+    "TempDirPool",
+    "TempDirReaper",
     "TempHomeDir",
     "Timeout",
     "TimeoutException",
+    "TimingCollector",
     "WarningsCapture",
     "WarningsFilter",
 ]
@@ -47,6 +55,8 @@ __all__ = [
 from fixtures._fixtures.environ import (
     EnvironmentVariable,
     EnvironmentVariableFixture,
+    EnvironmentVariables,
+    IsolatedEnvironment,
 )
 from fixtures._fixtures.logger import (
     FakeLogger,
@@ -58,10 +68,14 @@ from fixtures._fixtures.mockpatch import (
     MockPatchMultiple,
     MockPatchObject,
 )
-from fixtures._fixtures.monkeypatch import MonkeyPatch
+from fixtures._fixtures.monkeypatch import (
+    MonkeyPatch,
+    MonkeyPatchSet,
+)
 from fixtures._fixtures.popen import (
     FakePopen,
     PopenFixture,
+    PopenRecorder,
 )
 from fixtures._fixtures.packagepath import PackagePathEntry
 from fixtures._fixtures.pythonpackage import PythonPackage
@@ -74,14 +88,18 @@ from fixtures._fixtures.streams import (
 from fixtures._fixtures.tempdir import (
     NestedTempfile,
     TempDir,
+    TempDirPool,
+    TempDirReaper,
 )
 from fixtures._fixtures.temphomedir import (
     TempHomeDir,
 )
 from fixtures._fixtures.timeout import (
+    AsyncTimeout,
     Timeout,
     TimeoutException,
 )
+from fixtures._fixtures.timingcollector import TimingCollector
 from fixtures._fixtures.warnings import (
     WarningsCapture,
     WarningsFilter,
@@ -16,8 +16,11 @@
 __all__ = [
     "EnvironmentVariable",
     "EnvironmentVariableFixture",
+    "EnvironmentVariables",
+    "IsolatedEnvironment",
 ]
 
+from collections.abc import Iterable, Mapping
 import os
 
 from fixtures import Fixture
@@ -58,3 +61,80 @@ class EnvironmentVariable(Fixture):
 
 
 EnvironmentVariableFixture = EnvironmentVariable
+
+
+class EnvironmentVariables(Fixture):
+    """Isolate several environment variables at once.
+
+    This is equivalent to an EnvironmentVariable fixture for each variable,
+    but reads the original values once and restores them in a single
+    cleanup, only writing to os.environ where a value actually changes.
+    """
+
+    variables: dict[str, str | None]
+
+    def __init__(self, variables: Mapping[str, str | None]) -> None:
+        """Create an EnvironmentVariables fixture.
+
+        :param variables: A mapping from the names of the variables to
+            isolate to their new values. A value of None deletes the variable.
+        """
+        super().__init__()
+        self.variables = dict(variables)
+
+    def _setUp(self) -> None:
+        environ = os.environ
+        original = {name: environ.get(name) for name in self.variables}
+        self.addCleanup(_restore_environ, original)
+        for name, value in self.variables.items():
+            if value == original[name]:
+                continue
+            if value is None:
+                del environ[name]
+            else:
+                environ[name] = value
+
+
+class IsolatedEnvironment(Fixture):
+    """Isolate the whole process environment.
+
+    The environment is copied at setUp and, on cleanUp, only the variables
+    which have been added, changed or deleted since are written back, so
+    this is cheap enough to use for every test.
+    """
+
+    allowlist: frozenset[str] | None
+
+    def __init__(self, allowlist: Iterable[str] | None = None) -> None:
+        """Create an IsolatedEnvironment fixture.
+
+        :param allowlist: If supplied, the names of the variables to keep:
+            all others are deleted during setUp.
+        """
+        super().__init__()
+        self.allowlist = None if allowlist is None else frozenset(allowlist)
+
+    def _setUp(self) -> None:
+        environ = os.environ
+        self.addCleanup(_restore_whole_environ, environ.copy())
+        if self.allowlist is not None:
+            for name in [name for name in environ if name not in self.allowlist]:
+                del environ[name]
+
+
+def _restore_whole_environ(snapshot: dict[str, str]) -> None:
+    """Restore the environment to snapshot, deleting any other variables."""
+    added = [name for name in os.environ if name not in snapshot]
+    for name in added:
+        del os.environ[name]
+    _restore_environ(snapshot)
+
+
+def _restore_environ(original: Mapping[str, str | None]) -> None:
+    """Restore the environment variables in original to their values there."""
+    environ = os.environ
+    for name, value in original.items():
+        if value is None:
+            environ.pop(name, None)
+        elif environ.get(name) != value:
+            environ[name] = value
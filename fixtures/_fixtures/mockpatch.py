@@ -15,43 +15,392 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
+import threading
 import unittest.mock as mock
 from typing import Any
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 
 import fixtures
+from fixtures._fixtures.monkeypatch import _resolve
+
+
+# Mock attributes which reset_mock puts back as they were when made.
+_RESET_ATTRIBUTES = frozenset(
+    {
+        "_mock_call_args",
+        "_mock_call_args_list",
+        "_mock_call_count",
+        "_mock_called",
+        "_mock_mock_calls",
+        "_mock_return_value",
+        "_mock_side_effect",
+        "method_calls",
+    }
+)
+
+_MockState = dict[int, dict[str, Any]]
+
+
+def _mock_state(*roots: Any) -> _MockState:
+    """Return the attributes of some mocks and all the mocks under them.
+
+    Attributes which reset_mock resets are left out, so any difference
+    between two states of the same mocks is configuration reset_mock would
+    not undo.
+    """
+    state: _MockState = {}
+    pending = list(roots)
+    while pending:
+        current = pending.pop()
+        if id(current) in state:
+            continue
+        attributes = {
+            name: value
+            for name, value in vars(current).items()
+            if name not in _RESET_ATTRIBUTES
+        }
+        # The children dict is changed in place, so it is copied.
+        children = dict(attributes.get("_mock_children", {}))
+        attributes["_mock_children"] = children
+        state[id(current)] = attributes
+        pending.extend(
+            child
+            for child in children.values()
+            if isinstance(child, mock.NonCallableMock)
+        )
+    return state
+
+
+def _same_state(old: _MockState, new: _MockState) -> bool:
+    """Return whether two states of the same mocks have identical values."""
+    if old.keys() != new.keys():
+        return False
+    for key, attributes in old.items():
+        other = new[key]
+        if attributes.keys() != other.keys():
+            return False
+        for name, value in attributes.items():
+            if name == "_mock_children":
+                children = other[name]
+                if value.keys() != children.keys() or any(
+                    child is not children[child_name]
+                    for child_name, child in value.items()
+                ):
+                    return False
+            elif value is not other[name]:
+                return False
+    return True
+
+
+class _AutospecCache:
+    """Autospecced mocks not currently in use, for reuse.
+
+    Entries are keyed by the object the mock was made from and the options
+    it was made with, and hold the object itself: an autospecced mock refers
+    to its spec anyway, so weak keys would never expire. Instead at most
+    max_keys keys are kept, least recently used first out, with at most
+    max_idle mocks each.
+
+    The mock object itself is shared: one given back keeps its calls, so it
+    can still be checked, until it is handed out again. Only then is it
+    reset, and it is only reused if it is then as it was when made: one
+    which was configured in ways reset_mock does not undo, such as by
+    setting attributes, is thrown away so the configuration can't leak.
+    """
+
+    def __init__(self, max_keys: int = 256, max_idle: int = 4) -> None:
+        self.max_keys = max_keys
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[
+            tuple[int, Hashable], tuple[Any, list[tuple[Any, Any, _MockState]]]
+        ] = collections.OrderedDict()
+
+    def create(
+        self, original: Any, attribute: str, spec_set: bool, kwargs: dict[str, Any]
+    ) -> tuple[Any, Callable[[], None] | None]:
+        """Return an autospecced mock and a function to give it back, or None.
+
+        The function is None if the mock cannot be reused.
+        """
+        try:
+            key = (id(original), (attribute, spec_set, tuple(sorted(kwargs.items()))))
+            hash(key)
+        except TypeError:
+            key = None
+        while key is not None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or not entry[1]:
+                    break
+                self._entries.move_to_end(key)
+                new, instance, state = entry[1].pop()
+            if self._reset(new, instance, state):
+                return new, lambda: self._give_back(key, original, new, instance, state)
+        new = mock.create_autospec(
+            original, spec_set=spec_set, _name=attribute, **kwargs
+        )
+        # Autospecced functions keep their state outside the mock, where
+        # reset_mock cannot fully reset it; they are cheap to make anyway.
+        if key is None or not isinstance(new, mock.NonCallableMock):
+            return new, None
+        # A class's mock returns a mock instance, also autospecced, which
+        # resetting would replace with a plain mock.
+        instance = new.return_value if callable(new) else None
+        state = _mock_state(new, instance)
+        return new, lambda: self._give_back(key, original, new, instance, state)
+
+    def _reset(self, new: Any, instance: Any, state: _MockState) -> bool:
+        """Reset a mock for reuse, returning whether it is as when made."""
+        new.reset_mock(return_value=True, side_effect=True)
+        if instance is not None:
+            new.return_value = instance
+            instance.reset_mock(return_value=True, side_effect=True)
+        return _same_state(state, _mock_state(new, instance))
+
+    def _give_back(
+        self,
+        key: tuple[int, Hashable],
+        original: Any,
+        new: Any,
+        instance: Any,
+        state: _MockState,
+    ) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = (original, [])
+                while len(self._entries) > self.max_keys:
+                    self._entries.popitem(last=False)
+            if len(entry[1]) < self.max_idle:
+                entry[1].append((new, instance, state))
+
+
+_autospec_cache = _AutospecCache()
+
+
+class _LazyMock:
+    """Stands in for a MagicMock, which is only made when first used.
+
+    Attribute access, calls and the magic methods MagicMock sets up by
+    default are all forwarded to the MagicMock, and isinstance sees its
+    class.
+    """
+
+    __slots__ = ("_fixtures_kwargs", "_fixtures_mock")
+    _fixtures_kwargs: dict[str, Any]
+    _fixtures_mock: mock.MagicMock | None
+
+    def __init__(self, kwargs: dict[str, Any]) -> None:
+        object.__setattr__(self, "_fixtures_kwargs", kwargs)
+        object.__setattr__(self, "_fixtures_mock", None)
+
+    def _fixtures_materialise(self) -> mock.MagicMock:
+        real = self._fixtures_mock
+        if real is None:
+            real = mock.MagicMock(**self._fixtures_kwargs)
+            object.__setattr__(self, "_fixtures_mock", real)
+        return real
+
+    def __getattribute__(self, name: str) -> Any:
+        # Explicit lookups of the forwarded magic methods go to the MagicMock
+        # too, so that they can be configured.
+        if name.startswith("_fixtures_"):
+            return object.__getattribute__(self, name)
+        materialise = object.__getattribute__(self, "_fixtures_materialise")
+        return getattr(materialise(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._fixtures_materialise(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._fixtures_materialise(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._fixtures_materialise()(*args, **kwargs)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._fixtures_materialise())
+
+
+def _forward(name: str) -> Callable[..., Any]:
+    def forward(self: _LazyMock, *args: Any) -> Any:
+        return getattr(self._fixtures_materialise(), name)(*args)
+
+    forward.__name__ = name
+    return forward
+
+
+# The magic methods a MagicMock has by default. The others mock supports
+# are only there once configured, and some (__get__, __set__) would change
+# how the proxy itself behaves if it had them.
+_magics: set[str] = mock._all_magics - mock._non_defaults  # type: ignore[attr-defined]
+for _name in _magics | {"__repr__"}:
+    setattr(_LazyMock, _name, _forward(_name))
+del _magics, _name
+
+# Arguments which make mock.patch create something other than a MagicMock.
+_NOT_LAZY = ("autospec", "new_callable", "spec", "spec_set")
+
+
+def _lazy_kwargs(new: Any, kwargs: dict[str, Any]) -> tuple[bool, dict[str, Any]]:
+    """Split kwargs for a lazy patch into create, and MagicMock arguments."""
+    if new is not mock.DEFAULT:
+        raise TypeError("lazy cannot be used with new.")
+    for name in _NOT_LAZY:
+        if name in kwargs:
+            raise TypeError(f"lazy cannot be used with {name}.")
+    mock_kwargs = dict(kwargs)
+    return bool(mock_kwargs.pop("create", False)), mock_kwargs
 
 
 class _Base(fixtures.Fixture):
     _get_p: Callable[[], Any]  # Returns mock._patch or similar
-    mock: mock.MagicMock
+    _mock: Any
+    # With cache_autospec: returns the object and attribute to patch.
+    _get_target: Callable[[], tuple[Any, str]] | None = None
+    _autospec_kwargs: dict[str, Any]
 
     def _setUp(self) -> None:
+        if self._get_target is not None:
+            self._mock = self._start_cached_autospec(self._get_target())
+            return
         _p = self._get_p()
         self.addCleanup(_p.stop)
-        self.mock = _p.start()
+        self._mock = _p.start()
+
+    @property
+    def mock(self) -> Any:
+        """The mock (or other object) patched in.
+
+        For a lazy patch this is the MagicMock the patched in proxy forwards
+        to, made now if it has not been used yet.
+        """
+        value = self._mock
+        if isinstance(value, _LazyMock):
+            return value._fixtures_materialise()
+        return value
+
+    @mock.setter
+    def mock(self, value: Any) -> None:
+        self._mock = value
+
+    def _start_cached_autospec(self, target: tuple[Any, str]) -> Any:
+        obj, attr = target
+        # As mock.patch finds the original value.
+        try:
+            original = obj.__dict__[attr]
+        except (AttributeError, KeyError):
+            original = getattr(obj, attr)
+        if isinstance(original, mock.NonCallableMock):
+            # Let mock.patch report the error.
+            _p = self._get_p()
+            self.addCleanup(_p.stop)
+            return _p.start()
+        kwargs = dict(self._autospec_kwargs)
+        spec_set = bool(kwargs.pop("spec_set", False))
+        new, give_back = _autospec_cache.create(original, attr, spec_set, kwargs)
+        if give_back is not None:
+            self.addCleanup(give_back)
+        _p = mock.patch.object(obj, attr, new)
+        self.addCleanup(_p.stop)
+        return _p.start()
+
+    def _init_cache_autospec(self, new: Any, kwargs: dict[str, Any]) -> None:
+        if new is not mock.DEFAULT or kwargs.get("autospec") is not True:
+            raise TypeError("cache_autospec requires autospec=True and no new.")
+        if "create" in kwargs or "new_callable" in kwargs:
+            raise TypeError(
+                "cache_autospec cannot be used with create or new_callable."
+            )
+        self._autospec_kwargs = {
+            name: value for name, value in kwargs.items() if name != "autospec"
+        }
 
 
 class MockPatchObject(_Base):
     """Deal with code around mock."""
 
-    def __init__(self, obj: Any, attr: str, new: Any = None, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        obj: Any,
+        attr: str,
+        new: Any = None,
+        cache_autospec: bool = False,
+        lazy: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Create a MockPatchObject.
+
+        :param obj: The object to patch an attribute of.
+        :param attr: The name of the attribute to patch.
+        :param new: The object to replace the attribute with. By default a
+            MagicMock is made.
+        :param cache_autospec: If True (which requires autospec=True), reuse
+            the autospecced mock made for the same attribute value in an
+            earlier use of a mockpatch fixture, when that use is over. The
+            mock object is shared: it keeps its calls after cleanUp, and is
+            reset (calls, return values and side effects) only when handed to
+            the next use, so a reference kept from an earlier use then sees
+            the later use's calls. A mock configured in any other way is not
+            reused.
+        :param lazy: If True, patch in a proxy which only makes the MagicMock
+            when it is first used (or the mock attribute is read), saving the
+            cost of making it in tests which never use it. kwargs are passed
+            to MagicMock, and new, autospec, spec, spec_set and new_callable
+            cannot be used.
+        :param kwargs: Further arguments for mock.patch.object.
+        """
         super().__init__()
         if new is None:
             new = mock.DEFAULT
-        self._get_p: Callable[[], Any] = lambda: mock.patch.object(
-            obj, attr, new, **kwargs
-        )
+        if cache_autospec:
+            self._init_cache_autospec(new, kwargs)
+            self._get_target = lambda: (obj, attr)
+        if lazy:
+            create, mock_kwargs = _lazy_kwargs(new, kwargs)
+            self._get_p: Callable[[], Any] = lambda: mock.patch.object(
+                obj, attr, _LazyMock(mock_kwargs), create=create
+            )
+        else:
+            self._get_p = lambda: mock.patch.object(obj, attr, new, **kwargs)
 
 
 class MockPatch(_Base):
     """Deal with code around mock.patch."""
 
-    def __init__(self, obj: str, new: Any = None, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        obj: str,
+        new: Any = None,
+        cache_autospec: bool = False,
+        lazy: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Create a MockPatch.
+
+        :param obj: The fully qualified name of the object to patch.
+        :param new: The object to replace it with. By default a MagicMock is
+            made.
+        :param cache_autospec: As for MockPatchObject.
+        :param lazy: As for MockPatchObject.
+        :param kwargs: Further arguments for mock.patch.
+        """
         super().__init__()
         if new is None:
             new = mock.DEFAULT
-        self._get_p: Callable[[], Any] = lambda: mock.patch(obj, new, **kwargs)
+        if cache_autospec:
+            self._init_cache_autospec(new, kwargs)
+            location, attribute = obj.rsplit(".", 1)
+            self._get_target = lambda: (_resolve(location), attribute)
+        if lazy:
+            create, mock_kwargs = _lazy_kwargs(new, kwargs)
+            self._get_p: Callable[[], Any] = lambda: mock.patch(
+                obj, _LazyMock(mock_kwargs), create=create
+            )
+        else:
+            self._get_p = lambda: mock.patch(obj, new, **kwargs)
 
 
 class _MockPatchMultipleMeta(type):
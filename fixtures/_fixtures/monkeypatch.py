@@ -15,10 +15,15 @@
 
 __all__ = [
     "MonkeyPatch",
+    "MonkeyPatchSet",
 ]
 
+import contextvars
 import functools
+import sys
+import threading
 import types
+from collections.abc import Mapping
 from typing import Any
 
 from fixtures import Fixture
@@ -65,12 +70,20 @@ def _coerce_values(
     if old_attribute is not None:
         old_value = old_attribute
 
+    return (_wrap_like(old_value, new_value), old_value)
+
+
+def _wrap_like(old_value: Any, new_value: Any) -> Any:
+    """Wrap new_value to replace the class attribute old_value.
+
+    See _coerce_values.
+    """
     # If new_value is not callable, no special handling is needed.
     # (well, technically the same descriptor issue can happen with
     # user supplied descriptors, but that is arguably a feature - someone can
     # deliberately install a different descriptor.
     if not callable(new_value):
-        return (new_value, old_value)
+        return new_value
 
     if isinstance(old_value, staticmethod):
         new_value = staticmethod(new_value)
@@ -90,7 +103,53 @@ def _coerce_values(
 
             new_value = avoid_get
 
-    return (new_value, old_value)
+    return new_value
+
+
+# For each location resolved so far, the longest prefix of it naming a module
+# and that module. While sys.modules still holds the same module (and no
+# module for the next segment of the location) nothing more can be imported,
+# so there is no need to call __import__ again.
+_locations: dict[str, tuple[str, types.ModuleType]] = {}
+
+
+def _resolve(location: str) -> Any:
+    """Return the object named by the dotted location, importing as needed.
+
+    :param location: The fully qualified name of a module, or of an object
+        reachable by attribute lookups from one.
+    """
+    components = location.split(".")
+    cached = _locations.get(location)
+    if cached is not None:
+        name, module = cached
+        rest = location[len(name) + 1 :].split(".", 1)[0]
+        if sys.modules.get(name) is module and (
+            not rest or f"{name}.{rest}" not in sys.modules
+        ):
+            root = sys.modules.get(components[0])
+            if root is not None:
+                return _walk(root, components[1:])
+    # Import, swallowing all errors as any element of location may be
+    # a class or some such thing.
+    try:
+        __import__(location, {}, {})
+    except ImportError:
+        pass
+    current = _walk(__import__(components[0], {}, {}), components[1:])
+    for end in range(len(components), 0, -1):
+        name = ".".join(components[:end])
+        found = sys.modules.get(name)
+        if found is not None:
+            _locations[location] = (name, found)
+            break
+    return current
+
+
+def _walk(obj: Any, attributes: list[str]) -> Any:
+    for attribute in attributes:
+        obj = getattr(obj, attribute)
+    return obj
 
 
 class MonkeyPatch(Fixture):
@@ -98,12 +157,17 @@ class MonkeyPatch(Fixture):
 
     delete = object()
 
-    def __init__(self, name: str, new_value: Any = None) -> None:
+    def __init__(
+        self, name: str, new_value: Any = None, context_local: bool = False
+    ) -> None:
         """Create a MonkeyPatch.
 
         :param name: The fully qualified object name to override.
         :param new_value: A value to set the name to. If set to
             MonkeyPatch.delete the attribute will be deleted.
+        :param context_local: If True, only code running in the same context
+            (thread or asyncio task) as setUp sees the patch, and cleanUp
+            must run in that context too. See below.
 
         During setup the name will be deleted or assigned the requested value,
         and this will be restored in cleanUp.
@@ -127,42 +191,261 @@ class MonkeyPatch(Fixture):
         is placed onto T as a regular function. This allows capturing all the
         supplied parameters while still consulting local state in your
         new_value.
+
+        A context local patch replaces the attribute with a dispatcher, shared
+        by all context local patches of it and removed when the last is
+        cleaned up, which looks the value up in a contextvars.ContextVar. On
+        a class the dispatcher is a descriptor, so patched methods behave as
+        they normally would. Anywhere else it is a proxy which forwards calls,
+        attribute access and common operators, which suits functions and
+        objects used through their methods, but not values compared with
+        ``is`` or checked with isinstance. Threads start with an empty
+        context, so only see the patch if they are run in a copy of this one;
+        asyncio tasks copy the context they are created in.
         """
         Fixture.__init__(self)
         self.name = name
         self.new_value = new_value
+        self.context_local = context_local
 
     def _setUp(self) -> None:
         location, attribute = self.name.rsplit(".", 1)
-        # Import, swallowing all errors as any element of location may be
-        # a class or some such thing.
-        try:
-            __import__(location, {}, {})
-        except ImportError:
-            pass
-
-        components = location.split(".")
-        current = __import__(components[0], {}, {})
-        for component in components[1:]:
-            current = getattr(current, component)
-        sentinel = object()
-        new_value, old_value = _coerce_values(
-            current, attribute, self.new_value, sentinel
-        )
-
-        if self.new_value is self.delete:
-            if old_value is not sentinel:
-                delattr(current, attribute)
-        else:
-            setattr(current, attribute, new_value)
-
-        if old_value is sentinel:
+        current = _resolve(location)
+        if self.context_local:
+            patch = _acquire_context_patch(current, attribute)
+            self.addCleanup(_release_context_patch, patch)
+            token = patch.var.set(patch.wrap(self.new_value))
+            self.addCleanup(patch.var.reset, token)
+            return
+        old_value = _apply_patch(current, attribute, self.new_value)
+        if old_value is _missing:
             self.addCleanup(self._safe_delete, current, attribute)
         else:
             self.addCleanup(setattr, current, attribute, old_value)
 
     def _safe_delete(self, obj: Any, attribute: str) -> Any:
         """Delete obj.attribute handling the case where its missing."""
-        sentinel = object()
-        if getattr(obj, attribute, sentinel) is not sentinel:
+        _safe_delete(obj, attribute)
+
+
+class MonkeyPatchSet(Fixture):
+    """Replace or delete many attributes at once.
+
+    This is equivalent to a MonkeyPatch fixture for each attribute, but
+    resolves every location before patching anything, applies the patches
+    object by object and restores them all in a single cleanup.
+    """
+
+    patches: dict[str, Any]
+
+    def __init__(self, patches: Mapping[str, Any]) -> None:
+        """Create a MonkeyPatchSet.
+
+        :param patches: A mapping from fully qualified object names to the
+            values to set them to, as for MonkeyPatch. A value of
+            MonkeyPatch.delete deletes the attribute.
+        """
+        Fixture.__init__(self)
+        self.patches = dict(patches)
+
+    def _setUp(self) -> None:
+        # Resolve everything first, so a bad name patches nothing.
+        by_target: dict[int, tuple[Any, list[tuple[str, Any]]]] = {}
+        for name, new_value in self.patches.items():
+            location, attribute = name.rsplit(".", 1)
+            target = _resolve(location)
+            by_target.setdefault(id(target), (target, []))[1].append(
+                (attribute, new_value)
+            )
+        applied: list[tuple[Any, str, Any]] = []
+        self.addCleanup(_restore_patches, applied)
+        for target, attributes in by_target.values():
+            for attribute, new_value in attributes:
+                old_value = _apply_patch(target, attribute, new_value)
+                applied.append((target, attribute, old_value))
+
+
+# The ContextVar value for a context where a context local patch is not set.
+_unset = object()
+
+
+class _ContextPatch:
+    """The dispatcher for context local patches of obj.attribute."""
+
+    def __init__(self, obj: Any, attribute: str) -> None:
+        self.obj = obj
+        self.attribute = attribute
+        self.users = 0
+        self.var: contextvars.ContextVar[Any] = contextvars.ContextVar(
+            f"fixtures.MonkeyPatch.{attribute}", default=_unset
+        )
+        self.is_class = isinstance(obj, _class_types)
+        if self.is_class:
+            self.original = obj.__dict__.get(attribute, _missing)
+            self._wrap_base = (
+                getattr(obj, attribute, _missing)
+                if self.original is _missing
+                else self.original
+            )
+        else:
+            # What to restore, and what to use while unpatched.
+            self.original = _coerce_values(obj, attribute, None, _missing)[1]
+            self.default = getattr(obj, attribute, _missing)
+
+    def wrap(self, new_value: Any) -> Any:
+        if new_value is MonkeyPatch.delete or not self.is_class:
+            return new_value
+        return _wrap_like(self._wrap_base, new_value)
+
+    def install(self) -> None:
+        if self.is_class:
+            dispatcher: Any = _ContextDescriptor(self)
+        else:
+            dispatcher = _ContextProxy(self)
+        setattr(self.obj, self.attribute, dispatcher)
+
+    def uninstall(self) -> None:
+        if self.original is _missing:
+            _safe_delete(self.obj, self.attribute)
+        else:
+            setattr(self.obj, self.attribute, self.original)
+
+    def raw_value(self) -> Any:
+        """Return the value for this context, as stored on obj."""
+        value = self.var.get()
+        if value is _unset:
+            if not self.is_class:
+                value = self.default
+            elif self.original is not _missing:
+                value = self.original
+            else:
+                # Inherited: look in the rest of the method resolution order.
+                for base in self.obj.__mro__[1:]:
+                    if self.attribute in base.__dict__:
+                        return base.__dict__[self.attribute]
+                value = _missing
+        if value is _missing or value is MonkeyPatch.delete:
+            raise AttributeError(self.attribute)
+        return value
+
+
+class _ContextDescriptor:
+    """Installed on a class by a context local patch."""
+
+    def __init__(self, patch: _ContextPatch) -> None:
+        self._patch = patch
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        value = self._patch.raw_value()
+        get = getattr(type(value), "__get__", None)
+        if get is None:
+            return value
+        return get(value, instance, owner)
+
+
+class _ContextProxy:
+    """Installed on a module or instance by a context local patch."""
+
+    __slots__ = ("_fixtures_patch",)
+
+    def __init__(self, patch: _ContextPatch) -> None:
+        object.__setattr__(self, "_fixtures_patch", patch)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._fixtures_patch.raw_value()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fixtures_patch.raw_value(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._fixtures_patch.raw_value(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._fixtures_patch.raw_value(), name)
+
+    def __repr__(self) -> str:
+        return repr(self._fixtures_patch.raw_value())
+
+    def __str__(self) -> str:
+        return str(self._fixtures_patch.raw_value())
+
+    def __bool__(self) -> bool:
+        return bool(self._fixtures_patch.raw_value())
+
+    def __eq__(self, other: object) -> bool:
+        return bool(self._fixtures_patch.raw_value() == other)
+
+    def __hash__(self) -> int:
+        return hash(self._fixtures_patch.raw_value())
+
+    def __len__(self) -> int:
+        return len(self._fixtures_patch.raw_value())
+
+    def __iter__(self) -> Any:
+        return iter(self._fixtures_patch.raw_value())
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._fixtures_patch.raw_value()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._fixtures_patch.raw_value()[key]
+
+
+_context_patches: dict[tuple[int, str], _ContextPatch] = {}
+_context_patches_lock = threading.Lock()
+
+
+def _acquire_context_patch(obj: Any, attribute: str) -> _ContextPatch:
+    """Return the dispatcher for obj.attribute, installing it if needed."""
+    key = (id(obj), attribute)
+    with _context_patches_lock:
+        patch = _context_patches.get(key)
+        if patch is None:
+            patch = _ContextPatch(obj, attribute)
+            patch.install()
+            _context_patches[key] = patch
+        patch.users += 1
+    return patch
+
+
+def _release_context_patch(patch: _ContextPatch) -> None:
+    """Stop using patch, uninstalling it if it is no longer used."""
+    with _context_patches_lock:
+        patch.users -= 1
+        if not patch.users:
+            del _context_patches[(id(patch.obj), patch.attribute)]
+            patch.uninstall()
+
+
+# Returned by _apply_patch when there was no attribute to replace.
+_missing = object()
+
+
+def _apply_patch(obj: Any, attribute: str, new_value: Any) -> Any:
+    """Set (or with MonkeyPatch.delete, delete) obj.attribute.
+
+    :return: The value to restore, or _missing if there was none.
+    """
+    coerced_value, old_value = _coerce_values(obj, attribute, new_value, _missing)
+    if new_value is MonkeyPatch.delete:
+        if old_value is not _missing:
             delattr(obj, attribute)
+    else:
+        setattr(obj, attribute, coerced_value)
+    return old_value
+
+
+def _restore_patches(applied: list[tuple[Any, str, Any]]) -> None:
+    """Undo patches made by _apply_patch, most recent first."""
+    for obj, attribute, old_value in reversed(applied):
+        if old_value is _missing:
+            _safe_delete(obj, attribute)
+        else:
+            setattr(obj, attribute, old_value)
+
+
+def _safe_delete(obj: Any, attribute: str) -> None:
+    """Delete obj.attribute handling the case where its missing."""
+    sentinel = object()
+    if getattr(obj, attribute, sentinel) is not sentinel:
+        delattr(obj, attribute)
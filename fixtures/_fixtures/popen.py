@@ -18,13 +18,25 @@ from __future__ import annotations
 __all__ = [
     "FakePopen",
     "PopenFixture",
+    "PopenRecorder",
 ]
 
+import base64
+import errno
+import fnmatch
+import inspect
+import io
+import json
+import locale
+import os
 import random
+import re
+import shlex
+import signal
 import subprocess
 import sys
 from typing import Any, IO, Final, TYPE_CHECKING
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 from fixtures import Fixture
 
@@ -44,8 +56,256 @@ class _Unpassed:
 _unpassed: Final = _Unpassed()
 
 
+class _Script:
+    """Runs the script of a scripted FakeProcess on a virtual clock.
+
+    The script is a generator (or async generator) yielding instructions:
+
+    * ("stdout", data) or ("stderr", data) writes bytes (or str, which is
+      encoded) to the stream.
+    * ("stdin",) or ("stdin", size) reads up to size bytes (or whatever is
+      available) of input. The data is sent back into the script, and b""
+      at end of file.
+    * ("sleep", seconds) advances the virtual clock.
+    * ("exit", returncode) ends the script. Returning from the script ends it
+      too, with the returned value (or 0) as the returncode.
+
+    The script runs as far as it can whenever the process is used, and the
+    clock only moves on when the caller has to wait for the script, or polls
+    it, so nothing ever really sleeps. If the caller and the script are
+    waiting for each other, RuntimeError is raised rather than hanging.
+    """
+
+    def __init__(
+        self,
+        script: Any,
+        args: Any,
+        pipes: dict[str, bytearray | None],
+        capacity: int | None,
+        encoding: str,
+        errors: str,
+    ) -> None:
+        self._script = script
+        self._async = hasattr(script, "asend")
+        self._args = args
+        self.pipes = pipes
+        self.capacity = capacity
+        self._encoding = encoding
+        self._errors = errors
+        self.stdin = bytearray()
+        self.stdin_closed = False
+        # Set while the caller is reading everything, as communicate() does.
+        self.draining = False
+        self.now = 0.0
+        self.returncode: int | None = None
+        self._instruction: tuple[Any, ...] | None = None
+        self._reply: Any = None
+        self._wake: float | None = None
+
+    def run(self) -> None:
+        """Run the script until it has to wait, or exits."""
+        while self.returncode is None:
+            instruction = self._instruction
+            if instruction is None:
+                self._resume()
+                continue
+            kind = instruction[0]
+            if kind in ("stdout", "stderr"):
+                if not self._write(kind, instruction[1]):
+                    return
+            elif kind == "stdin":
+                if not self.stdin and not self.stdin_closed:
+                    return
+                size = instruction[1] if len(instruction) > 1 else None
+                if size is None or size < 0:
+                    size = len(self.stdin)
+                self._reply = bytes(self.stdin[:size])
+                del self.stdin[:size]
+            elif kind == "sleep":
+                if self._wake is None:
+                    self._wake = self.now + instruction[1]
+                if self.now < self._wake:
+                    return
+                self._wake = None
+            elif kind == "exit":
+                self._finish(instruction[1])
+                return
+            else:
+                raise ValueError(f"Unknown script instruction: {instruction!r}")
+            self._instruction = None
+
+    def _resume(self) -> None:
+        reply, self._reply = self._reply, None
+        try:
+            self._instruction = self._send(reply)
+        except StopIteration as e:
+            self._finish(0 if e.value is None else e.value)
+        except StopAsyncIteration:
+            self._finish(0)
+
+    def _send(self, value: Any) -> Any:
+        if not self._async:
+            return self._script.send(value)
+        awaitable = self._script.asend(value)
+        try:
+            awaitable.send(None)
+        except StopIteration as e:
+            return e.value
+        awaitable.close()
+        raise TypeError(
+            "Scripts cannot await anything that really suspends; yield "
+            "('sleep', seconds) instead."
+        )
+
+    def _write(self, kind: str, data: bytes | str) -> bool:
+        if isinstance(data, str):
+            data = data.encode(self._encoding, self._errors)
+        pipe = self.pipes[kind]
+        if pipe is None:
+            return True
+        if self.capacity is None or self.draining:
+            pipe.extend(data)
+            return True
+        room = self.capacity - len(pipe)
+        if room <= 0:
+            self._instruction = (kind, data)
+            return False
+        pipe.extend(data[:room])
+        if len(data) > room:
+            self._instruction = (kind, data[room:])
+            return False
+        return True
+
+    def _finish(self, returncode: int) -> None:
+        self.returncode = returncode
+        self._instruction = None
+        self._wake = None
+
+    def poll(self) -> None:
+        """Run the script, moving the clock on to when it next wakes if needed.
+
+        Callers poll a process between doing other things, so each poll lets
+        the time the script is sleeping for pass.
+        """
+        self.run()
+        if self.returncode is None and self._wake is not None:
+            self.now = self._wake
+            self.run()
+
+    def kill(self, returncode: int) -> None:
+        """End the script as if the process was killed by a signal."""
+        if self.returncode is not None:
+            return
+        if self._async:
+            closing = self._script.aclose()
+            try:
+                closing.send(None)
+            except StopIteration:
+                pass
+            else:
+                closing.close()
+        else:
+            self._script.close()
+        self._finish(returncode)
+
+    def block_until(self, done: Callable[[], bool], timeout: float | None) -> None:
+        """Run the script until done() is true or it exits.
+
+        The virtual clock is moved on as needed, but not past the timeout.
+
+        :raises subprocess.TimeoutExpired: If the timeout passes first.
+        :raises RuntimeError: If the script can never get there.
+        """
+        start = self.now
+        while True:
+            self.run()
+            if done() or self.returncode is not None:
+                return
+            wake = self._wake
+            if wake is not None and (timeout is None or wake <= start + timeout):
+                self.now = wake
+                continue
+            if timeout is not None:
+                self.now = max(self.now, start + timeout)
+                raise subprocess.TimeoutExpired(self._args, timeout)
+            kind = self._instruction[0] if self._instruction else "stdin"
+            if kind == "stdin":
+                waiting = "input on stdin"
+            else:
+                waiting = f"room in the {kind} pipe"
+            raise RuntimeError(
+                f"Deadlock: the script of {self._args!r} is waiting for "
+                f"{waiting}, which will never come."
+            )
+
+
+class _ScriptReader(io.RawIOBase):
+    """The read end of a stdout or stderr pipe of a scripted FakeProcess."""
+
+    def __init__(self, script: _Script, name: str) -> None:
+        super().__init__()
+        self._script = script
+        self._name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        script = self._script
+        pipe = script.pipes[self._name]
+        if pipe is None:
+            raise ValueError("I/O operation on closed file.")
+        script.block_until(lambda: bool(pipe), None)
+        size = min(len(buffer), len(pipe))
+        buffer[:size] = pipe[:size]
+        del pipe[:size]
+        return size
+
+    def close(self) -> None:
+        # Like a closed pipe, anything written after this is lost.
+        pipes = self._script.pipes
+        pipe = pipes[self._name]
+        for name, other in pipes.items():
+            if other is pipe:
+                pipes[name] = None
+        super().close()
+
+
+class _ScriptWriter(io.RawIOBase):
+    """The write end of the stdin pipe of a scripted FakeProcess."""
+
+    def __init__(self, script: _Script) -> None:
+        super().__init__()
+        self._script = script
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        script = self._script
+        capacity = script.capacity
+        if capacity is not None and not script.draining:
+            script.block_until(lambda: len(script.stdin) < capacity, None)
+            data = bytes(data)[: capacity - len(script.stdin)]
+        if script.returncode is not None:
+            raise BrokenPipeError(errno.EPIPE, "The process has exited")
+        script.stdin.extend(data)
+        return len(data)
+
+    def close(self) -> None:
+        self._script.stdin_closed = True
+        super().close()
+
+
 class FakeProcess:
-    """A test double process, roughly meeting subprocess.Popen's contract."""
+    """A test double process, roughly meeting subprocess.Popen's contract.
+
+    If the info dict has a "script", the process runs it as described by
+    _Script, and stdin, stdout and stderr are pipes to and from it when
+    subprocess.PIPE was asked for, as with Popen. The "pipe_size" info sets
+    how many bytes a pipe holds before writing to it blocks (unlimited by
+    default).
+    """
 
     def __init__(self, args: dict[str, Any], info: dict[str, Any]) -> None:
         self._args = args
@@ -55,6 +315,55 @@ class FakeProcess:
         self.pid: int = random.randint(0, 65536)  # noqa: S311
         self._returncode: int = info.get("returncode", 0)
         self.returncode: int | None = None
+        self._script: _Script | None = None
+        if "script" in info:
+            self._start_script(info["script"], info.get("pipe_size"))
+
+    def _start_script(self, script: Any, pipe_size: int | None) -> None:
+        args = self._args
+        text = bool(
+            args.get("text")
+            or args.get("universal_newlines")
+            or args.get("encoding")
+            or args.get("errors")
+        )
+        encoding = args.get("encoding") or locale.getpreferredencoding(False)
+        errors = args.get("errors") or "strict"
+        bufsize = args.get("bufsize", -1)
+        stdout = bytearray() if args.get("stdout") == subprocess.PIPE else None
+        if args.get("stderr") == subprocess.STDOUT:
+            stderr = stdout
+        elif args.get("stderr") == subprocess.PIPE:
+            stderr = bytearray()
+        else:
+            stderr = None
+        pipes = {"stdout": stdout, "stderr": stderr}
+        self._script = _Script(script, args["args"], pipes, pipe_size, encoding, errors)
+        self.stdin = self.stdout = self.stderr = None
+        if args.get("stdin") == subprocess.PIPE:
+            writer: Any = _ScriptWriter(self._script)
+            if bufsize != 0:
+                writer = io.BufferedWriter(writer)
+            if text:
+                writer = io.TextIOWrapper(
+                    writer,
+                    encoding=encoding,
+                    errors=errors,
+                    write_through=True,
+                    line_buffering=bufsize == 1,
+                )
+            self.stdin = writer
+        else:
+            self._script.stdin_closed = True
+        for name in ("stdout", "stderr"):
+            if args.get(name) != subprocess.PIPE:
+                continue
+            reader: Any = _ScriptReader(self._script, name)
+            if bufsize != 0:
+                reader = io.BufferedReader(reader)
+            if text:
+                reader = io.TextIOWrapper(reader, encoding=encoding, errors=errors)
+            setattr(self, name, reader)
 
     @property
     def args(self) -> Any:
@@ -66,12 +375,23 @@ class FakeProcess:
         The returncode is None before communicate() and/or wait() are called,
         and it's set to the value provided by the 'info' dictionary otherwise
         (or 0 in case 'info' doesn't specify a value).
+
+        A scripted process is run as far as it can go, and the returncode is
+        None until the script ends. If the script is sleeping, its virtual
+        clock is first moved on to when it wakes, as if the caller had waited
+        that long since it last polled, so a poll loop always gets through
+        the script.
         """
+        if self._script is not None:
+            self._script.poll()
+            self.returncode = self._script.returncode
         return self.returncode
 
     def communicate(
         self, input: bytes | str | None = None, timeout: float | None = None
     ) -> tuple[Any, Any]:
+        if self._script is not None:
+            return self._communicate_script(self._script, input, timeout)
         self.returncode = self._returncode
         if self.stdin and input:
             self.stdin.write(input)
@@ -85,34 +405,96 @@ class FakeProcess:
             err = ""
         return out, err
 
+    def _communicate_script(
+        self, script: _Script, input: bytes | str | None, timeout: float | None
+    ) -> tuple[Any, Any]:
+        # Like Popen, all output is read as it comes and all input is written
+        # as there is room, so full pipes don't block the script.
+        script.draining = True
+        if self.stdin is not None and not self.stdin.closed:
+            try:
+                if input:
+                    self.stdin.write(input)
+                self.stdin.close()
+            except BrokenPipeError:
+                pass
+        script.block_until(lambda: False, timeout)
+        streams: list[Any] = []
+        for stream in (self.stdout, self.stderr):
+            if stream is None or stream.closed:
+                streams.append(None)
+            else:
+                streams.append(stream.read())
+                stream.close()
+        self.returncode = script.returncode
+        return streams[0], streams[1]
+
     def __enter__(self) -> Self:
         return self
 
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if self._script is not None:
+            for stream in (self.stdout, self.stderr, self.stdin):
+                if stream is not None:
+                    try:
+                        stream.close()
+                    except BrokenPipeError:
+                        pass
         self.wait()
 
     def kill(self) -> None:
-        pass
+        if self._script is not None:
+            self._script.kill(-signal.SIGKILL)
+
+    def terminate(self) -> None:
+        if self._script is not None:
+            self._script.kill(-signal.SIGTERM)
 
     def wait(
         self, timeout: float | None = None, endtime: float | None = None
     ) -> int | None:
-        if self.returncode is None:
+        if self._script is not None:
+            self._script.block_until(lambda: False, timeout)
+            self.returncode = self._script.returncode
+        elif self.returncode is None:
             self.communicate()
         return self.returncode
 
 
+_Response = dict[str, Any] | Callable[[dict[str, Any]], dict[str, Any]]
+
+
+def _argv(args: Any) -> tuple[str, ...]:
+    """Normalise the args of a Popen call to a tuple of strings.
+
+    A single string (or bytes) is split as a shell would.
+    """
+    if isinstance(args, (str, bytes)):
+        return tuple(shlex.split(os.fsdecode(args)))
+    if isinstance(args, os.PathLike):
+        return (os.fsdecode(args),)
+    return tuple(os.fsdecode(arg) for arg in args)
+
+
 class FakePopen(Fixture):
     """Replace subprocess.Popen.
 
     Primarily useful for testing, this fixture replaces subprocess.Popen with a
     test double.
 
+    How each process behaves can be registered by command, with register(),
+    register_prefix(), register_glob() and register_regex(). A call is looked
+    up in that order: an exact match, then the longest matching prefix, then
+    the glob and regex patterns in the order they were registered. A call
+    which matches nothing is passed to get_info.
+
     :ivar procs: A list of the processes created by the fixture.
     """
 
     def __init__(
-        self, get_info: Callable[[dict[str, Any]], dict[str, Any]] = lambda _: {}
+        self,
+        get_info: Callable[[dict[str, Any]], dict[str, Any]] = lambda _: {},
+        strict: bool = False,
     ) -> None:
         """Create a PopenFixture
 
@@ -135,9 +517,125 @@ class FakePopen(Fixture):
             the returncode is set to whatever get_info returns (or 0 if
             get_info is not supplied or doesn't return a dict with an explicit
             'returncode' key).
+
+            If the dict has a 'script' key, the process instead runs that
+            generator (or async generator) on a virtual clock, streaming its
+            output through real-looking pipes. e.g.
+
+            def script():
+                yield ('stdout', b'starting\n')
+                yield ('sleep', 60)
+                data = yield ('stdin',)
+                return 1 if data else 0
+
+            See FakeProcess for the details.
+        :param strict: If True, calls which match no registered command raise
+            LookupError instead of being passed to get_info.
         """
         super().__init__()
         self.get_info = get_info
+        self.strict = strict
+        self._exact: dict[tuple[str, ...], _Response] = {}
+        # A trie of argv tokens; each node's responses are under None.
+        self._prefixes: dict[str | None, Any] = {}
+        self._patterns: list[tuple[re.Pattern[str], _Response]] = []
+
+    def register(self, args: Any, response: _Response) -> None:
+        """Register the behaviour of one command.
+
+        :param args: The exact args of the command, as a sequence or a string
+            (which is split as a shell would).
+        :param response: The info dict for the process (as get_info returns),
+            or a callable taking the Popen kwargs dict and returning one. Use a
+            callable if the dict should be made afresh for each call, e.g. to
+            give each process a new script.
+        """
+        self._exact[_argv(args)] = response
+
+    def register_prefix(self, prefix: Any, response: _Response) -> None:
+        """Register the behaviour of commands starting with some args.
+
+        :param prefix: The first args of the commands, as for register().
+        :param response: As for register().
+        """
+        node = self._prefixes
+        for token in _argv(prefix):
+            node = node.setdefault(token, {})
+        node[None] = response
+
+    def register_glob(self, pattern: str, response: _Response) -> None:
+        """Register the behaviour of commands matching a glob pattern.
+
+        :param pattern: An fnmatch pattern, matched against the whole command
+            line (the args joined by spaces).
+        :param response: As for register().
+        """
+        self._patterns.append((re.compile(fnmatch.translate(pattern)), response))
+
+    def register_regex(
+        self, pattern: str | re.Pattern[str], response: _Response
+    ) -> None:
+        """Register the behaviour of commands matching a regular expression.
+
+        :param pattern: A regular expression which must match the whole
+            command line (the args joined by spaces).
+        :param response: As for register().
+        """
+        self._patterns.append((re.compile(pattern), response))
+
+    @classmethod
+    def from_cassette(
+        cls, path: str | os.PathLike[str], strict: bool = True, match_cwd: bool = True
+    ) -> FakePopen:
+        """Create a FakePopen replaying the processes recorded by PopenRecorder.
+
+        Calls are matched to recordings by their (normalised) args and cwd.
+        Each matching call gets the next recording of that command, and the
+        last one again once they run out. Replayed processes are scripted, so
+        their output is streamed to whichever pipes the call asks for.
+        Commands registered on the FakePopen take priority over the cassette.
+
+        :param path: The cassette file.
+        :param strict: If True, a call matching no recording raises
+            LookupError. Otherwise it gets an empty process.
+        :param match_cwd: If False, the cwd is ignored when matching calls.
+        """
+        return cls(_Cassette(path, strict, match_cwd))
+
+    def _lookup(self, args: Any) -> _Response | None:
+        """Return the registered response for args, or None."""
+        if not (self._exact or self._prefixes or self._patterns):
+            return None
+        try:
+            argv = _argv(args)
+        except ValueError:
+            # Not splittable, e.g. an unterminated quote: nothing can match.
+            return None
+        response = self._exact.get(argv)
+        if response is None:
+            node = self._prefixes
+            for token in argv:
+                node = node.get(token)  # type: ignore[assignment]
+                if node is None:
+                    break
+                response = node.get(None, response)
+        if response is None and self._patterns:
+            command = " ".join(argv)
+            for pattern, candidate in self._patterns:
+                if pattern.fullmatch(command):
+                    response = candidate
+                    break
+        return response
+
+    def _get_info(self, proc_args: dict[str, Any]) -> dict[str, Any]:
+        response = self._lookup(proc_args["args"])
+        if response is None:
+            if self.strict:
+                raise LookupError(f"No fake registered for {proc_args['args']!r}")
+            return self.get_info(proc_args)
+        if callable(response):
+            return response(proc_args)
+        return dict(response)
 
     def _setUp(self) -> None:
         self.addCleanup(setattr, subprocess, "Popen", subprocess.Popen)
@@ -213,10 +711,253 @@ class FakePopen(Fixture):
         ]:
             if not isinstance(local[param], _Unpassed):
                 proc_args[param] = local[param]
-        proc_info = self.get_info(proc_args)
+        proc_info = self._get_info(proc_args)
         result = FakeProcess(proc_args, proc_info)
         self.procs.append(result)
         return result
 
 
 PopenFixture = FakePopen
+
+
+def _dump_data(data: bytes) -> str | dict[str, str]:
+    """Return stream data as it is stored in a cassette."""
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(data).decode("ascii")}
+
+
+def _load_data(value: str | dict[str, str]) -> bytes:
+    """Return stream data stored in a cassette by _dump_data."""
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    return base64.b64decode(value["base64"])
+
+
+def _replay(entry: dict[str, Any]) -> Any:
+    """A FakeProcess script replaying a recorded process."""
+    for name in ("stdout", "stderr"):
+        data = _load_data(entry[name])
+        if data:
+            yield (name, data)
+    if entry["stdin"] is not None:
+        while (yield ("stdin",)):
+            pass
+    return entry["returncode"]
+
+
+_CassetteKey = tuple[tuple[str, ...], str | None]
+
+
+class _Cassette:
+    """A get_info for FakePopen serving the processes in a cassette."""
+
+    def __init__(
+        self, path: str | os.PathLike[str], strict: bool, match_cwd: bool
+    ) -> None:
+        self._strict = strict
+        self._match_cwd = match_cwd
+        self._index: dict[_CassetteKey, list[dict[str, Any]]] = {}
+        self._served: dict[_CassetteKey, int] = {}
+        with open(path, encoding="utf-8") as cassette:
+            for line in cassette:
+                if line.strip():
+                    entry = json.loads(line)
+                    key = self._key(entry["args"], entry["cwd"])
+                    self._index.setdefault(key, []).append(entry)
+
+    def _key(self, args: Any, cwd: Any) -> _CassetteKey:
+        if cwd is not None and self._match_cwd:
+            return _argv(args), os.fsdecode(cwd)
+        return _argv(args), None
+
+    def __call__(self, proc_args: dict[str, Any]) -> dict[str, Any]:
+        try:
+            key = self._key(proc_args["args"], proc_args.get("cwd"))
+        except ValueError:
+            # Not splittable, so it can't have been recorded.
+            entries = None
+        else:
+            entries = self._index.get(key)
+        if not entries:
+            if self._strict:
+                raise LookupError(
+                    f"No recording of {proc_args['args']!r} in {proc_args.get('cwd')!r}"
+                )
+            return {}
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        return {"script": _replay(entries[min(served, len(entries) - 1)])}
+
+
+class _Tee:
+    """Wraps a stream of a real process, keeping a copy of what passes."""
+
+    def __init__(self, stream: Any, copy: bytearray) -> None:
+        self._stream = stream
+        self._copy = copy
+
+    def _keep(self, data: Any) -> Any:
+        if isinstance(data, str):
+            self._copy.extend(data.encode(self._stream.encoding, self._stream.errors))
+        elif data:
+            self._copy.extend(data)
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+    def __iter__(self) -> _Tee:
+        return self
+
+    def __next__(self) -> Any:
+        return self._keep(next(self._stream))
+
+    def __enter__(self) -> _Tee:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self._stream.close()
+
+    def read(self, *args: Any) -> Any:
+        return self._keep(self._stream.read(*args))
+
+    def read1(self, *args: Any) -> Any:
+        return self._keep(self._stream.read1(*args))
+
+    def readline(self, *args: Any) -> Any:
+        return self._keep(self._stream.readline(*args))
+
+    def readlines(self, *args: Any) -> list[Any]:
+        return [self._keep(line) for line in self._stream.readlines(*args)]
+
+    def write(self, data: Any) -> Any:
+        written = self._stream.write(data)
+        self._keep(data[:written] if written is not None else data)
+        return written
+
+    def writelines(self, lines: Any) -> None:
+        for line in lines:
+            self.write(line)
+
+
+class _RecordingProcess:
+    """Wraps a real process, recording it for a PopenRecorder."""
+
+    def __init__(self, process: Any, entry: dict[str, Any]) -> None:
+        self._process = process
+        self._entry = entry
+        self._copies = {
+            "stdin": bytearray(),
+            "stdout": bytearray(),
+            "stderr": bytearray(),
+        }
+        self._stdin_used = False
+        self._communicated = False
+        for name in ("stdin", "stdout", "stderr"):
+            stream = getattr(process, name)
+            if stream is not None:
+                stream = _Tee(stream, self._copies[name])
+            setattr(self, name, stream)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._process, name)
+
+    def __enter__(self) -> _RecordingProcess:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self._process.__exit__(exc_type, exc_value, traceback)
+
+    def communicate(
+        self, input: bytes | str | None = None, timeout: float | None = None
+    ) -> tuple[Any, Any]:
+        process = self._process
+        if input and process.stdin is not None and not self._communicated:
+            _Tee(process.stdin, self._copies["stdin"])._keep(input)
+        self._communicated = True
+        out, err = process.communicate(input, timeout)
+        _Tee(process.stdout, self._copies["stdout"])._keep(out)
+        _Tee(process.stderr, self._copies["stderr"])._keep(err)
+        return out, err
+
+    def record(self) -> dict[str, Any] | None:
+        """Return the cassette entry for the process, if it has exited."""
+        returncode = self._process.poll()
+        if returncode is None:
+            return None
+        entry = dict(self._entry)
+        copies = self._copies
+        entry["stdin"] = (
+            None if self._process.stdin is None else _dump_data(bytes(copies["stdin"]))
+        )
+        entry["stdout"] = _dump_data(bytes(copies["stdout"]))
+        entry["stderr"] = _dump_data(bytes(copies["stderr"]))
+        entry["returncode"] = returncode
+        return entry
+
+
+class PopenRecorder(Fixture):
+    """Record the processes started with subprocess.Popen to a cassette.
+
+    subprocess.Popen is wrapped so that processes really run, and when the
+    fixture is cleaned up, each one that has exited is written to the cassette,
+    one JSON object per line. FakePopen.from_cassette replays them.
+
+    The args (normalised as FakePopen does), cwd, returncode and everything
+    written to stdin and read from stdout and stderr through pipes are
+    recorded. Output that is not read by the caller is not recorded. Stream
+    data is stored as text when it is UTF-8, and in base64 otherwise.
+    Processes whose args can't be split as a shell would (so could never be
+    matched on replay) are run but not recorded.
+
+    :ivar procs: A list of the recorded processes created by the fixture.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], env: Sequence[str] = ()) -> None:
+        """Create a PopenRecorder.
+
+        :param path: The cassette file to write. It is replaced.
+        :param env: The names of environment variables to record the values of
+            for each process, e.g. ["LANG"]. Only for reference: they are not
+            used when replaying.
+        """
+        super().__init__()
+        self.path = path
+        self.env = env
+
+    def _setUp(self) -> None:
+        self._popen = subprocess.Popen
+        self.addCleanup(setattr, subprocess, "Popen", self._popen)
+        subprocess.Popen = self  # type: ignore[assignment,misc]
+        self.procs: list[_RecordingProcess] = []
+        self.addCleanup(self._write)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        real = self._popen(*args, **kwargs)
+        arguments = inspect.signature(self._popen).bind(*args, **kwargs).arguments
+        try:
+            argv = _argv(arguments["args"])
+        except ValueError:
+            # Args which can't be split (as by a shell) can't be replayed.
+            return real
+        environ = arguments.get("env")
+        if environ is None:
+            environ = os.environ
+        cwd = arguments.get("cwd")
+        entry = {
+            "args": list(argv),
+            "cwd": None if cwd is None else os.fsdecode(cwd),
+            "env": {name: environ[name] for name in self.env if name in environ},
+        }
+        process = _RecordingProcess(real, entry)
+        self.procs.append(process)
+        return process
+
+    def _write(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as cassette:
+            for process in self.procs:
+                entry = process.record()
+                if entry is not None:
+                    cassette.write(json.dumps(entry, separators=(",", ":")) + "\n")
@@ -16,35 +16,625 @@
 __all__ = [
     "NestedTempfile",
     "TempDir",
+    "TempDirPool",
+    "TempDirReaper",
 ]
 
+import atexit
+import collections
+from collections.abc import Callable
+import functools
 import os
 import shutil
+import stat
+import sys
 import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows.
+    fcntl = None  # type: ignore[assignment]
 
 import fixtures
+from fixtures.timing import timed
+
+# The reflink ioctl from linux/fs.h.
+_FICLONE = 0x40049409
+
+
+def _disk_usage(path: str) -> int:
+    """Return the total size in bytes of the files under path."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """Copy a file, sharing its data with a reflink if the filesystem can."""
+    if fcntl is not None and sys.platform.startswith("linux"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                cloned = True
+            except OSError:
+                cloned = False
+        if cloned:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
+
+def _clone_entry(source: str, dest: str, hardlink: bool) -> None:
+    """Copy a single file, symlink or (empty) directory."""
+    if os.path.islink(source):
+        os.symlink(os.readlink(source), dest)
+    elif os.path.isdir(source):
+        os.mkdir(dest)
+    elif hardlink:
+        try:
+            os.link(source, dest)
+        except OSError:
+            _copy_file(source, dest)
+    else:
+        _copy_file(source, dest)
+
+
+def _clone_tree(src: str, dst: str, hardlink: bool = False) -> None:
+    """Copy the contents of the directory src into the existing directory dst.
+
+    :param hardlink: If True, hard link files rather than copying them, where
+        possible.
+    """
+    for dirpath, dirnames, filenames in os.walk(src):
+        target = os.path.join(dst, os.path.relpath(dirpath, src))
+        for name in dirnames + filenames:
+            _clone_entry(
+                os.path.join(dirpath, name), os.path.join(target, name), hardlink
+            )
+
+
+# The mode (type and permissions), size, modification time and inode of a
+# directory entry. Sizes and times of directories are not recorded, as they
+# change with their contents.
+_EntryState = tuple[int, int, int, int]
+
+
+def _entry_state(path: str) -> _EntryState:
+    st = os.lstat(path)
+    if stat.S_ISDIR(st.st_mode):
+        return (st.st_mode, 0, 0, st.st_ino)
+    return (st.st_mode, st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def _snapshot(path: str) -> dict[str, _EntryState]:
+    """Return the state of every entry under path, by relative path."""
+    state = {}
+    for dirpath, dirnames, filenames in os.walk(path):
+        for name in dirnames + filenames:
+            entry = os.path.join(dirpath, name)
+            state[os.path.relpath(entry, path)] = _entry_state(entry)
+    return state
+
+
+def _remove_changed(path: str, snapshot: dict[str, _EntryState]) -> list[str]:
+    """Remove the entries under path which differ from snapshot.
+
+    :return: The relative paths in snapshot which are now missing.
+    """
+    for dirpath, dirnames, filenames in os.walk(path):
+        for names in (dirnames, filenames):
+            for name in list(names):
+                entry = os.path.join(dirpath, name)
+                try:
+                    state = _entry_state(entry)
+                except FileNotFoundError:
+                    continue
+                if snapshot.get(os.path.relpath(entry, path)) == state:
+                    continue
+                if stat.S_ISDIR(state[0]):
+                    # Its permissions may be what changed.
+                    os.chmod(entry, stat.S_IRWXU)
+                    shutil.rmtree(entry)
+                    # Don't walk into it.
+                    names.remove(name)
+                else:
+                    os.unlink(entry)
+    # Sorting puts parent directories before their contents.
+    return [
+        relpath
+        for relpath in sorted(snapshot)
+        if not os.path.lexists(os.path.join(path, relpath))
+    ]
+
+
+_templates: dict[tuple[Callable[[str], object], str], str] = {}
+_templates_lock = threading.Lock()
+
+
+def _build_template(template: Callable[[str], object], parent: str) -> str:
+    """Return a directory under parent filled by template, building it once."""
+    key = (template, parent)
+    with _templates_lock:
+        path = _templates.get(key)
+        if path is None:
+            path = tempfile.mkdtemp(prefix="fixtures-template-", dir=parent)
+            try:
+                template(path)
+            except BaseException:
+                shutil.rmtree(path, ignore_errors=True)
+                raise
+            if not _templates:
+                atexit.register(_remove_templates)
+            _templates[key] = path
+    return path
+
+
+def _remove_templates() -> None:
+    with _templates_lock:
+        for path in _templates.values():
+            shutil.rmtree(path, ignore_errors=True)
+        _templates.clear()
+
+
+_MEMORY_FILESYSTEMS = frozenset(["ramfs", "tmpfs"])
+
+
+def _filesystem_type(path: str) -> str | None:
+    """Return the type of the filesystem path is on, if it can be found."""
+    path = os.path.realpath(path)
+    mountpoint = ""
+    fstype = None
+    try:
+        with open("/proc/self/mounts") as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount = fields[1].replace("\\040", " ")
+                if (path == mount or path.startswith(mount.rstrip("/") + "/")) and len(
+                    mount
+                ) >= len(mountpoint):
+                    mountpoint, fstype = mount, fields[2]
+    except OSError:
+        return None
+    return fstype
+
+
+@functools.cache
+def _memory_dir() -> str | None:
+    """Return a writable directory on a memory-backed filesystem, if any."""
+    # Directories are made in it with mkdtemp, so this is safe.
+    for candidate in ("/dev/shm", "/run/shm"):  # noqa: S108
+        if (
+            os.path.isdir(candidate)
+            and os.access(candidate, os.W_OK | os.X_OK)
+            and _filesystem_type(candidate) in _MEMORY_FILESYSTEMS
+        ):
+            return candidate
+    return None
+
+
+class TempDirReaper:
+    """Deletes directories in a background thread.
+
+    discard() atomically renames a directory into a graveyard directory made
+    next to it (one per parent directory and process), and a background
+    thread deletes it from there. This takes the cost of deleting large trees
+    out of the thread that discards them.
+
+    If max_entries directories, or (when it is set) max_bytes bytes, are
+    already waiting for deletion, or the rename fails, discard() deletes the
+    directory synchronously instead.
+
+    The thread is started on first use. close(), which is called
+    automatically at interpreter exit, waits for all pending deletions to
+    finish and removes the graveyard directories.
+
+    Use a reaper by passing it to TempDir or TempDirPool.
+
+    :ivar pending_entries: The number of directories waiting to be deleted.
+    :ivar pending_bytes: The size in bytes of the directories waiting to be
+        deleted. Sizes are only measured when max_bytes is set, so this is 0
+        otherwise.
+    :ivar synchronous_deletions: The number of directories discard() has had
+        to delete synchronously.
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int | None = None) -> None:
+        """Create a TempDirReaper.
+
+        :param max_entries: The maximum number of directories to have waiting
+            for deletion.
+        :param max_bytes: If supplied, the maximum total size of the
+            directories waiting for deletion.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.pending_bytes = 0
+        self.synchronous_deletions = 0
+        # Directories being deleted or waiting to be, with their sizes. The
+        # head of the queue stays on it until it has been deleted.
+        self._queue: collections.deque[tuple[str, int]] = collections.deque()
+        self._graveyards: dict[tuple[str, int], str] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        atexit.register(self.close)
+
+    @property
+    def pending_entries(self) -> int:
+        return len(self._queue)
+
+    def discard(self, path: str) -> None:
+        """Delete the directory path, normally in the background."""
+        size = 0 if self.max_bytes is None else _disk_usage(path)
+        parent = os.path.dirname(os.path.abspath(path))
+        with self._condition:
+            if not self._closed and self._has_room(size):
+                key = (parent, os.getpid())
+                graveyard = self._graveyards.get(key)
+                try:
+                    if graveyard is None:
+                        graveyard = tempfile.mkdtemp(
+                            prefix=f"fixtures-graveyard-{os.getpid()}-", dir=parent
+                        )
+                        self._graveyards[key] = graveyard
+                    buried = os.path.join(graveyard, os.path.basename(path))
+                    os.rename(path, buried)
+                except OSError:
+                    pass
+                else:
+                    self._queue.append((buried, size))
+                    self.pending_bytes += size
+                    self._start()
+                    self._condition.notify_all()
+                    return
+            self.synchronous_deletions += 1
+        shutil.rmtree(path, ignore_errors=True)
+
+    def flush(self) -> None:
+        """Wait until every directory discarded so far has been deleted."""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._queue)
+
+    def close(self) -> None:
+        """Finish all pending deletions and stop the background thread.
+
+        Directories discarded afterwards are deleted synchronously.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._condition:
+            # Left over only if the thread died, e.g. in a forked child.
+            paths = [path for path, _ in self._queue]
+            paths.extend(self._graveyards.values())
+            self._queue.clear()
+            self._graveyards.clear()
+            self.pending_bytes = 0
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+        atexit.unregister(self.close)
+
+    def _has_room(self, size: int) -> bool:
+        if len(self._queue) >= self.max_entries:
+            return False
+        return self.max_bytes is None or self.pending_bytes + size <= self.max_bytes
+
+    def _start(self) -> None:
+        # The thread does not survive a fork, so a forked child starts its own.
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="fixtures-TempDirReaper", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                path, size = self._queue[0]
+            shutil.rmtree(path, ignore_errors=True)
+            with self._condition:
+                self._queue.popleft()
+                self.pending_bytes -= size
+                self._condition.notify_all()
+
+
+class TempDirPool:
+    """A pool of empty temporary directories, made ready in the background.
+
+    Handing out a directory from the pool is a constant time operation: a
+    background thread keeps up to size empty directories ready under rootdir.
+    Directories given back to the pool are deleted by a TempDirReaper, so
+    neither making nor removing directories happens in the thread using the
+    pool.
+
+    The thread is started on first use. close(), which is called
+    automatically at interpreter exit, stops it and removes every directory
+    the pool still owns.
+
+    Use a pool by passing it to TempDir.
+
+    :ivar rootdir: The directory the pooled directories are made in.
+    :ivar reaper: The TempDirReaper deleting released directories.
+    """
+
+    def __init__(
+        self,
+        rootdir: str | None = None,
+        size: int = 8,
+        reaper: TempDirReaper | None = None,
+    ) -> None:
+        """Create a TempDirPool.
+
+        :param rootdir: The directory to make directories in. Defaults to
+            tempfile.gettempdir() at the time the pool is created.
+        :param size: The number of empty directories to keep ready.
+        :param reaper: The TempDirReaper to delete released directories with.
+            By default the pool makes its own, which close() closes.
+        """
+        if rootdir is None:
+            rootdir = tempfile.gettempdir()
+        self.rootdir = rootdir
+        self.size = size
+        self._owns_reaper = reaper is None
+        self.reaper = TempDirReaper() if reaper is None else reaper
+        self._ready: collections.deque[str] = collections.deque()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._pid = os.getpid()
+        atexit.register(self.close)
+
+    def _check_fork(self) -> None:
+        # A forked child must not hand out (or delete) the directories ready
+        # in its parent, and the thread filling the pool does not survive the
+        # fork: start afresh. The lock too may have been held by another
+        # thread when the process forked.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._condition = threading.Condition()
+            self._ready = collections.deque()
+            self._thread = None
+
+    def acquire(self) -> str:
+        """Return the path of an empty directory, now owned by the caller.
+
+        If no directory is ready (or the pool is closed) one is made
+        synchronously.
+        """
+        path = None
+        self._check_fork()
+        with self._condition:
+            if not self._closed:
+                if self._ready:
+                    path = self._ready.popleft()
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="fixtures-TempDirPool", daemon=True
+                    )
+                    self._thread.start()
+                self._condition.notify()
+        if path is None:
+            path = tempfile.mkdtemp(dir=self.rootdir)
+        return path
+
+    def release(self, path: str) -> None:
+        """Give back a directory obtained from acquire, for removal."""
+        self.reaper.discard(path)
+
+    def close(self) -> None:
+        """Stop the background thread and remove all the pool's directories.
+
+        Directories handed out and not yet released are left alone; releasing
+        them later deletes them with the reaper, or immediately if the pool
+        closed its own reaper.
+        """
+        self._check_fork()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._condition:
+            paths = list(self._ready)
+            self._ready.clear()
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+        if self._owns_reaper:
+            self.reaper.close()
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and len(self._ready) >= self.size:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                wanted = self.size - len(self._ready)
+            for _ in range(wanted):
+                path = tempfile.mkdtemp(dir=self.rootdir)
+                with self._condition:
+                    if self._closed:
+                        os.rmdir(path)
+                        return
+                    self._ready.append(path)
 
 
 class TempDir(fixtures.Fixture):
     """Create a temporary directory.
 
+    The directory can be populated from a template: a directory, or a
+    callable which fills the directory it is passed. A callable template is
+    called once per parent directory and its result cached until interpreter
+    exit. Files are copied from the template with a reflink where the
+    filesystem supports it (so only changed blocks are ever copied), and
+    otherwise with a plain copy; with hardlink=True they are hard linked
+    instead.
+
+    With memory=True the directory is made on a memory-backed filesystem
+    (such as /dev/shm) if one is available and, when memory_limit is given,
+    has that much space free. Otherwise it is made on disk as usual.
+
     :ivar path: The path of the temporary directory.
+    :ivar in_memory: Whether the directory is on a memory-backed filesystem.
+    :ivar memory_used: The number of bytes in the directory's files when it
+        was last cleaned up, if it was on a memory-backed filesystem.
     """
 
     path: str
     rootdir: str | None
+    pool: TempDirPool | None
+    reaper: TempDirReaper | None
+    template: str | Callable[[str], object] | None
+    hardlink: bool
+    memory: bool
+    memory_limit: int | None
+    in_memory: bool
+    memory_used: int
 
-    def __init__(self, rootdir: str | None = None) -> None:
+    def __init__(
+        self,
+        rootdir: str | None = None,
+        pool: TempDirPool | None = None,
+        reaper: TempDirReaper | None = None,
+        template: str | Callable[[str], object] | None = None,
+        hardlink: bool = False,
+        memory: bool = False,
+        memory_limit: int | None = None,
+    ) -> None:
         """Create a TempDir.
 
         :param rootdir: If supplied force the temporary directory to be a
             child of rootdir.
+        :param pool: If supplied, take the directory from this TempDirPool
+            and give it back to the pool, for deletion in the background, on
+            cleanUp. The directory is a child of the pool's rootdir.
+        :param reaper: If supplied, have this TempDirReaper delete the
+            directory in the background on cleanUp.
+        :param template: If supplied, a directory to copy into the temporary
+            directory, or a callable taking the path of a directory to fill
+            with the contents to copy.
+        :param hardlink: If True, hard link the template's files rather than
+            copying them. Only safe if the files are never modified in place:
+            writing to one writes to the template.
+        :param memory: If True, make the directory on a memory-backed
+            filesystem if there is one.
+        :param memory_limit: If supplied, the number of bytes of memory the
+            directory may need. If the memory-backed filesystem has less free
+            space the directory is made on disk instead.
         """
+        if rootdir is not None and pool is not None:
+            raise ValueError("rootdir and pool are mutually exclusive.")
+        if pool is not None and reaper is not None:
+            raise ValueError("pool and reaper are mutually exclusive.")
+        if memory and (rootdir is not None or pool is not None):
+            raise ValueError("memory is mutually exclusive with rootdir and pool.")
         self.rootdir = rootdir
+        self.pool = pool
+        self.reaper = reaper
+        self.template = template
+        self.hardlink = hardlink
+        self.memory = memory
+        self.memory_limit = memory_limit
+        self.memory_used = 0
 
     def _setUp(self) -> None:
-        self.path = tempfile.mkdtemp(dir=self.rootdir)
-        self.addCleanup(shutil.rmtree, self.path, ignore_errors=True)
+        self.in_memory = False
+        if self.pool is not None:
+            self.path = self.pool.acquire()
+            self.addCleanup(self.pool.release, self.path)
+        else:
+            rootdir = self.rootdir
+            if self.memory:
+                rootdir = self._memory_rootdir()
+                self.in_memory = rootdir is not None
+            self.path = tempfile.mkdtemp(dir=rootdir)
+            if self.reaper is not None:
+                self.addCleanup(self.reaper.discard, self.path)
+            else:
+                self.addCleanup(shutil.rmtree, self.path, ignore_errors=True)
+        if self.in_memory:
+            self.addCleanup(self._record_memory_used)
+        self._populate()
+
+    def disk_usage(self) -> int:
+        """Return the number of bytes in the directory's files."""
+        return _disk_usage(self.path)
+
+    def _memory_rootdir(self) -> str | None:
+        rootdir = _memory_dir()
+        if rootdir is not None and self.memory_limit is not None:
+            stat = os.statvfs(rootdir)
+            if stat.f_bavail * stat.f_frsize < self.memory_limit:
+                return None
+        return rootdir
+
+    def _record_memory_used(self) -> None:
+        self.memory_used = self.disk_usage()
+
+    def reset(self) -> None:
+        """Restore the directory to its contents just after setUp.
+
+        Only entries which have been changed, added or removed since setUp are
+        deleted or copied from the template again, and the directory keeps
+        the same path.
+
+        If a subclass overrides _setUp, or cleanups have been added since
+        setUp, a full cleanUp and setUp is done instead, as those might have
+        changed more than the directory's contents. So it is if the directory
+        itself has gone.
+        """
+        if (
+            type(self)._setUp is not TempDir._setUp
+            or len(self._cleanups or ()) != self._cleanup_count
+            or not os.path.isdir(self.path)
+        ):
+            super().reset()
+            return
+        with timed("reset", self):
+            missing = _remove_changed(self.path, self._snapshot)
+            # Anything missing was copied from the template by setUp.
+            template = self._template_path() if missing else None
+            if template is not None:
+                for relpath in missing:
+                    _clone_entry(
+                        os.path.join(template, relpath),
+                        os.path.join(self.path, relpath),
+                        self.hardlink,
+                    )
+                self._snapshot.update(
+                    (relpath, _entry_state(os.path.join(self.path, relpath)))
+                    for relpath in missing
+                )
+
+    def _template_path(self) -> str | None:
+        template = self.template
+        if callable(template):
+            template = _build_template(template, os.path.dirname(self.path))
+        return template
+
+    def _populate(self) -> None:
+        template = self._template_path()
+        if template is not None:
+            _clone_tree(template, self.path, self.hardlink)
+        self._snapshot = _snapshot(self.path)
+        self._cleanup_count = len(self._cleanups or ())
 
     def join(self, *children: str) -> str:
         """Return an absolute path, given one relative to this ``TempDir``.
@@ -63,10 +653,31 @@ class NestedTempfile(fixtures.Fixture):
     package creates temporary files and directories in to be a new temporary
     directory. This new temporary directory is removed when the fixture is torn
     down.
+
+    :ivar in_memory: Whether the directory is on a memory-backed filesystem.
     """
 
+    in_memory: bool
+
+    def __init__(self, memory: bool = False, memory_limit: int | None = None) -> None:
+        """Create a NestedTempfile.
+
+        :param memory: If True, make the directory on a memory-backed
+            filesystem if there is one, as TempDir does.
+        :param memory_limit: As for TempDir.
+        """
+        self._tempdir = TempDir(memory=memory, memory_limit=memory_limit)
+
+    @property
+    def memory_used(self) -> int:
+        """The number of bytes in the directory's files when it was removed,
+        if it was on a memory-backed filesystem.
+        """
+        return self._tempdir.memory_used
+
     def _setUp(self) -> None:
-        tempdir_fixture = self.useFixture(TempDir())
+        tempdir_fixture = self.useFixture(self._tempdir)
+        self.in_memory = tempdir_fixture.in_memory
         tempdir = tempdir_fixture.path
         patch = fixtures.MonkeyPatch("tempfile.tempdir", tempdir)
         self.useFixture(patch)
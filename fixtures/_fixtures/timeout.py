@@ -13,16 +13,22 @@
 # license you chose for the specific language governing permissions and
 # limitations under that license.
 
-
 """Timeout fixture."""
 
+import math
+import os
 import signal
-from typing import Any
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Literal
 from collections.abc import Callable
 
 import fixtures
 
 __all__ = [
+    "AsyncTimeout",
     "Timeout",
     "TimeoutException",
 ]
@@ -32,6 +38,134 @@ class TimeoutException(Exception):
     """Timeout expired"""
 
 
+class _Deadlines:
+    """The deadlines of the active Timeouts in this process.
+
+    A single ITIMER_REAL interval timer is armed for the earliest deadline,
+    and a single SIGALRM handler decides which Timeout has expired when it
+    fires. The SIGALRM handler in place before the first Timeout is restored
+    once there are none.
+
+    Only the main thread can install a signal handler, and only gentle
+    Timeouts need one: a Timeout that is not gentle set up in another thread
+    just arms the timer, so that SIGALRM does whatever it would have done
+    without any Timeout.
+    """
+
+    def __init__(self) -> None:
+        self._timeouts: list[tuple[float, Timeout]] = []
+        self._previous_handler: Any = None
+        self._installed = False
+        # Reentrant, as the handler runs in the main thread, possibly while
+        # it is in add() or remove().
+        self._lock = threading.RLock()
+
+    def add(self, timeout: "Timeout", deadline: float) -> None:
+        main = threading.current_thread() is threading.main_thread()
+        if timeout.gentle and not main:
+            raise ValueError(
+                "A gentle Timeout must be set up in the main thread, unless "
+                "watchdog is True."
+            )
+        with self._lock:
+            if not self._installed and main:
+                self._previous_handler = signal.signal(signal.SIGALRM, self._on_alarm)
+                self._installed = True
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            self._timeouts.append((deadline, timeout))
+            self._arm()
+
+    def remove(self, timeout: "Timeout") -> None:
+        with self._lock:
+            if any(entry[1] is timeout for entry in self._timeouts):
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                self._timeouts = [
+                    entry for entry in self._timeouts if entry[1] is not timeout
+                ]
+                self._arm()
+            if (
+                not self._timeouts
+                and self._installed
+                and threading.current_thread() is threading.main_thread()
+            ):
+                signal.signal(signal.SIGALRM, self._previous_handler)
+                self._previous_handler = None
+                self._installed = False
+
+    def _arm(self) -> None:
+        # Timeouts which have fired stay until removed, with an infinite
+        # deadline so that they don't fire again.
+        earliest = min((deadline for deadline, _ in self._timeouts), default=math.inf)
+        if earliest == math.inf:
+            return
+        # A delay of 0 would disarm the timer: fire as soon as possible.
+        signal.setitimer(signal.ITIMER_REAL, max(earliest - time.monotonic(), 1e-6))
+
+    def _on_alarm(self, signum: int, frame: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            # The outermost expired Timeout is the one that failed: any inner
+            # ones only expired because the outer one did.
+            expired = [
+                timeout for deadline, timeout in self._timeouts if deadline <= now
+            ]
+            if expired:
+                self._timeouts = [
+                    (math.inf if deadline <= now else deadline, timeout)
+                    for deadline, timeout in self._timeouts
+                ]
+            self._arm()
+            if not expired and self._timeouts:
+                # Early, e.g. because the timer was rounded down.
+                return
+        if expired and expired[0].gentle:
+            expired[0].signal_handler(signum, frame)
+            return
+        # Not gentle (or not ours, with the handler left installed by a
+        # thread which could not restore it): do what SIGALRM would have done
+        # without any Timeout, which by default terminates the process.
+        handler = self._previous_handler
+        if callable(handler):
+            handler(signum, frame)
+        elif handler != signal.SIG_IGN:
+            signal.signal(signal.SIGALRM, signal.SIG_DFL)
+            signal.raise_signal(signal.SIGALRM)
+
+
+_deadlines = _Deadlines()
+
+
+def _format_stacks() -> str:
+    """Return the current stack of every thread, formatted as text."""
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    lines = []
+    for ident, frame in sys._current_frames().items():
+        lines.append(f"Thread {names.get(ident, '<unknown>')} ({ident}):\n")
+        lines.extend(traceback.format_stack(frame))
+        lines.append("\n")
+    return "".join(lines)
+
+
+def _can_raise_in_thread() -> bool:
+    """Return whether _raise_in_thread works here (it needs CPython)."""
+    if sys.implementation.name != "cpython":
+        return False
+    try:
+        import ctypes
+    except ImportError:
+        return False
+    return hasattr(getattr(ctypes, "pythonapi", None), "PyThreadState_SetAsyncExc")
+
+
+def _raise_in_thread(ident: int, exc_type: type[BaseException] | None) -> None:
+    """Raise exc_type asynchronously in a thread, or cancel it if None."""
+    import ctypes
+
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(ident), None if exc_type is None else ctypes.py_object(exc_type)
+    )
+
+
 class Timeout(fixtures.Fixture):
     """Fixture that aborts the contained code after a number of seconds.
 
@@ -39,35 +173,171 @@ class Timeout(fixtures.Fixture):
     raised, or not gentle, in which case the process will typically be aborted
     by SIGALRM.
 
+    The timeout can be a fraction of a second, and Timeouts can be nested:
+    whichever deadline is earliest fires first, and an outer Timeout still
+    fires at its own deadline once an inner one is cleaned up.
+
+    With watchdog=True a thread waits for the deadline instead of SIGALRM,
+    so the Timeout can be used from any thread. On expiry the stacks of all
+    threads are saved in the stacks attribute and a "timeout-stacks" detail.
+    Then, if gentle, TimeoutException is raised asynchronously in the thread
+    that set the Timeout up, which happens when that thread next runs Python
+    code: code blocked in a C call (such as time.sleep) is not interrupted.
+    If not gentle, the stacks are written to stderr and the process aborted.
+
     Cautions:
-     * This has no effect on Windows.
-     * Only one Timeout can be used at any time per process.
+     * This has no effect on Windows, unless watchdog is True.
+     * Without watchdog, a gentle Timeout must be used from the main thread,
+       as only it handles SIGALRM.
+     * Without watchdog, this uses the ITIMER_REAL interval timer, so cannot
+       be combined with other users of it or of signal.alarm.
+     * A gentle watchdog needs CPython, to raise in another thread.
+
+    :ivar stacks: The formatted stacks of all threads when a watchdog
+        Timeout expired, or None.
     """
 
-    timeout_secs: int
+    timeout_secs: float
     alarm_fn: Callable[[int], int] | None
     gentle: bool
+    watchdog: bool
+    stacks: str | None
 
-    def __init__(self, timeout_secs: int, gentle: bool) -> None:
+    def __init__(
+        self, timeout_secs: float, gentle: bool, watchdog: bool = False
+    ) -> None:
+        """Create a Timeout.
+
+        :param timeout_secs: The number of seconds, which need not be whole,
+            to allow the contained code.
+        :param gentle: If True, raise TimeoutException on expiry. Otherwise
+            SIGALRM is delivered as if there were no Timeout, or with
+            watchdog the process is aborted.
+        :param watchdog: If True, use a watchdog thread rather than SIGALRM.
+        :raises ValueError: If watchdog and gentle are both True on a Python
+            which cannot raise exceptions in other threads.
+        """
+        if watchdog and gentle and not _can_raise_in_thread():
+            raise ValueError("A gentle watchdog Timeout is only supported on CPython.")
         self.timeout_secs = timeout_secs
+        # Kept for compatibility: if this is None, the Timeout does nothing.
         self.alarm_fn = getattr(signal, "alarm", None)
         self.gentle = gentle
+        self.watchdog = watchdog
 
     def signal_handler(self, signum: int, frame: Any) -> None:
         raise TimeoutException()
 
     def _setUp(self) -> None:
-        if self.alarm_fn is None:
+        self.stacks = None
+        if self.watchdog:
+            self._start_watchdog()
+            return
+        if self.alarm_fn is None or not hasattr(signal, "setitimer"):
             return  # Can't run on Windows
-        if self.gentle:
-            # Install a handler for SIGARLM so we can raise an exception rather
-            # than the default handler executing, which kills the process.
-            old_handler = signal.signal(signal.SIGALRM, self.signal_handler)
-        # We add the slarm cleanup before the cleanup for the signal handler,
-        # otherwise there is a race condition where the signal handler is
-        # cleaned up but the alarm still fires.
-        if self.alarm_fn is not None:
-            self.addCleanup(lambda: self.alarm_fn(0) if self.alarm_fn else None)
-            self.alarm_fn(self.timeout_secs)
-        if self.gentle:
-            self.addCleanup(lambda: signal.signal(signal.SIGALRM, old_handler))
+        self.addCleanup(_deadlines.remove, self)
+        _deadlines.add(self, time.monotonic() + self.timeout_secs)
+
+    def _start_watchdog(self) -> None:
+        target = threading.get_ident()
+        lock = threading.Lock()
+        finished = threading.Event()
+
+        def watch() -> None:
+            if finished.wait(self.timeout_secs):
+                return
+            with lock:
+                if finished.is_set():
+                    return
+                self.stacks = _format_stacks()
+                self._add_stacks_detail()
+                if not self.gentle:
+                    sys.stderr.write(self.stacks)
+                    sys.stderr.flush()
+                    os.abort()
+                _raise_in_thread(target, TimeoutException)
+
+        def stop() -> None:
+            with lock:
+                finished.set()
+                if self.stacks is not None:
+                    # Don't let an exception not yet delivered escape from
+                    # cleanUp.
+                    _raise_in_thread(target, None)
+            thread.join()
+
+        thread = threading.Thread(
+            target=watch, name="fixtures-Timeout-watchdog", daemon=True
+        )
+        self.addCleanup(stop)
+        thread.start()
+
+    def _add_stacks_detail(self) -> None:
+        try:
+            from testtools.content import text_content
+        except ImportError:
+            return
+        self.addDetail("timeout-stacks", text_content(self.stacks or ""))
+
+
+class AsyncTimeout(fixtures.AsyncFixture):
+    """Fixture that cancels the contained coroutine after a number of seconds.
+
+    This is the asyncio counterpart of Timeout. Cancellation of the task
+    that set the fixture up is scheduled on the event loop, so nothing is
+    interrupted in the middle of the loop's own code, and if the deadline is
+    not reached the only cost is scheduling and cancelling one callback.
+
+    Used with ``async with``, the resulting CancelledError is turned into
+    TimeoutException. When the fixture is used some other way (for instance
+    via useFixture) the task is just cancelled; expired tells why.
+
+    AsyncTimeouts can be nested, and the timeout can be a fraction of a
+    second.
+
+    :ivar expired: Whether the deadline was reached.
+    """
+
+    timeout_secs: float
+    expired: bool
+
+    def __init__(self, timeout_secs: float) -> None:
+        """Create an AsyncTimeout.
+
+        :param timeout_secs: The number of seconds, which need not be whole,
+            to allow the contained code.
+        """
+        self.timeout_secs = timeout_secs
+
+    async def _setUp(self) -> None:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        if task is None:
+            raise RuntimeError("AsyncTimeout must be used inside a task.")
+        self.expired = False
+        self._task: asyncio.Task[Any] = task
+        handle = loop.call_at(loop.time() + self.timeout_secs, self._expire)
+        self.addCleanup(handle.cancel)
+
+    def _expire(self) -> None:
+        self.expired = True
+        self._task.cancel()
+
+    async def __aexit__(
+        self, exc_type: Any, exc_val: Any, exc_tb: Any
+    ) -> Literal[False]:
+        import asyncio
+
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        if (
+            self.expired
+            and exc_type is not None
+            and issubclass(exc_type, asyncio.CancelledError)
+        ):
+            # This cancellation has been dealt with (Python 3.11+).
+            if hasattr(self._task, "uncancel"):
+                self._task.uncancel()
+            raise TimeoutException() from exc_val
+        return False
@@ -0,0 +1,67 @@
+#  fixtures: Fixtures with cleanups for testing and convenience.
+#
+# Copyright (c) 2010, Robert Collins <robertc@robertcollins.net>
+#
+# Licensed under either the Apache License, Version 2.0 or the BSD 3-clause
+# license at the users choice. A copy of both licenses are available in the
+# project source as Apache-2.0 and BSD. You may not use this file except in
+# compliance with one of these two licences.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under these licenses is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# license you chose for the specific language governing permissions and
+# limitations under that license.
+
+__all__ = [
+    "TimingCollector",
+]
+
+import threading
+
+from fixtures import Fixture
+from fixtures.timing import Timing, add_listener, remove_listener
+
+
+class TimingCollector(Fixture):
+    """Collect the timings of fixture operations while set up.
+
+    While this fixture is set up, fixture instrumentation is on (see
+    fixtures.timing) and every outermost Timing, from any thread, is recorded.
+    Typically used once for a whole test run, to find the fixtures that
+    dominate set up and clean up time.
+
+    :ivar records: The list of outermost Timings recorded.
+    """
+
+    records: list[Timing]
+
+    def _setUp(self) -> None:
+        self.records = []
+        self._lock = threading.Lock()
+        add_listener(self._record)
+        self.addCleanup(remove_listener, self._record)
+
+    def _record(self, timing: Timing) -> None:
+        with self._lock:
+            self.records.append(timing)
+
+    def totals(self) -> dict[tuple[str, str], float]:
+        """Sum the recorded durations by name and operation.
+
+        Durations are inclusive of nested operations, so a fixture that uses
+        a slow fixture is itself slow.
+
+        :return: A dict from (name, operation) to the total seconds spent,
+            where name is the qualified name of a fixture class or a cleanup
+            function.
+        """
+        result: dict[tuple[str, str], float] = {}
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            for timing in record.walk():
+                if timing.duration is not None:
+                    key = (timing.name, timing.operation)
+                    result[key] = result.get(key, 0.0) + timing.duration
+        return result
@@ -16,14 +16,20 @@
 from __future__ import annotations
 
 __all__ = [
+    "AsyncCallMany",
     "CallMany",
 ]
 
+import contextvars
+import inspect
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal, ParamSpec, TYPE_CHECKING
 from types import TracebackType
 
+from fixtures.timing import timed_call
+
 if TYPE_CHECKING:
     if sys.version_info >= (3, 11):
         from typing import Self
@@ -40,21 +46,92 @@ except ImportError:
 
 P = ParamSpec("P")
 
+_ExcInfo = tuple[type[BaseException] | None, BaseException | None, TracebackType | None]
+_Call = tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+# The kinds of entry on a CallMany stack.
+_SEQUENTIAL = 0
+_CONCURRENT = 1
+_BARRIER = 2
+
+
+def _barrier() -> None:
+    """Placeholder function for barrier entries; never called."""
+
+
+def _batches(
+    entries: Iterable[tuple[int, _Call]],
+) -> Iterator[tuple[bool, list[_Call]]]:
+    """Group entries, in the order they are to be run, into batches.
+
+    Yields (concurrent, calls) pairs: each run of adjacent concurrent entries
+    is yielded as one batch, and each sequential entry as a batch on its own.
+    Barriers only serve to split runs of concurrent entries.
+    """
+    group: list[_Call] = []
+    for kind, call in entries:
+        if kind == _CONCURRENT:
+            group.append(call)
+            continue
+        if group:
+            yield True, group
+            group = []
+        if kind == _SEQUENTIAL:
+            yield False, [call]
+    if group:
+        yield True, group
+
+
+def _call(call: _Call) -> _ExcInfo | None:
+    """Make call, returning the exc_info of any Exception it raises."""
+    cleanup, args, kwargs = call
+    try:
+        with timed_call(cleanup):
+            cleanup(*args, **kwargs)
+    except Exception:
+        return sys.exc_info()
+    return None
+
+
+def _handle_errors(result: list[_ExcInfo], raise_errors: bool) -> list[_ExcInfo] | None:
+    """Raise or return the errors gathered by a call of CallMany.
+
+    See CallMany.__call__ for the meaning of raise_errors.
+    """
+    if result and raise_errors:
+        if 1 == len(result):
+            error = result[0]
+            exc = error[1]
+            if exc is not None:
+                raise exc.with_traceback(error[2])
+        else:
+            raise MultipleExceptions(*result)
+    if not raise_errors:
+        return result
+    return None
+
 
 class CallMany:
     """A stack of functions which will all be called on __call__.
 
     CallMany also acts as a context manager for convenience.
 
-    Functions are called in last pushed first executed order.
+    Functions are called in last pushed first executed order. Functions added
+    with push_concurrent are the exception: a run of them is called on a pool
+    of threads, see push_concurrent.
 
     This is used by Fixture to manage its addCleanup feature.
     """
 
-    def __init__(self) -> None:
-        self._cleanups: list[
-            tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]
-        ] = []
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Create a CallMany.
+
+        :param max_workers: The maximum number of threads used to call
+            functions added with push_concurrent. Defaults to the
+            concurrent.futures default.
+        """
+        self._cleanups: list[tuple[int, _Call]] = []
+        self.max_workers = max_workers
 
     def push(
         self, cleanup: Callable[P, Any], *args: P.args, **kwargs: P.kwargs
@@ -69,7 +146,38 @@ class CallMany:
         :param kwargs: Keyword args for cleanup.
         :return: None
         """
-        self._cleanups.append((cleanup, args, kwargs))
+        self._cleanups.append((_SEQUENTIAL, (cleanup, args, kwargs)))
+
+    def push_concurrent(
+        self, cleanup: Callable[P, Any], *args: P.args, **kwargs: P.kwargs
+    ) -> None:
+        """Add a function that may run at the same time as its neighbours.
+
+        Functions pushed consecutively with push_concurrent are assumed to be
+        independent of each other: when __call__ reaches them they are all
+        called together on a pool of threads, and __call__ waits for all of
+        them to finish before moving on. Functions added with push, and
+        barriers, separate such runs, so last pushed first executed order is
+        kept across them.
+
+        :param cleanup: A thread safe callable to call during cleanUp.
+        :param *args: Positional args for cleanup.
+        :param kwargs: Keyword args for cleanup.
+        :return: None
+        """
+        self._cleanups.append((_CONCURRENT, (cleanup, args, kwargs)))
+
+    def barrier(self) -> None:
+        """Stop functions pushed before and after from running concurrently.
+
+        Everything pushed after the barrier finishes before anything pushed
+        before it starts.
+        """
+        self._cleanups.append((_BARRIER, (_barrier, (), {})))
+
+    def __len__(self) -> int:
+        """Return the number of functions (and barriers) waiting to be called."""
+        return len(self._cleanups)
 
     def __call__(
         self, raise_errors: bool = True
@@ -97,7 +205,8 @@ class CallMany:
             then check within a MultipleExceptions instance for an occurrence of
             the type you wish to catch.
         :return: Either None or a list of the exc_info() for each exception
-            that occurred if raise_errors was False.
+            that occurred if raise_errors was False. Exceptions from functions
+            that ran concurrently are listed in last pushed first order.
         """
         cleanups = reversed(self._cleanups)
         self._cleanups = []
@@ -108,22 +217,20 @@ class CallMany:
                 TracebackType | None,
             ]
         ] = []
-        for cleanup, args, kwargs in cleanups:
-            try:
-                cleanup(*args, **kwargs)
-            except Exception:
-                result.append(sys.exc_info())
-        if result and raise_errors:
-            if 1 == len(result):
-                error = result[0]
-                exc = error[1]
-                if exc is not None:
-                    raise exc.with_traceback(error[2])
+        for concurrent, calls in _batches(cleanups):
+            if concurrent and len(calls) > 1:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    # Each call runs in a copy of this context, so anything
+                    # context-local, such as timing, nests correctly.
+                    futures = [
+                        executor.submit(contextvars.copy_context().run, _call, call)
+                        for call in calls
+                    ]
+                errors = [future.result() for future in futures]
             else:
-                raise MultipleExceptions(*result)
-        if not raise_errors:
-            return result
-        return None
+                errors = [_call(call) for call in calls]
+            result.extend(error for error in errors if error is not None)
+        return _handle_errors(result, raise_errors)
 
     def __enter__(self) -> Self:
         return self
@@ -131,3 +238,101 @@ class CallMany:
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> Literal[False]:
         self()
         return False  # Propagate exceptions from the with body.
+
+
+class AsyncCallMany:
+    """A stack of functions which will all be called on ``await self()``.
+
+    This is the asyncio counterpart of CallMany: the functions may be plain
+    callables or coroutine functions; anything a function returns that is
+    awaitable is awaited. AsyncCallMany also acts as an async context manager.
+
+    Functions are called in last pushed first executed order, one at a time,
+    except that a run of functions added with push_concurrent is awaited
+    concurrently with asyncio.gather.
+
+    This is used by AsyncFixture to manage its cleanups.
+    """
+
+    def __init__(self) -> None:
+        self._cleanups: list[tuple[int, _Call]] = []
+
+    def push(
+        self, cleanup: Callable[P, Any], *args: P.args, **kwargs: P.kwargs
+    ) -> None:
+        """Add a function to be called from __call__.
+
+        :param cleanup: A callable, or a coroutine function, to call during
+            cleanUp.
+        :param *args: Positional args for cleanup.
+        :param kwargs: Keyword args for cleanup.
+        :return: None
+        """
+        self._cleanups.append((_SEQUENTIAL, (cleanup, args, kwargs)))
+
+    def push_concurrent(
+        self, cleanup: Callable[P, Any], *args: P.args, **kwargs: P.kwargs
+    ) -> None:
+        """Add a function that may run concurrently with its neighbours.
+
+        Functions pushed consecutively with push_concurrent are assumed to be
+        independent of each other: they are all started together and awaited
+        as a group. A function added with push, or a barrier, separates
+        groups, so ordering against it is preserved.
+
+        :param cleanup: A callable, or a coroutine function, to call during
+            cleanUp.
+        :param *args: Positional args for cleanup.
+        :param kwargs: Keyword args for cleanup.
+        :return: None
+        """
+        self._cleanups.append((_CONCURRENT, (cleanup, args, kwargs)))
+
+    def barrier(self) -> None:
+        """Stop functions pushed before and after from running concurrently.
+
+        See CallMany.barrier.
+        """
+        self._cleanups.append((_BARRIER, (_barrier, (), {})))
+
+    async def __call__(self, raise_errors: bool = True) -> list[_ExcInfo] | None:
+        """Run all the registered functions.
+
+        :param raise_errors: As for CallMany.__call__.
+        :return: Either None or a list of the exc_info() for each exception
+            that occurred if raise_errors was False.
+        """
+        cleanups = reversed(self._cleanups)
+        self._cleanups = []
+        result: list[_ExcInfo] = []
+        for concurrent, calls in _batches(cleanups):
+            if concurrent and len(calls) > 1:
+                import asyncio
+
+                errors = await asyncio.gather(*map(_acall, calls))
+            else:
+                errors = [await _acall(call) for call in calls]
+            result.extend(error for error in errors if error is not None)
+        return _handle_errors(result, raise_errors)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: Any, exc_val: Any, exc_tb: Any
+    ) -> Literal[False]:
+        await self()
+        return False  # Propagate exceptions from the with body.
+
+
+async def _acall(call: _Call) -> _ExcInfo | None:
+    """Make call, awaiting its result if needed, and capture any error."""
+    cleanup, args, kwargs = call
+    try:
+        with timed_call(cleanup):
+            result = cleanup(*args, **kwargs)
+            if inspect.isawaitable(result):
+                await result
+    except Exception:
+        return sys.exc_info()
+    return None
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 __all__ = [
+    "AsyncFixture",
     "CompoundFixture",
     "Fixture",
     "FunctionFixture",
@@ -24,13 +25,16 @@ __all__ = [
     "SetupError",
 ]
 
+import contextvars
 import itertools
 import sys
-from collections.abc import Callable, Iterable
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal, ParamSpec, TypeVar, TYPE_CHECKING
 from types import TracebackType
 
-from fixtures.callmany import CallMany
+from fixtures.callmany import AsyncCallMany, CallMany
+from fixtures.timing import timed
 
 # Deprecated, imported for compatibility.
 import fixtures.callmany
@@ -43,10 +47,13 @@ if TYPE_CHECKING:
 
 
 T = TypeVar("T", bound="Fixture")
+AT = TypeVar("AT", bound="Fixture | AsyncFixture")
 P = ParamSpec("P")
 
 MultipleExceptions = fixtures.callmany.MultipleExceptions  # type: ignore[attr-defined]
 
+_ExcInfo = tuple[type[BaseException] | None, BaseException | None, TracebackType | None]
+
 gather_details: Callable[[dict[str, Any], dict[str, Any]], None] | None
 try:
     from testtools.testcase import gather_details as _gather_details
@@ -77,6 +84,37 @@ class SetupError(Exception):
     """
 
 
+def _raise_setup_failure(
+    err: _ExcInfo, details: dict[str, Any], cleanup_errors: list[_ExcInfo] | None
+) -> None:
+    """Raise the error for a failed setUp, as described in Fixture.setUp."""
+    errors = [err] + (cleanup_errors if cleanup_errors is not None else [])
+    try:
+        raise SetupError(details)
+    except SetupError:
+        errors.append(sys.exc_info())
+    if err[0] is not None and issubclass(err[0], Exception):
+        raise MultipleExceptions(*errors)
+    else:
+        if err[1] is not None:
+            raise err[1].with_traceback(err[2])
+
+
+def _gather_setup_details(
+    fixture: Fixture | AsyncFixture, error: BaseException, details: dict[str, Any]
+) -> None:
+    """Copy the details of a fixture which failed to set up into details."""
+    if isinstance(error, MultipleExceptions):
+        if error.args[-1][0] is SetupError:
+            combine_details(error.args[-1][1].args[0], details)
+    else:
+        # The child failed to come up and didn't raise MultipleExceptions
+        # which we can understand... capture any details it has (copying
+        # the content, it may go away anytime).
+        if gather_details is not None:
+            gather_details(fixture.getDetails(), details)
+
+
 class Fixture:
     _cleanups: CallMany | None
     _details: dict[str, Any] | None
@@ -110,6 +148,26 @@ class Fixture:
         if self._cleanups is not None:
             self._cleanups.push(cleanup, *args, **kwargs)
 
+    def addConcurrentCleanup(
+        self, cleanup: Callable[P, Any], *args: P.args, **kwargs: P.kwargs
+    ) -> None:
+        """Add a cleanup which may run at the same time as its neighbours.
+
+        Cleanups added consecutively with addConcurrentCleanup are called
+        together on a pool of threads during cleanUp, so they must be thread
+        safe and must not depend on each other. This suits slow, independent
+        cleanups such as removing directory trees or stopping processes.
+        Cleanups added with addCleanup are still run in strict reverse order
+        relative to them.
+
+        :param cleanup: A callable to call during cleanUp.
+        :param args: Positional args for cleanup.
+        :param kwargs: Keyword args for cleanup.
+        :return: None
+        """
+        if self._cleanups is not None:
+            self._cleanups.push_concurrent(cleanup, *args, **kwargs)
+
     def addDetail(self, name: str, content_object: Any) -> None:
         """Add a detail to the Fixture.
 
@@ -158,10 +216,11 @@ class Fixture:
         :return: A list of the exc_info() for each exception that occurred if
             raise_first was False
         """
-        try:
-            return self._cleanups(raise_errors=raise_first)  # type: ignore[misc]
-        finally:
-            self._remove_state()
+        with timed("cleanUp", self):
+            try:
+                return self._cleanups(raise_errors=raise_first)  # type: ignore[misc]
+            finally:
+                self._remove_state()
 
     def _clear_cleanups(self) -> None:
         """Clean the cleanup queue without running them.
@@ -190,11 +249,12 @@ class Fixture:
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> Literal[False]:
-        try:
-            if self._cleanups is not None:
-                self._cleanups()
-        finally:
-            self._remove_state()
+        with timed("cleanUp", self):
+            try:
+                if self._cleanups is not None:
+                    self._cleanups()
+            finally:
+                self._remove_state()
         return False  # propagate exceptions from the with body.
 
     def getDetails(self) -> dict[str, Any]:
@@ -231,32 +291,24 @@ class Fixture:
         :changed in 1.3.1: BaseException is now caught, and only subclasses of
             Exception are wrapped in MultipleExceptions.
         """
-        self._clear_cleanups()
-        try:
-            self._setUp()
-        except BaseException:
-            err: tuple[
-                type[BaseException] | None,
-                BaseException | None,
-                TracebackType | None,
-            ] = sys.exc_info()
-            details: dict[str, Any] = {}
-            if gather_details is not None:
-                # Materialise all details since we're about to cleanup.
-                gather_details(self.getDetails(), details)
-            else:
-                details = self.getDetails()
-            cleanup_errors = self.cleanUp(raise_first=False)
-            errors = [err] + (cleanup_errors if cleanup_errors is not None else [])
+        with timed("setUp", self):
+            self._clear_cleanups()
             try:
-                raise SetupError(details)
-            except SetupError:
-                errors.append(sys.exc_info())
-            if err[0] is not None and issubclass(err[0], Exception):
-                raise MultipleExceptions(*errors)
-            else:
-                if err[1] is not None:
-                    raise err[1].with_traceback(err[2])
+                self._setUp()
+            except BaseException:
+                err: tuple[
+                    type[BaseException] | None,
+                    BaseException | None,
+                    TracebackType | None,
+                ] = sys.exc_info()
+                details: dict[str, Any] = {}
+                if gather_details is not None:
+                    # Materialise all details since we're about to cleanup.
+                    gather_details(self.getDetails(), details)
+                else:
+                    details = self.getDetails()
+                cleanup_errors = self.cleanUp(raise_first=False)
+                _raise_setup_failure(err, details, cleanup_errors)
 
     def _setUp(self) -> None:
         """Template method for subclasses to override.
@@ -283,8 +335,9 @@ class Fixture:
 
         :return: None.
         """
-        self.cleanUp()
-        self.setUp()
+        with timed("reset", self):
+            self.cleanUp()
+            self.setUp()
 
     def useFixture(self, fixture: T) -> T:
         """Use another fixture.
@@ -300,27 +353,53 @@ class Fixture:
         """
         try:
             fixture.setUp()
-        except MultipleExceptions as e:
-            if e.args[-1][0] is SetupError:
-                if self._details is not None:
-                    combine_details(e.args[-1][1].args[0], self._details)
-            raise
-        except:
-            # The child failed to come up and didn't raise MultipleExceptions
-            # which we can understand... capture any details it has (copying
-            # the content, it may go away anytime).
-            if gather_details is not None:
-                if self._details is not None:
-                    gather_details(fixture.getDetails(), self._details)
+        except BaseException as e:
+            self._gather_setup_details(fixture, e)
             raise
         else:
-            self.addCleanup(fixture.cleanUp)
-            # Calls to getDetails while this fixture is setup will return
-            # details from the child fixture.
-            if self._detail_sources is not None:
-                self._detail_sources.append(fixture)
+            self._adopt_fixture(fixture)
             return fixture
 
+    def _adopt_fixture(self, fixture: Fixture) -> None:
+        """Take ownership of a fixture which has been set up successfully."""
+        self.addCleanup(fixture.cleanUp)
+        # Calls to getDetails while this fixture is setup will return
+        # details from the child fixture.
+        if self._detail_sources is not None:
+            self._detail_sources.append(fixture)
+
+    def _use_fixtures_concurrently(
+        self, fixtures: Sequence[Fixture], max_workers: int | None = None
+    ) -> None:
+        """Use several independent fixtures, setting them up concurrently.
+
+        Cleanups are scheduled in the order the fixtures are supplied. If any
+        fixture fails to set up, the ones that succeeded are still scheduled
+        for cleanup, and the error is raised once all setUp calls have
+        finished: as-is if there is one, wrapped in MultipleExceptions if
+        there are several.
+        """
+        errors = []
+        results = _setup_concurrently(fixtures, max_workers)
+        for fixture, error in zip(fixtures, results):
+            if error is None:
+                self._adopt_fixture(fixture)
+            else:
+                if error[1] is not None:
+                    self._gather_setup_details(fixture, error[1])
+                errors.append(error)
+        if len(errors) == 1:
+            exc = errors[0][1]
+            if exc is not None:
+                raise exc.with_traceback(errors[0][2])
+        elif errors:
+            raise MultipleExceptions(*errors)
+
+    def _gather_setup_details(self, fixture: Fixture, error: BaseException) -> None:
+        """Capture the details of a fixture which failed to set up."""
+        if self._details is not None:
+            _gather_setup_details(fixture, error, self._details)
+
 
 class FunctionFixture(Fixture):
     """An adapter to use function(s) as a Fixture.
@@ -483,20 +562,262 @@ class MethodFixture(Fixture):
             self._reset()
 
 
+def _setup_concurrently(
+    fixtures: Sequence[Fixture], max_workers: int | None = None
+) -> list[_ExcInfo | None]:
+    """Call setUp on fixtures using a pool of threads.
+
+    :param fixtures: The fixtures to set up. They must not depend on each
+        other.
+    :param max_workers: The maximum number of threads to use, or None for the
+        concurrent.futures default.
+    :return: A list with one entry per fixture, in the same order: None if the
+        fixture was set up, or the exc_info of the error raised by its setUp.
+    """
+
+    def setup(fixture: Fixture) -> _ExcInfo | None:
+        try:
+            fixture.setUp()
+        except BaseException:
+            return sys.exc_info()
+        return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Each setUp runs in a copy of this context, so anything
+        # context-local, such as timing, nests correctly.
+        futures = [
+            executor.submit(contextvars.copy_context().run, setup, fixture)
+            for fixture in fixtures
+        ]
+    return [future.result() for future in futures]
+
+
 class CompoundFixture(Fixture):
     """A fixture that combines many fixtures.
 
     :ivar fixtures: The list of fixtures that make up this one. (read only).
     """
 
-    def __init__(self, fixtures: Iterable[Fixture]) -> None:
+    def __init__(
+        self,
+        fixtures: Iterable[Fixture],
+        parallel: bool = False,
+        max_workers: int | None = None,
+    ) -> None:
         """Construct a fixture made of many fixtures.
 
         :param fixtures: An iterable of fixtures.
+        :param parallel: If True, set up all the fixtures at the same time
+            using a pool of threads. This only makes sense when the fixtures
+            are independent of each other, and pays off when their setUp
+            spends most of its time waiting on I/O. Cleanups are still
+            registered in the order the fixtures were supplied, so cleanUp
+            runs them in reverse order, one at a time.
+        :param max_workers: The maximum number of threads to use when parallel
+            is True. Defaults to the concurrent.futures default.
         """
         super().__init__()
         self.fixtures = list(fixtures)
+        self.parallel = parallel
+        self.max_workers = max_workers
 
     def _setUp(self) -> None:
-        for fixture in self.fixtures:
-            self.useFixture(fixture)
+        if not self.parallel:
+            for fixture in self.fixtures:
+                self.useFixture(fixture)
+            return
+        self._use_fixtures_concurrently(self.fixtures, self.max_workers)
+
+
+class AsyncFixture:
+    """A Fixture whose set up and clean up run on an asyncio event loop.
+
+    AsyncFixture follows the Fixture contract, except that setUp, cleanUp,
+    reset and useFixture are coroutines, and it is used with ``async with``
+    rather than ``with``. Concrete fixtures implement ``async def _setUp``.
+
+    Cleanups may be plain callables (addCleanup) or coroutine functions
+    (addAsyncCleanup) and run one at a time in reverse order. Cleanups that
+    are independent of each other can be added with addConcurrentCleanup
+    instead: a run of those is awaited concurrently.
+    """
+
+    _cleanups: AsyncCallMany | None
+    _details: dict[str, Any] | None
+    _detail_sources: list[Fixture | AsyncFixture] | None
+
+    def addCleanup(
+        self, cleanup: Callable[P, Any], *args: P.args, **kwargs: P.kwargs
+    ) -> None:
+        """Add a clean function to be called from cleanUp.
+
+        See Fixture.addCleanup.
+        """
+        if self._cleanups is not None:
+            self._cleanups.push(cleanup, *args, **kwargs)
+
+    def addAsyncCleanup(
+        self,
+        cleanup: Callable[P, Awaitable[Any]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> None:
+        """Add a coroutine function to be called and awaited from cleanUp.
+
+        :param cleanup: A coroutine function to call during cleanUp.
+        :param args: Positional args for cleanup.
+        :param kwargs: Keyword args for cleanup.
+        :return: None
+        """
+        if self._cleanups is not None:
+            self._cleanups.push(cleanup, *args, **kwargs)
+
+    def addConcurrentCleanup(
+        self, cleanup: Callable[P, Any], *args: P.args, **kwargs: P.kwargs
+    ) -> None:
+        """Add a cleanup which may run at the same time as its neighbours.
+
+        Cleanups added consecutively with addConcurrentCleanup are awaited
+        together with asyncio.gather, so they must not depend on each other.
+        Cleanups added any other way are still run in strict reverse order
+        relative to them.
+
+        :param cleanup: A callable or coroutine function to call during
+            cleanUp.
+        :param args: Positional args for cleanup.
+        :param kwargs: Keyword args for cleanup.
+        :return: None
+        """
+        if self._cleanups is not None:
+            self._cleanups.push_concurrent(cleanup, *args, **kwargs)
+
+    def addDetail(self, name: str, content_object: Any) -> None:
+        """Add a detail to the Fixture.
+
+        See Fixture.addDetail.
+        """
+        if self._details is not None:
+            self._details[name] = content_object
+
+    async def cleanUp(self, raise_first: bool = True) -> list[_ExcInfo] | None:
+        """Cleanup the fixture.
+
+        See Fixture.cleanUp.
+        """
+        with timed("cleanUp", self):
+            try:
+                return await self._cleanups(raise_errors=raise_first)  # type: ignore[misc]
+            finally:
+                self._remove_state()
+
+    def _clear_cleanups(self) -> None:
+        """Clean the cleanup queue without running them.
+
+        See Fixture._clear_cleanups.
+        """
+        self._cleanups = AsyncCallMany()
+        self._details = {}
+        self._detail_sources = []
+
+    def _remove_state(self) -> None:
+        """Remove the internal state.
+
+        Called from cleanUp to put the fixture back into a not-ready state.
+        """
+        self._cleanups = None
+        self._details = None
+        self._detail_sources = None
+
+    async def __aenter__(self) -> Self:
+        await self.setUp()
+        return self
+
+    async def __aexit__(
+        self, exc_type: Any, exc_val: Any, exc_tb: Any
+    ) -> Literal[False]:
+        with timed("cleanUp", self):
+            try:
+                if self._cleanups is not None:
+                    await self._cleanups()
+            finally:
+                self._remove_state()
+        return False  # propagate exceptions from the with body.
+
+    def getDetails(self) -> dict[str, Any]:
+        """Get the current details registered with the fixture.
+
+        See Fixture.getDetails.
+        """
+        result = dict(self._details)  # type: ignore[arg-type]
+        if self._detail_sources is not None:
+            for source in self._detail_sources:
+                combine_details(source.getDetails(), result)
+        return result
+
+    async def setUp(self) -> None:
+        """Prepare the Fixture for use.
+
+        This should not be overridden. Concrete fixtures should implement
+        _setUp. Errors are handled as described in Fixture.setUp.
+        """
+        with timed("setUp", self):
+            self._clear_cleanups()
+            try:
+                await self._setUp()
+            except BaseException:
+                err: _ExcInfo = sys.exc_info()
+                details: dict[str, Any] = {}
+                if gather_details is not None:
+                    # Materialise all details since we're about to cleanup.
+                    gather_details(self.getDetails(), details)
+                else:
+                    details = self.getDetails()
+                cleanup_errors = await self.cleanUp(raise_first=False)
+                _raise_setup_failure(err, details, cleanup_errors)
+
+    async def _setUp(self) -> None:
+        """Template method for subclasses to override.
+
+        See Fixture._setUp.
+        """
+
+    async def reset(self) -> None:
+        """Reset a setUp Fixture to the 'just setUp' state again.
+
+        See Fixture.reset.
+        """
+        with timed("reset", self):
+            await self.cleanUp()
+            await self.setUp()
+
+    async def useFixture(self, fixture: AT) -> AT:
+        """Use another fixture, which may be a Fixture or an AsyncFixture.
+
+        The fixture will be set up, and its cleanUp scheduled with addCleanup
+        (or addAsyncCleanup for an AsyncFixture). A plain Fixture is set up
+        directly on the event loop thread.
+
+        :param fixture: The fixture to use.
+        :return: The fixture, after setting it up and scheduling a cleanup for
+           it.
+        :raises: Any errors raised by the fixture's setUp method.
+        """
+        try:
+            if isinstance(fixture, AsyncFixture):
+                await fixture.setUp()
+            else:
+                fixture.setUp()
+        except BaseException as e:
+            if self._details is not None:
+                _gather_setup_details(fixture, e, self._details)
+            raise
+        else:
+            if isinstance(fixture, AsyncFixture):
+                self.addAsyncCleanup(fixture.cleanUp)
+            else:
+                self.addCleanup(fixture.cleanUp)
+            # Calls to getDetails while this fixture is setup will return
+            # details from the child fixture.
+            if self._detail_sources is not None:
+                self._detail_sources.append(fixture)
+            return fixture
@@ -0,0 +1,127 @@
+#  fixtures: Fixtures with cleanups for testing and convenience.
+#
+# Copyright (c) 2010, Robert Collins <robertc@robertcollins.net>
+#
+# Licensed under either the Apache License, Version 2.0 or the BSD 3-clause
+# license at the users choice. A copy of both licenses are available in the
+# project source as Apache-2.0 and BSD. You may not use this file except in
+# compliance with one of these two licences.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under these licenses is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# license you chose for the specific language governing permissions and
+# limitations under that license.
+
+"""Declarative dependencies between fixtures."""
+
+from __future__ import annotations
+
+__all__ = [
+    "FixtureGraph",
+]
+
+from collections.abc import Callable, Iterable, Mapping
+
+from fixtures.fixture import Fixture
+
+
+def _requirements(fixture: Fixture) -> Mapping[str, Callable[[], Fixture]]:
+    return getattr(type(fixture), "requires", {})
+
+
+class FixtureGraph(Fixture):
+    """Set up fixtures along with the fixtures they declare they depend on.
+
+    A fixture class declares its dependencies with a ``requires`` class
+    attribute, mapping an attribute name to a factory (usually a Fixture
+    class) for the fixture it needs:
+
+    >>> import fixtures
+    >>> class Database(fixtures.Fixture):
+    ...     requires = {"tempdir": fixtures.TempDir}
+    ...     tempdir: fixtures.TempDir
+    ...
+    ...     def _setUp(self):
+    ...         self.url = "sqlite:///" + self.tempdir.join("db.sqlite")
+
+    Before anything is set up the dependencies are resolved and assigned to
+    those attributes. Each factory is called at most once per graph, so every
+    fixture that requires the same factory shares one instance, and a fixture
+    passed to FixtureGraph directly is used to satisfy requirements for its
+    own class.
+
+    Fixtures are then set up one level at a time, where a fixture's level is
+    one more than the highest level of the fixtures it requires. All the
+    fixtures in a level are set up at the same time on a pool of threads.
+    Cleanups are registered in level order, so cleanUp tears fixtures down in
+    reverse dependency order.
+
+    :ivar fixtures: The fixtures that were requested. (read only).
+    :ivar levels: After setUp, the list of levels, each a list of the fixtures
+        set up together, starting with those that have no dependencies.
+    """
+
+    levels: list[list[Fixture]]
+
+    def __init__(
+        self, fixtures: Iterable[Fixture], max_workers: int | None = None
+    ) -> None:
+        """Create a FixtureGraph.
+
+        :param fixtures: The fixtures to set up. Their dependencies are
+            created as needed.
+        :param max_workers: The maximum number of threads used to set up a
+            level. Defaults to the concurrent.futures default.
+        """
+        super().__init__()
+        self.fixtures = list(fixtures)
+        self.max_workers = max_workers
+
+    def _resolve(self) -> list[list[Fixture]]:
+        """Create and inject dependencies, and group fixtures into levels.
+
+        :raises ValueError: If the dependencies contain a cycle.
+        """
+        shared: dict[Callable[[], Fixture], Fixture] = {}
+        for fixture in self.fixtures:
+            shared.setdefault(type(fixture), fixture)
+        depths: dict[int, int] = {}
+        in_progress: list[Fixture] = []
+        levels: list[list[Fixture]] = []
+
+        def visit(fixture: Fixture) -> int:
+            if id(fixture) in depths:
+                return depths[id(fixture)]
+            if any(fixture is pending for pending in in_progress):
+                cycle = in_progress[in_progress.index(fixture) :] + [fixture]
+                raise ValueError(
+                    "Fixture dependency cycle: "
+                    + " -> ".join(type(f).__name__ for f in cycle)
+                )
+            in_progress.append(fixture)
+            depth = 0
+            for name, factory in _requirements(fixture).items():
+                dependency = shared.get(factory)
+                if dependency is None:
+                    dependency = shared[factory] = factory()
+                setattr(fixture, name, dependency)
+                depth = max(depth, visit(dependency) + 1)
+            in_progress.pop()
+            depths[id(fixture)] = depth
+            while len(levels) <= depth:
+                levels.append([])
+            levels[depth].append(fixture)
+            return depth
+
+        for fixture in self.fixtures:
+            visit(fixture)
+        return levels
+
+    def _setUp(self) -> None:
+        self.levels = self._resolve()
+        for level in self.levels:
+            if len(level) == 1:
+                self.useFixture(level[0])
+            else:
+                self._use_fixtures_concurrently(level, self.max_workers)
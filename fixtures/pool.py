@@ -0,0 +1,193 @@
+#  fixtures: Fixtures with cleanups for testing and convenience.
+#
+# Copyright (c) 2010, Robert Collins <robertc@robertcollins.net>
+#
+# Licensed under either the Apache License, Version 2.0 or the BSD 3-clause
+# license at the users choice. A copy of both licenses are available in the
+# project source as Apache-2.0 and BSD. You may not use this file except in
+# compliance with one of these two licences.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under these licenses is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# license you chose for the specific language governing permissions and
+# limitations under that license.
+
+"""Reuse of expensive fixtures between tests."""
+
+from __future__ import annotations
+
+__all__ = [
+    "FixturePool",
+    "PooledFixture",
+]
+
+import atexit
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+from fixtures.callmany import CallMany
+from fixtures.fixture import Fixture
+
+T = TypeVar("T", bound=Fixture)
+
+_Key = tuple[Callable[..., Any], tuple[Hashable, ...], tuple[tuple[str, Hashable], ...]]
+
+
+class FixturePool:
+    """A pool of set up fixtures, reset between uses instead of recreated.
+
+    Fixtures are keyed by the factory and the arguments used to create them.
+    Asking for a fixture hands out an idle one with the same key if there is
+    one, and otherwise creates and sets up a new one. When a fixture is given
+    back, its reset() method is called and it becomes idle again, so a fixture
+    with an optimised reset() is only ever set up once.
+
+    At most max_size idle fixtures are kept: beyond that the least recently
+    returned ones are cleaned up. Everything still idle is cleaned up by
+    close(), which is called automatically at interpreter exit.
+
+    The pool is thread safe, but a fixture is only ever handed to one user at
+    a time.
+    """
+
+    def __init__(self, max_size: int = 16) -> None:
+        """Create a FixturePool.
+
+        :param max_size: The maximum number of idle fixtures to keep.
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._closed = False
+        # Idle fixtures by key, and all idle fixtures (by id) in least
+        # recently released first order.
+        self._idle: dict[_Key, list[Fixture]] = {}
+        self._lru: OrderedDict[int, tuple[_Key, Fixture]] = OrderedDict()
+        # The keys of the fixtures currently handed out.
+        self._in_use: dict[int, _Key] = {}
+        atexit.register(self.close)
+
+    def get(
+        self, factory: Callable[..., T], *args: Hashable, **kwargs: Hashable
+    ) -> PooledFixture[T]:
+        """Return a Fixture which takes a fixture from the pool when set up.
+
+        This is the usual way to use a pool from a test:
+
+        >>> pool = FixturePool()
+        >>> tempdir = self.useFixture(pool.get(TempDir)).fixture
+
+        :param factory: A callable (usually a Fixture class) to create a new
+            fixture, if there is no idle one.
+        :param args: Positional arguments for factory. Must be hashable.
+        :param kwargs: Keyword arguments for factory. Must be hashable.
+        :return: A PooledFixture.
+        """
+        return PooledFixture(self, factory, args, kwargs)
+
+    def acquire(
+        self, factory: Callable[..., T], *args: Hashable, **kwargs: Hashable
+    ) -> T:
+        """Take a set up fixture from the pool, creating it if needed.
+
+        It must be given back with release() when finished with.
+
+        :param factory: A callable (usually a Fixture class) to create a new
+            fixture, if there is no idle one.
+        :param args: Positional arguments for factory. Must be hashable.
+        :param kwargs: Keyword arguments for factory. Must be hashable.
+        :return: A fixture which has been set up.
+        :raises TypeError: If the arguments are not hashable.
+        """
+        key: _Key = (factory, args, tuple(sorted(kwargs.items())))
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                fixture = idle.pop()
+                del self._lru[id(fixture)]
+                self._in_use[id(fixture)] = key
+                return fixture  # type: ignore[return-value]
+        fixture = factory(*args, **kwargs)
+        fixture.setUp()
+        with self._lock:
+            self._in_use[id(fixture)] = key
+        return fixture
+
+    def release(self, fixture: Fixture) -> None:
+        """Give back a fixture obtained with acquire().
+
+        The fixture is reset and kept for reuse. If the pool has been closed,
+        it is cleaned up instead.
+
+        :raises: Any error from resetting the fixture, which is then dropped
+            from the pool.
+        """
+        with self._lock:
+            key = self._in_use.pop(id(fixture))
+            closed = self._closed
+        if closed:
+            fixture.cleanUp()
+            return
+        fixture.reset()
+        evicted = []
+        with self._lock:
+            self._idle.setdefault(key, []).append(fixture)
+            self._lru[id(fixture)] = (key, fixture)
+            while len(self._lru) > self.max_size:
+                _, (old_key, old_fixture) = self._lru.popitem(last=False)
+                self._idle[old_key].remove(old_fixture)
+                evicted.append(old_fixture)
+        self._cleanup(evicted)
+
+    def close(self) -> None:
+        """Clean up all idle fixtures and stop pooling.
+
+        Fixtures that are handed out at the time are cleaned up when they are
+        released.
+        """
+        with self._lock:
+            self._closed = True
+            idle = [fixture for _, fixture in self._lru.values()]
+            self._idle.clear()
+            self._lru.clear()
+        atexit.unregister(self.close)
+        self._cleanup(idle)
+
+    def _cleanup(self, fixtures: list[Fixture]) -> None:
+        """Clean up fixtures, reporting errors as CallMany does."""
+        cleanups = CallMany()
+        for fixture in reversed(fixtures):
+            cleanups.push(fixture.cleanUp)
+        cleanups()
+
+
+class PooledFixture(Fixture, Generic[T]):
+    """A fixture which borrows a set up fixture from a FixturePool.
+
+    Created by FixturePool.get.
+
+    :ivar fixture: The borrowed fixture, while this fixture is set up.
+    """
+
+    fixture: T
+
+    def __init__(
+        self,
+        pool: FixturePool,
+        factory: Callable[..., T],
+        args: tuple[Hashable, ...],
+        kwargs: dict[str, Hashable],
+    ) -> None:
+        super().__init__()
+        self.pool = pool
+        self._factory = factory
+        self._args = args
+        self._kwargs = kwargs
+
+    def _setUp(self) -> None:
+        self.fixture = self.pool.acquire(self._factory, *self._args, **self._kwargs)
+        self.addCleanup(self.pool.release, self.fixture)
+        if self._detail_sources is not None:
+            self._detail_sources.append(self.fixture)
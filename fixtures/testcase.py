@@ -18,6 +18,8 @@ __all__ = [
 ]
 
 import unittest
+import weakref
+from collections.abc import Callable
 from typing import TypeVar
 
 from fixtures.fixture import Fixture
@@ -27,6 +29,50 @@ gather_details = fixtures.fixture.gather_details
 
 T = TypeVar("T", bound=Fixture)
 
+# Shared fixtures for useModuleFixture: module name -> factory -> entry.
+_module_fixtures: dict[str, dict[Callable[[], Fixture], "_SharedFixture"]] = {}
+
+
+class _SharedFixture:
+    """A fixture shared between tests, and the test that last used it."""
+
+    def __init__(self, fixture: Fixture) -> None:
+        self.fixture = fixture
+        self.user: weakref.ref[unittest.TestCase] | None = None
+
+
+def _share_fixture(
+    test: unittest.TestCase,
+    shared: dict[Callable[[], Fixture], _SharedFixture],
+    factory: Callable[[], T],
+    reset: bool,
+) -> tuple[T, bool]:
+    """Find or create the shared fixture for factory.
+
+    :return: The fixture, and whether it was created by this call (in which
+        case the caller needs to arrange for it to be cleaned up).
+    """
+    entry = shared.get(factory)
+    if entry is None:
+        fixture = factory()
+        fixture.setUp()
+        entry = shared[factory] = _SharedFixture(fixture)
+        entry.user = weakref.ref(test)
+        return fixture, True
+    if entry.user is None or entry.user() is not test:
+        if reset:
+            entry.fixture.reset()
+        entry.user = weakref.ref(test)
+    return entry.fixture, False  # type: ignore[return-value]
+
+
+def _unshare_fixture(
+    shared: dict[Callable[[], Fixture], _SharedFixture],
+    factory: Callable[[], Fixture],
+) -> None:
+    """Forget about and clean up a shared fixture."""
+    shared.pop(factory).fixture.cleanUp()
+
 
 class TestWithFixtures(unittest.TestCase):
     """A TestCase with a helper function to use fixtures.
@@ -72,3 +118,52 @@ class TestWithFixtures(unittest.TestCase):
 
                 self.addCleanup(cleanup_details)
             return fixture
+
+    def useClassFixture(self, factory: Callable[[], T], reset: bool = False) -> T:
+        """Use a fixture shared by all the tests in this test case class.
+
+        The first time this is called in a class, factory is called to create
+        the fixture, which is set up and scheduled for cleanup with
+        addClassCleanup, so it is cleaned up after the last test of the class.
+        Other tests of the class calling this with the same factory get the
+        same instance.
+
+        :param factory: A callable (usually a Fixture class) returning the
+            fixture. It identifies the fixture: tests must pass the same
+            object to share the fixture.
+        :param reset: If True, the fixture is reset before being handed to a
+            test other than the one that last used it, so each test starts
+            from the 'just setUp' state.
+        :return: The fixture, which has been set up.
+        """
+        cls = type(self)
+        # Look in the class's own dict: subclasses get their own fixtures.
+        shared = cls.__dict__.get("_fixtures_class_fixtures")
+        if shared is None:
+            shared = {}
+            cls._fixtures_class_fixtures = shared  # type: ignore[attr-defined]
+        fixture, created = _share_fixture(self, shared, factory, reset)
+        if created:
+            cls.addClassCleanup(_unshare_fixture, shared, factory)
+        return fixture
+
+    def useModuleFixture(self, factory: Callable[[], T], reset: bool = False) -> T:
+        """Use a fixture shared by all the tests in this test's module.
+
+        This works like useClassFixture, except that the fixture is shared by
+        every test case class in the module that defined this test case, and
+        is cleaned up with unittest.addModuleCleanup. Not all test runners
+        run module cleanups; the standard unittest runner does.
+
+        :param factory: A callable (usually a Fixture class) returning the
+            fixture. It identifies the fixture: tests must pass the same
+            object to share the fixture.
+        :param reset: If True, the fixture is reset before being handed to a
+            test other than the one that last used it.
+        :return: The fixture, which has been set up.
+        """
+        shared = _module_fixtures.setdefault(type(self).__module__, {})
+        fixture, created = _share_fixture(self, shared, factory, reset)
+        if created:
+            unittest.addModuleCleanup(_unshare_fixture, shared, factory)
+        return fixture
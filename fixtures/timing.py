@@ -0,0 +1,184 @@
+#  fixtures: Fixtures with cleanups for testing and convenience.
+#
+# Copyright (c) 2010, Robert Collins <robertc@robertcollins.net>
+#
+# Licensed under either the Apache License, Version 2.0 or the BSD 3-clause
+# license at the users choice. A copy of both licenses are available in the
+# project source as Apache-2.0 and BSD. You may not use this file except in
+# compliance with one of these two licences.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under these licenses is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# license you chose for the specific language governing permissions and
+# limitations under that license.
+
+"""Timing instrumentation for fixture set up and clean up.
+
+Instrumentation is off until a listener is registered with add_listener (the
+TimingCollector fixture does this for you). While it is on, every
+Fixture.setUp, cleanUp and reset, and every function called by a CallMany, is
+timed. The timings nest the way the calls do, so the Timing for setting up a
+fixture has a child for each fixture it used, and so on down.
+
+Each fixture keeps the timings of its own operations in its ``timings``
+attribute, and each outermost Timing is passed to every listener once it
+finishes.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "Timing",
+    "add_listener",
+    "remove_listener",
+]
+
+import contextlib
+import contextvars
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+
+class Timing:
+    """The duration of one operation, and of the operations nested inside it.
+
+    :ivar operation: What was timed: "setUp", "cleanUp" or "reset" for a
+        fixture, or "cleanup" for a function called by a CallMany.
+    :ivar name: The qualified name of the fixture class, or of the function.
+    :ivar fixture_class: The class of the fixture, or None for a function.
+    :ivar depth: How deeply nested the operation is; 0 for an outermost one.
+    :ivar start: The time.monotonic() value when the operation started.
+    :ivar duration: The number of seconds the operation took, or None if it
+        has not finished.
+    :ivar children: The Timings of the operations nested inside this one, in
+        the order they started.
+    """
+
+    __slots__ = (
+        "_fixture_id",
+        "children",
+        "depth",
+        "duration",
+        "fixture_class",
+        "name",
+        "operation",
+        "start",
+    )
+
+    def __init__(
+        self,
+        operation: str,
+        name: str,
+        fixture_class: type | None = None,
+        depth: int = 0,
+    ) -> None:
+        self.operation = operation
+        self.name = name
+        self.fixture_class = fixture_class
+        self.depth = depth
+        self.start = time.monotonic()
+        self.duration: float | None = None
+        self.children: list[Timing] = []
+        self._fixture_id: int | None = None
+
+    def __repr__(self) -> str:
+        return f"<Timing {self.operation} {self.name} {self.duration}>"
+
+    def walk(self) -> Iterator[Timing]:
+        """Yield this Timing and then all its descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+_listeners: list[Callable[[Timing], Any]] = []
+_current: contextvars.ContextVar[Timing | None] = contextvars.ContextVar(
+    "fixtures.timing.current", default=None
+)
+_untimed: contextlib.AbstractContextManager[None] = contextlib.nullcontext()
+
+
+def add_listener(listener: Callable[[Timing], Any]) -> None:
+    """Turn on instrumentation, calling listener with each outermost Timing.
+
+    :param listener: A callable taking a finished Timing. It is called in the
+        thread that performed the operation.
+    """
+    _listeners.append(listener)
+
+
+def remove_listener(listener: Callable[[Timing], Any]) -> None:
+    """Stop calling listener. When no listeners remain, timing stops.
+
+    :raises ValueError: If listener was not registered.
+    """
+    _listeners.remove(listener)
+
+
+class _Timer:
+    """Context manager timing one operation."""
+
+    def __init__(self, operation: str, name: str, fixture: Any) -> None:
+        self._operation = operation
+        self._name = name
+        self._fixture = fixture
+
+    def __enter__(self) -> None:
+        parent = _current.get()
+        fixture = self._fixture
+        fixture_class = None if fixture is None else type(fixture)
+        timing = Timing(
+            self._operation,
+            self._name,
+            fixture_class,
+            0 if parent is None else parent.depth + 1,
+        )
+        if parent is not None:
+            parent.children.append(timing)
+        if fixture is not None:
+            timing._fixture_id = id(fixture)
+            # Operations that are part of a reset of the same fixture are
+            # recorded under the reset rather than directly. A setUp (that
+            # isn't part of a reset) starts a new record.
+            in_reset = (
+                parent is not None
+                and parent.operation == "reset"
+                and parent._fixture_id == id(fixture)
+            )
+            if not in_reset:
+                if self._operation == "setUp" or not hasattr(fixture, "timings"):
+                    fixture.timings = []
+                fixture.timings.append(timing)
+        self._timing = timing
+        self._token = _current.set(timing)
+        # Measure from as late as possible.
+        timing.start = time.monotonic()
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        timing = self._timing
+        timing.duration = time.monotonic() - timing.start
+        _current.reset(self._token)
+        if timing.depth == 0:
+            for listener in list(_listeners):
+                listener(timing)
+
+
+def timed(operation: str, fixture: Any) -> contextlib.AbstractContextManager[None]:
+    """Return a context manager timing an operation on a fixture.
+
+    This is cheap when instrumentation is off.
+    """
+    if not _listeners:
+        return _untimed
+    name = type(fixture).__qualname__
+    return _Timer(operation, name, fixture)
+
+
+def timed_call(cleanup: Callable[..., Any]) -> contextlib.AbstractContextManager[None]:
+    """Return a context manager timing a call of a CallMany function."""
+    if not _listeners:
+        return _untimed
+    name = getattr(cleanup, "__qualname__", None) or repr(cleanup)
+    return _Timer("cleanup", name, None)
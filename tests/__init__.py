@@ -31,7 +31,10 @@ def load_tests(
     test_modules = [
         "callmany",
         "fixture",
+        "graph",
+        "pool",
         "testcase",
+        "timing",
     ]
     prefix = "tests.test_"
     test_mod_names = [prefix + test_module for test_module in test_modules]
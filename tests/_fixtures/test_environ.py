@@ -17,7 +17,12 @@ import os
 
 import testtools
 
-from fixtures import EnvironmentVariable, TestWithFixtures
+from fixtures import (
+    EnvironmentVariable,
+    EnvironmentVariables,
+    IsolatedEnvironment,
+    TestWithFixtures,
+)
 
 
 class TestEnvironmentVariable(testtools.TestCase, TestWithFixtures):
@@ -72,3 +77,69 @@ class TestEnvironmentVariable(testtools.TestCase, TestWithFixtures):
         with fixture:
             os.environ["FIXTURES_TEST_VAR"] = "quux"
         self.assertEqual("bar", os.environ.get("FIXTURES_TEST_VAR"))
+
+
+class TestEnvironmentVariables(testtools.TestCase, TestWithFixtures):
+    def setUp(self):
+        super().setUp()
+        self.useFixture(EnvironmentVariable("FIXTURES_TEST_A", "a"))
+        self.useFixture(EnvironmentVariable("FIXTURES_TEST_B", "b"))
+        self.useFixture(EnvironmentVariable("FIXTURES_TEST_C"))
+
+    def test_sets_and_deletes(self):
+        self.useFixture(
+            EnvironmentVariables(
+                {
+                    "FIXTURES_TEST_A": None,
+                    "FIXTURES_TEST_B": "x",
+                    "FIXTURES_TEST_C": "y",
+                }
+            )
+        )
+        self.assertEqual(None, os.environ.get("FIXTURES_TEST_A"))
+        self.assertEqual("x", os.environ.get("FIXTURES_TEST_B"))
+        self.assertEqual("y", os.environ.get("FIXTURES_TEST_C"))
+
+    def test_restores(self):
+        fixture = EnvironmentVariables(
+            {"FIXTURES_TEST_A": None, "FIXTURES_TEST_B": "x", "FIXTURES_TEST_C": "y"}
+        )
+        with fixture:
+            os.environ["FIXTURES_TEST_A"] = "changed"
+            del os.environ["FIXTURES_TEST_B"]
+        self.assertEqual("a", os.environ.get("FIXTURES_TEST_A"))
+        self.assertEqual("b", os.environ.get("FIXTURES_TEST_B"))
+        self.assertEqual(None, os.environ.get("FIXTURES_TEST_C"))
+
+    def test_deleting_missing_variable(self):
+        with EnvironmentVariables({"FIXTURES_TEST_C": None}):
+            self.assertEqual(None, os.environ.get("FIXTURES_TEST_C"))
+        self.assertEqual(None, os.environ.get("FIXTURES_TEST_C"))
+
+
+class TestIsolatedEnvironment(testtools.TestCase, TestWithFixtures):
+    def setUp(self):
+        super().setUp()
+        self.useFixture(
+            EnvironmentVariables(
+                {
+                    "FIXTURES_TEST_A": "a",
+                    "FIXTURES_TEST_B": "b",
+                    "FIXTURES_TEST_C": None,
+                }
+            )
+        )
+
+    def test_restores(self):
+        before = dict(os.environ)
+        with IsolatedEnvironment():
+            os.environ["FIXTURES_TEST_A"] = "changed"
+            del os.environ["FIXTURES_TEST_B"]
+            os.environ["FIXTURES_TEST_C"] = "added"
+        self.assertEqual(before, dict(os.environ))
+
+    def test_allowlist(self):
+        before = dict(os.environ)
+        with IsolatedEnvironment(allowlist=["FIXTURES_TEST_A", "FIXTURES_TEST_C"]):
+            self.assertEqual({"FIXTURES_TEST_A": "a"}, dict(os.environ))
+        self.assertEqual(before, dict(os.environ))
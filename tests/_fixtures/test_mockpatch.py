@@ -13,6 +13,9 @@
 #    under the License.
 
 
+import sys
+import types
+
 import testtools
 from unittest import mock
 
@@ -68,3 +71,145 @@ class TestMockPatchObject(testtools.TestCase):
         self.useFixture(MockPatchObject(Foo, "bar"))
         instance = Foo()
         self.assertIsInstance(instance.bar(), mock.MagicMock)
+
+
+class Heavy:
+    limit = 3
+
+    def method(self, arg):
+        return arg
+
+    @staticmethod
+    def static(arg):
+        return arg
+
+
+class TestCacheAutospec(testtools.TestCase):
+    def test_reuses_mock(self):
+        with MockPatch(f"{__name__}.Heavy", cache_autospec=True, autospec=True) as f:
+            first = f.mock
+            first.return_value.method.return_value = 5
+            first.static.side_effect = ValueError
+            self.assertEqual(5, Heavy().method(1))
+        with MockPatchObject(
+            sys.modules[__name__], "Heavy", cache_autospec=True, autospec=True
+        ) as f:
+            self.assertIs(first, f.mock)
+            self.assertIs(first, Heavy)
+            self.assertEqual(0, first.call_count)
+            self.assertIsInstance(Heavy().method(1), mock.MagicMock)
+            self.assertIsInstance(Heavy.static(1), mock.MagicMock)
+            # Still autospecced.
+            self.assertRaises(TypeError, Heavy().method)
+            self.assertRaises(AttributeError, getattr, Heavy(), "missing")
+        self.assertNotIsInstance(Heavy, mock.Mock)
+
+    def test_calls_kept_after_cleanup(self):
+        with MockPatch(f"{__name__}.Heavy", cache_autospec=True, autospec=True) as f:
+            Heavy().method(1)
+        f.mock.assert_called_once_with()
+        f.mock.return_value.method.assert_called_once_with(1)
+        first = f.mock
+        with MockPatch(f"{__name__}.Heavy", cache_autospec=True, autospec=True) as f:
+            self.assertIs(first, f.mock)
+            first.assert_not_called()
+
+    def test_configuration_not_shared(self):
+        with MockPatch(f"{__name__}.Heavy", cache_autospec=True, autospec=True) as f:
+            first = f.mock
+            f.mock.return_value.limit = 99
+        with MockPatch(f"{__name__}.Heavy", cache_autospec=True, autospec=True) as f:
+            self.assertIsNot(first, f.mock)
+            self.assertIsInstance(Heavy().limit, mock.NonCallableMagicMock)
+        with MockPatch(f"{__name__}.Heavy", cache_autospec=True, autospec=True) as f:
+            second = f.mock
+            f.mock.method.extra = 1
+        with MockPatch(f"{__name__}.Heavy", cache_autospec=True, autospec=True) as f:
+            self.assertIsNot(second, f.mock)
+            self.assertFalse(hasattr(Heavy.method, "extra"))
+
+    def test_in_use_not_shared(self):
+        holder = types.SimpleNamespace(Heavy=Heavy)
+        with MockPatch(f"{__name__}.Heavy", cache_autospec=True, autospec=True) as f:
+            with MockPatchObject(
+                holder, "Heavy", cache_autospec=True, autospec=True
+            ) as g:
+                self.assertIsNot(f.mock, g.mock)
+
+    def test_functions_not_cached(self):
+        with MockPatch(
+            f"{__name__}.mocking_bar", cache_autospec=True, autospec=True
+        ) as f:
+            first = f.mock
+        with MockPatch(
+            f"{__name__}.mocking_bar", cache_autospec=True, autospec=True
+        ) as f:
+            self.assertIsNot(first, f.mock)
+
+    def test_requires_autospec(self):
+        self.assertRaises(
+            TypeError, MockPatch, f"{__name__}.Heavy", cache_autospec=True
+        )
+        self.assertRaises(
+            TypeError,
+            MockPatchObject,
+            Foo,
+            "bar",
+            mocking_bar,
+            cache_autospec=True,
+            autospec=True,
+        )
+
+
+class TestLazy(testtools.TestCase):
+    def test_not_made_until_used(self):
+        fixture = self.useFixture(MockPatchObject(Foo, "bar", lazy=True))
+        proxy = Foo.__dict__["bar"]
+        self.assertIsNone(object.__getattribute__(proxy, "_fixtures_mock"))
+        Foo.bar.return_value = 3
+        self.assertEqual(3, Foo().bar())
+        self.assertIsInstance(fixture.mock, mock.MagicMock)
+        fixture.mock.assert_called_once_with()
+
+    def test_mock_attribute_materialises(self):
+        fixture = self.useFixture(
+            MockPatch(f"{__name__}.mocking_bar", lazy=True, return_value=4)
+        )
+        self.assertIsInstance(fixture.mock, mock.MagicMock)
+        self.assertEqual(4, mocking_bar(None))
+        self.assertEqual(1, fixture.mock.call_count)
+
+    def test_magic_methods(self):
+        self.useFixture(MockPatchObject(Foo, "bar", lazy=True))
+        Foo.bar.__len__.return_value = 2
+        self.assertEqual(2, len(Foo.bar))
+        self.assertIsInstance(Foo.bar, mock.MagicMock)
+        with Foo.bar as entered:
+            self.assertIs(Foo.bar.__enter__.return_value, entered)
+
+    def test_numeric_magic_methods(self):
+        self.useFixture(MockPatchObject(Foo, "bar", lazy=True))
+        self.assertIsInstance(Foo.bar + 1, mock.MagicMock)
+        Foo.bar.__add__.return_value = 3
+        self.assertEqual(3, Foo.bar + 1)
+        self.assertIs(Foo.bar.__neg__.return_value, -Foo.bar)
+
+    def test_unused_restored(self):
+        with MockPatchObject(Foo, "bar", lazy=True):
+            pass
+        foo = Foo()
+        self.assertIs(foo, foo.bar())
+
+    def test_create(self):
+        with MockPatchObject(Foo, "baz", lazy=True, create=True):
+            self.assertTrue(hasattr(Foo, "baz"))
+        self.assertFalse(hasattr(Foo, "baz"))
+
+    def test_incompatible_arguments(self):
+        self.assertRaises(
+            TypeError, MockPatchObject, Foo, "bar", mocking_bar, lazy=True
+        )
+        for name in ("autospec", "spec", "spec_set", "new_callable"):
+            self.assertRaises(
+                TypeError, MockPatch, f"{__name__}.Foo", lazy=True, **{name: True}
+            )
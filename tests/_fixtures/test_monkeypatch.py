@@ -13,13 +13,23 @@
 # license you chose for the specific language governing permissions and
 # limitations under that license.
 
+import builtins
+import contextvars
 import functools
 import sys
+import threading
+import types
 
 import testtools
 from testtools.matchers import Is
 
-from fixtures import MonkeyPatch, TestWithFixtures
+from fixtures import (
+    MonkeyPatch,
+    MonkeyPatchSet,
+    MultipleExceptions,
+    TestWithFixtures,
+)
+from fixtures._fixtures.monkeypatch import _resolve
 
 reference = 23
 
@@ -476,3 +486,203 @@ class TestMonkeyPatch(testtools.TestCase, TestWithFixtures):
         # The method address changes with each instantiation of C, and method
         # equivalence just tests that. Compare the code objects instead.
         self.assertEqual(oldmethod_inst.__code__, C().foo.__code__)
+
+
+class TestMonkeyPatchSet(testtools.TestCase, TestWithFixtures):
+    def test_patch_and_restore(self):
+        def new_foo(self, arg):
+            return arg * 2
+
+        fixture = MonkeyPatchSet(
+            {
+                "tests._fixtures.test_monkeypatch.reference": 45,
+                "tests._fixtures.test_monkeypatch.new_attr": True,
+                "tests._fixtures.test_monkeypatch.C.foo": new_foo,
+                "tests._fixtures.test_monkeypatch.C.foo_static": lambda: "static",
+                "tests._fixtures.test_monkeypatch.C.foo_cls": MonkeyPatch.delete,
+                "tests._fixtures.test_monkeypatch.C.missing": MonkeyPatch.delete,
+            }
+        )
+        old_static = C.__dict__["foo_static"]
+        with fixture:
+            self.assertEqual(45, reference)
+            self.assertEqual(True, new_attr)  # noqa: F821
+            self.assertEqual(4, C().foo(2))
+            self.assertEqual("static", C().foo_static())
+            self.assertFalse(hasattr(C, "foo_cls"))
+        self.assertEqual(23, reference)
+        self.assertFalse("new_attr" in globals())
+        self.assertEqual(2, C().foo(2))
+        self.assertIs(old_static, C.__dict__["foo_static"])
+        self.assertTrue(hasattr(C, "foo_cls"))
+        self.assertFalse(hasattr(C, "missing"))
+
+    def test_bad_name_patches_nothing(self):
+        fixture = MonkeyPatchSet(
+            {
+                "tests._fixtures.test_monkeypatch.reference": 45,
+                "tests._fixtures.test_monkeypatch.Missing.attr": 1,
+            }
+        )
+        self.assertRaises(MultipleExceptions, fixture.setUp)
+        self.assertEqual(23, reference)
+
+
+def call_reference_function():
+    return reference_function()
+
+
+def reference_function():
+    return "original"
+
+
+class TestContextLocalMonkeyPatch(testtools.TestCase, TestWithFixtures):
+    def in_thread(self, fn):
+        result = []
+        thread = threading.Thread(target=lambda: result.append(fn()))
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def test_module_function(self):
+        original = reference_function
+        with MonkeyPatch(
+            "tests._fixtures.test_monkeypatch.reference_function",
+            lambda: "patched",
+            context_local=True,
+        ):
+            self.assertEqual("patched", call_reference_function())
+            self.assertEqual("original", self.in_thread(call_reference_function))
+            context = contextvars.copy_context()
+            self.assertEqual(
+                "patched",
+                self.in_thread(lambda: context.run(call_reference_function)),
+            )
+        self.assertIs(original, reference_function)
+
+    def test_concurrent_threads(self):
+        barrier = threading.Barrier(2)
+
+        def patch_and_call(value):
+            with MonkeyPatch(
+                "tests._fixtures.test_monkeypatch.reference_function",
+                lambda: value,
+                context_local=True,
+            ):
+                # Both patches are in place at once.
+                barrier.wait()
+                result = call_reference_function()
+                barrier.wait()
+            return result
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda v=v: results.append(patch_and_call(v)))
+            for v in ("one", "two")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(["one", "two"], sorted(results))
+        self.assertEqual("original", call_reference_function())
+
+    def test_class_methods(self):
+        old_static = C.__dict__["foo_static"]
+        old_cls = C.__dict__["foo_cls"]
+        with MonkeyPatch(
+            "tests._fixtures.test_monkeypatch.C.foo",
+            lambda self, arg: (self, arg),
+            context_local=True,
+        ):
+            with MonkeyPatch(
+                "tests._fixtures.test_monkeypatch.C.foo_static",
+                lambda: "static",
+                context_local=True,
+            ):
+                with MonkeyPatch(
+                    "tests._fixtures.test_monkeypatch.C.foo_cls",
+                    lambda cls: cls,
+                    context_local=True,
+                ):
+                    c = C()
+                    self.assertEqual((c, 1), c.foo(1))
+                    self.assertEqual("static", C.foo_static())
+                    self.assertIs(C, C.foo_cls())
+                    self.assertEqual(1, self.in_thread(lambda: C().foo(1)))
+                    self.assertIsNone(self.in_thread(lambda: C.foo_static()))
+        self.assertIs(old_static, C.__dict__["foo_static"])
+        self.assertIs(old_cls, C.__dict__["foo_cls"])
+
+    def test_nested_and_delete(self):
+        name = "tests._fixtures.test_monkeypatch.C.foo"
+        with MonkeyPatch(name, lambda self, arg: "outer", context_local=True):
+            with MonkeyPatch(name, MonkeyPatch.delete, context_local=True):
+                self.assertFalse(hasattr(C(), "foo"))
+                self.assertEqual(1, self.in_thread(lambda: C().foo(1)))
+            self.assertEqual("outer", C().foo(1))
+        self.assertEqual(1, C().foo(1))
+
+    def test_missing_attribute(self):
+        name = "tests._fixtures.test_monkeypatch.C.new_attr"
+        with MonkeyPatch(name, 5, context_local=True):
+            self.assertEqual(5, C.new_attr)
+            self.assertFalse(self.in_thread(lambda: hasattr(C, "new_attr")))
+        self.assertFalse(hasattr(C, "new_attr"))
+
+
+class TestResolve(testtools.TestCase, TestWithFixtures):
+    def count_imports(self):
+        imports = []
+        real_import = builtins.__import__
+
+        def counting_import(name, *args, **kwargs):
+            imports.append(name)
+            return real_import(name, *args, **kwargs)
+
+        self.useFixture(MonkeyPatch("builtins.__import__", counting_import))
+        return imports
+
+    def test_resolves(self):
+        self.assertIs(C, _resolve(__name__ + ".C"))
+        self.assertIs(C.foo, _resolve(__name__ + ".C.foo"))
+        self.assertIs(sys.modules[__name__], _resolve(__name__))
+
+    def test_cached(self):
+        _resolve(__name__ + ".C")
+        imports = self.count_imports()
+        self.assertIs(C, _resolve(__name__ + ".C"))
+        self.assertEqual([], imports)
+
+    def test_follows_patched_attributes(self):
+        self.assertEqual("C", _resolve(__name__ + ".C.__name__"))
+        self.useFixture(MonkeyPatch(__name__ + ".C", D))
+        self.assertEqual("D", _resolve(__name__ + ".C.__name__"))
+
+    def test_invalidated_by_sys_modules(self):
+        name = "fixtures_test_resolve_module"
+        first = types.ModuleType(name)
+        first.value = 1
+        second = types.ModuleType(name)
+        second.value = 2
+        self.addCleanup(sys.modules.pop, name, None)
+        sys.modules[name] = first
+        self.assertEqual(1, _resolve(name + ".value"))
+        sys.modules[name] = second
+        self.assertEqual(2, _resolve(name + ".value"))
+
+    def test_invalidated_by_new_submodule(self):
+        name = "fixtures_test_resolve_package"
+        package = types.ModuleType(name)
+        package.sub = types.SimpleNamespace(value=1)
+        self.addCleanup(sys.modules.pop, name, None)
+        sys.modules[name] = package
+        self.assertEqual(1, _resolve(name + ".sub.value"))
+        submodule = types.ModuleType(name + ".sub")
+        self.addCleanup(sys.modules.pop, name + ".sub", None)
+        sys.modules[name + ".sub"] = submodule
+        package.sub = submodule
+        submodule.value = 2
+        imports = self.count_imports()
+        self.assertEqual(2, _resolve(name + ".sub.value"))
+        self.assertEqual([name + ".sub.value", name], imports)
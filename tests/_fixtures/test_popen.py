@@ -13,14 +13,19 @@
 # license you chose for the specific language governing permissions and
 # limitations under that license.
 
+import base64
 import inspect
 import io
+import json
+import os
+import shlex
+import signal
 import subprocess
 import sys
 
 import testtools
 
-from fixtures import FakePopen, TestWithFixtures
+from fixtures import FakePopen, PopenRecorder, TempDir, TestWithFixtures
 from fixtures._fixtures.popen import FakeProcess
 
 
@@ -150,6 +155,83 @@ class TestFakePopen(testtools.TestCase, TestWithFixtures):
             self.assertEqual(["ls -lh"], proc.args)
 
 
+class TestFakePopenRegistry(testtools.TestCase):
+    def test_exact(self):
+        fixture = self.useFixture(FakePopen())
+        fixture.register(["git", "status"], {"returncode": 1})
+        self.assertEqual(1, fixture(["git", "status"]).wait())
+        self.assertEqual(1, fixture("git  status").wait())
+        self.assertEqual(0, fixture(["git", "status", "-s"]).wait())
+
+    def test_longest_prefix(self):
+        fixture = self.useFixture(FakePopen())
+        fixture.register_prefix("git", {"returncode": 1})
+        fixture.register_prefix(["git", "log"], {"returncode": 2})
+        self.assertEqual(1, fixture(["git", "status"]).wait())
+        self.assertEqual(2, fixture(["git", "log", "-1"]).wait())
+        self.assertEqual(2, fixture(["git", "log"]).wait())
+        self.assertEqual(0, fixture(["gitk"]).wait())
+
+    def test_exact_before_prefix(self):
+        fixture = self.useFixture(FakePopen())
+        fixture.register_prefix("git", {"returncode": 1})
+        fixture.register("git log", {"returncode": 2})
+        self.assertEqual(2, fixture(["git", "log"]).wait())
+
+    def test_patterns_in_order(self):
+        fixture = self.useFixture(FakePopen())
+        fixture.register_glob("make *", {"returncode": 1})
+        fixture.register_regex(r"make (all|test)", {"returncode": 2})
+        fixture.register_regex(r"cc .*\.c", {"returncode": 3})
+        self.assertEqual(1, fixture(["make", "test"]).wait())
+        self.assertEqual(3, fixture("cc 'my file.c'").wait())
+        self.assertEqual(0, fixture(["cc", "x.h"]).wait())
+
+    def test_prefix_before_patterns(self):
+        fixture = self.useFixture(FakePopen())
+        fixture.register_regex(r"make .*", {"returncode": 1})
+        fixture.register_prefix(["make"], {"returncode": 2})
+        self.assertEqual(2, fixture(["make", "all"]).wait())
+
+    def test_callable_response(self):
+        calls = []
+
+        def response(proc_args):
+            calls.append(proc_args)
+            return {"returncode": 4}
+
+        fixture = self.useFixture(FakePopen())
+        fixture.register("ls", response)
+        self.assertEqual(4, fixture(["ls"], cwd="/").wait())
+        self.assertEqual([{"args": ["ls"], "cwd": "/"}], calls)
+
+    def test_unmatched_uses_get_info(self):
+        fixture = self.useFixture(FakePopen(lambda _: {"returncode": 5}))
+        fixture.register("ls", {})
+        self.assertEqual(0, fixture(["ls"]).wait())
+        self.assertEqual(5, fixture(["rm"]).wait())
+
+    def test_get_info_gets_unparseable_args(self):
+        calls = []
+        fixture = self.useFixture(FakePopen(lambda args: calls.append(args) or {}))
+        fixture('echo "unterminated', shell=True)
+        fixture.register("ls", {})
+        fixture('echo "unterminated', shell=True)
+        self.assertEqual([{"args": 'echo "unterminated', "shell": True}] * 2, calls)
+
+    def test_strict_unparseable_args(self):
+        fixture = self.useFixture(FakePopen(strict=True))
+        self.assertRaises(LookupError, fixture, 'echo "unterminated')
+        fixture.register("ls", {})
+        self.assertRaises(LookupError, fixture, 'echo "unterminated')
+
+    def test_strict(self):
+        fixture = self.useFixture(FakePopen(strict=True))
+        fixture.register_prefix("ls", {})
+        fixture(["ls", "-l"])
+        self.assertRaises(LookupError, fixture, ["rm", "-rf", "/"])
+
+
 class TestFakeProcess(testtools.TestCase):
     def test_wait(self):
         proc = FakeProcess({}, {})
@@ -204,3 +286,297 @@ class TestFakeProcess(testtools.TestCase):
     def test_wait_with_timeout_and_endtime(self):
         proc = FakeProcess({}, {})
         self.assertEqual(0, proc.wait(timeout=4, endtime=7))
+
+
+def pipes(**args):
+    """Popen arguments for a process with stdin, stdout and stderr pipes."""
+    args.setdefault("args", ["cmd"])
+    for name in ("stdin", "stdout", "stderr"):
+        args.setdefault(name, subprocess.PIPE)
+    return args
+
+
+class TestScriptedProcess(testtools.TestCase):
+    def test_streams_output(self):
+        def script():
+            yield ("stdout", b"one\n")
+            yield ("sleep", 10)
+            yield ("stdout", b"two\nthree\n")
+            yield ("stderr", "oops\n")
+            yield ("sleep", 10)
+
+        proc = FakeProcess(pipes(), {"script": script()})
+        self.assertEqual(b"one\n", proc.stdout.readline())
+        # Each poll lets one sleep pass.
+        self.assertIs(None, proc.poll())
+        self.assertEqual([b"two\n", b"three\n"], list(proc.stdout))
+        self.assertEqual(b"oops\n", proc.stderr.read())
+        self.assertEqual(0, proc.wait())
+
+    def test_text(self):
+        def script():
+            yield ("stdout", b"caf\xc3\xa9\r\n")
+            line = yield ("stdin",)
+            yield ("stdout", line.upper())
+
+        proc = FakeProcess(
+            pipes(encoding="utf-8", stderr=subprocess.STDOUT), {"script": script()}
+        )
+        self.assertIs(None, proc.stderr)
+        self.assertEqual(("café\nHI", None), proc.communicate("hi"))
+
+    def test_stdin(self):
+        received = []
+
+        def script():
+            while True:
+                data = yield ("stdin", 2)
+                if not data:
+                    return 4
+                received.append(data)
+
+        proc = FakeProcess(pipes(bufsize=0), {"script": script()})
+        proc.stdin.write(b"abc")
+        self.assertIs(None, proc.poll())
+        self.assertEqual([b"ab", b"c"], received)
+        proc.stdin.close()
+        self.assertEqual(4, proc.wait())
+
+    def test_exit(self):
+        def script():
+            yield ("exit", 2)
+            yield ("stdout", b"never")
+
+        proc = FakeProcess(pipes(), {"script": script()})
+        self.assertEqual((b"", b""), proc.communicate())
+        self.assertEqual(2, proc.returncode)
+
+    def test_poll_loop(self):
+        def script():
+            yield ("stdout", b"a")
+            yield ("sleep", 10)
+            yield ("stdout", b"b")
+            yield ("sleep", 10)
+            return 7
+
+        proc = FakeProcess(pipes(), {"script": script()})
+        polls = 0
+        while proc.poll() is None:
+            polls += 1
+            self.assertLess(polls, 10)
+        self.assertEqual(7, proc.returncode)
+        self.assertEqual(b"ab", proc.stdout.read())
+
+    def test_wait_timeout_uses_virtual_clock(self):
+        def script():
+            yield ("sleep", 3600)
+
+        proc = FakeProcess(pipes(), {"script": script()})
+        self.assertRaises(subprocess.TimeoutExpired, proc.wait, timeout=1800)
+        self.assertRaises(subprocess.TimeoutExpired, proc.communicate, timeout=1)
+        self.assertIs(None, proc.returncode)
+        self.assertEqual(0, proc.wait(timeout=1799))
+
+    def test_communicate_after_timeout(self):
+        def script():
+            yield ("stdout", b"a")
+            yield ("sleep", 2)
+            yield ("stdout", b"b")
+
+        proc = FakeProcess(pipes(), {"script": script()})
+        self.assertRaises(subprocess.TimeoutExpired, proc.communicate, timeout=1)
+        self.assertEqual((b"ab", b""), proc.communicate())
+
+    def test_deadlock_on_stdin(self):
+        def script():
+            yield ("stdin",)
+
+        proc = FakeProcess(pipes(), {"script": script()})
+        self.assertRaises(RuntimeError, proc.wait)
+        self.assertRaises(RuntimeError, proc.stdout.read)
+        self.assertRaises(subprocess.TimeoutExpired, proc.wait, timeout=5)
+
+    def test_full_pipe_blocks(self):
+        def script():
+            for _ in range(4):
+                yield ("stdout", b"x" * 100)
+
+        proc = FakeProcess(pipes(), {"script": script(), "pipe_size": 150})
+        self.assertRaises(RuntimeError, proc.wait)
+        self.assertEqual(b"x" * 200, proc.stdout.read(200))
+        self.assertEqual(b"x" * 200, proc.communicate()[0])
+        self.assertEqual(0, proc.returncode)
+
+    def test_full_stdin_blocks(self):
+        def script():
+            yield ("sleep", 1)
+
+        proc = FakeProcess(pipes(bufsize=0), {"script": script(), "pipe_size": 2})
+        self.assertEqual(2, proc.stdin.write(b"abc"))
+        self.assertRaises(BrokenPipeError, proc.stdin.write, b"c")
+
+    def test_unpiped_output_discarded(self):
+        def script():
+            yield ("stdout", b"x" * 100)
+            data = yield ("stdin",)
+            return len(data)
+
+        proc = FakeProcess({"args": "cmd"}, {"script": script(), "pipe_size": 1})
+        self.assertEqual((None, None), proc.communicate())
+        self.assertEqual(0, proc.returncode)
+
+    def test_async_script(self):
+        async def script():
+            yield ("stdout", b"a\n")
+            data = yield ("stdin",)
+            yield ("stdout", data)
+            yield ("exit", 1)
+
+        proc = FakeProcess(pipes(), {"script": script()})
+        self.assertEqual((b"a\nb", b""), proc.communicate(b"b"))
+        self.assertEqual(1, proc.returncode)
+
+    def test_kill(self):
+        def script():
+            yield ("sleep", 1)
+
+        proc = FakeProcess(pipes(), {"script": script()})
+        proc.kill()
+        self.assertEqual(-signal.SIGKILL, proc.wait())
+
+    def test_context_manager(self):
+        def script():
+            yield ("stdout", b"x" * 10)
+            return 5
+
+        with FakeProcess(pipes(), {"script": script(), "pipe_size": 1}) as proc:
+            pass
+        self.assertEqual(5, proc.returncode)
+
+    def test_via_fixture(self):
+        def script():
+            yield ("stdout", b"hi")
+
+        self.useFixture(FakePopen(lambda _: {"script": script()}))
+        self.assertEqual(b"hi", subprocess.check_output(["echo", "hi"]))
+
+
+UPPER = "import sys; sys.stdout.write(sys.stdin.read().upper()); sys.exit(3)"
+
+
+class TestPopenRecorder(testtools.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cassette = os.path.join(self.useFixture(TempDir()).path, "cassette")
+
+    def record(self, **kwargs):
+        with PopenRecorder(self.cassette, **kwargs):
+            process = subprocess.Popen(
+                [sys.executable, "-c", UPPER],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                cwd="/",
+            )
+            self.assertEqual((b"ABC", None), process.communicate(b"abc"))
+            self.assertEqual(3, process.returncode)
+
+    def test_records(self):
+        self.record(env=["PATH", "NOT_SET_ANYWHERE"])
+        with open(self.cassette) as cassette:
+            [entry] = [json.loads(line) for line in cassette]
+        self.assertEqual(
+            {
+                "args": [sys.executable, "-c", UPPER],
+                "cwd": "/",
+                "env": {"PATH": os.environ["PATH"]},
+                "stdin": "abc",
+                "stdout": "ABC",
+                "stderr": "",
+                "returncode": 3,
+            },
+            entry,
+        )
+
+    def test_records_streams(self):
+        with PopenRecorder(self.cassette):
+            process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-c",
+                    "import sys; sys.stdout.buffer.write(b'a\\n\\xff')",
+                ],
+                stdout=subprocess.PIPE,
+            )
+            self.assertEqual([b"a\n", b"\xff"], list(process.stdout))
+            process.wait()
+        with open(self.cassette) as cassette:
+            entry = json.loads(cassette.read())
+        self.assertEqual(
+            {"base64": base64.b64encode(b"a\n\xff").decode()}, entry["stdout"]
+        )
+        self.assertIs(None, entry["stdin"])
+
+    def test_runs_unparseable_args(self):
+        with PopenRecorder(self.cassette) as recorder:
+            process = subprocess.Popen(
+                "echo 'unterminated", shell=True, stderr=subprocess.DEVNULL
+            )
+            self.assertNotEqual(0, process.wait())
+            self.assertEqual([], recorder.procs)
+        with open(self.cassette) as cassette:
+            self.assertEqual("", cassette.read())
+
+    def test_replays(self):
+        self.record()
+        self.useFixture(FakePopen.from_cassette(self.cassette))
+        process = subprocess.Popen(
+            [sys.executable, "-c", UPPER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            cwd="/",
+        )
+        self.assertEqual(("ABC", None), process.communicate("xyz"))
+        self.assertEqual(3, process.returncode)
+
+    def test_replay_matches_cwd(self):
+        self.record()
+        self.useFixture(FakePopen.from_cassette(self.cassette))
+        self.assertRaises(LookupError, subprocess.Popen, [sys.executable, "-c", UPPER])
+
+    def test_replay_ignoring_cwd(self):
+        self.record()
+        self.useFixture(FakePopen.from_cassette(self.cassette, match_cwd=False))
+        process = subprocess.Popen(
+            f"{shlex.quote(sys.executable)} -c {shlex.quote(UPPER)}",
+            stdout=subprocess.PIPE,
+            shell=True,
+        )
+        self.assertEqual(b"ABC", process.stdout.read())
+        self.assertEqual(3, process.wait())
+
+    def test_replay_unparseable_args(self):
+        self.record()
+        fixture = self.useFixture(FakePopen.from_cassette(self.cassette))
+        self.assertRaises(LookupError, fixture, 'echo "unterminated', shell=True)
+        fixture.get_info = FakePopen.from_cassette(self.cassette, strict=False).get_info
+        self.assertEqual(0, fixture('echo "unterminated', shell=True).wait())
+
+    def test_replay_not_strict(self):
+        self.record()
+        self.useFixture(FakePopen.from_cassette(self.cassette, strict=False))
+        self.assertEqual(0, subprocess.Popen(["ls"]).wait())
+
+    def test_replays_in_order(self):
+        with PopenRecorder(self.cassette):
+            for code in ("1", "2"):
+                subprocess.Popen(
+                    [sys.executable, "-c", "import sys; sys.exit(int(input()))"],
+                    stdin=subprocess.PIPE,
+                ).communicate(code.encode())
+        fixture = self.useFixture(
+            FakePopen.from_cassette(self.cassette, match_cwd=False)
+        )
+        argv = [sys.executable, "-c", "import sys; sys.exit(int(input()))"]
+        codes = [fixture(argv).wait() for _ in range(3)]
+        self.assertEqual([1, 2, 2], codes)
@@ -14,15 +14,22 @@
 # limitations under that license.
 
 import os
+import shutil
+import stat
 import tempfile
+import time
 
 import testtools
 from testtools.matchers import StartsWith
 
 from fixtures import (
+    MultipleExceptions,
     NestedTempfile,
     TempDir,
+    TempDirPool,
+    TempDirReaper,
 )
+from fixtures._fixtures.tempdir import _filesystem_type, _memory_dir
 
 
 class TestTempDir(testtools.TestCase):
@@ -59,6 +66,45 @@ class TestTempDir(testtools.TestCase):
             temp_dir.join("foo", "bar", "baz"),
         )
 
+    def test_reset_empties_in_place(self):
+        fixture = self.useFixture(TempDir())
+        path = fixture.path
+        os.makedirs(fixture.join("a", "b"))
+        with open(fixture.join("a", "file"), "w"):
+            pass
+        fixture.reset()
+        self.assertEqual(path, fixture.path)
+        self.assertEqual([], os.listdir(path))
+
+    def test_reset_removed_directory(self):
+        fixture = self.useFixture(TempDir())
+        shutil.rmtree(fixture.path)
+        fixture.reset()
+        self.assertEqual([], os.listdir(fixture.path))
+
+    def test_reset_subclass_sets_up_again(self):
+        class Seeded(TempDir):
+            def _setUp(self):
+                super()._setUp()
+                with open(self.join("seed"), "w"):
+                    pass
+
+        fixture = self.useFixture(Seeded())
+        os.unlink(fixture.join("seed"))
+        fixture.reset()
+        self.assertEqual(["seed"], os.listdir(fixture.path))
+
+    def test_reset_runs_added_cleanups(self):
+        calls = []
+        fixture = self.useFixture(TempDir())
+        fixture.addCleanup(calls.append, "cleanup")
+        fixture.reset()
+        self.assertEqual(["cleanup"], calls)
+        # The cleanup was used up, so the next reset is incremental again.
+        path = fixture.path
+        fixture.reset()
+        self.assertEqual(path, fixture.path)
+
     def test_join_naughty_children(self):
         temp_dir = self.useFixture(TempDir())
         root = temp_dir.path
@@ -68,6 +114,335 @@ class TestTempDir(testtools.TestCase):
         )
 
 
+class TestTempDirTemplate(testtools.TestCase):
+    def fill(self, path):
+        self.calls.append(path)
+        os.mkdir(os.path.join(path, "sub"))
+        with open(os.path.join(path, "sub", "seed"), "w") as f:
+            f.write("seed")
+        os.symlink("sub/seed", os.path.join(path, "link"))
+
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+        self.root = self.useFixture(TempDir()).path
+
+    def assertPopulated(self, path):
+        with open(os.path.join(path, "sub", "seed")) as f:
+            self.assertEqual("seed", f.read())
+        self.assertEqual("sub/seed", os.readlink(os.path.join(path, "link")))
+
+    def test_callable_built_once(self):
+        first = self.useFixture(TempDir(self.root, template=self.fill))
+        second = self.useFixture(TempDir(self.root, template=self.fill))
+        self.assertPopulated(first.path)
+        self.assertPopulated(second.path)
+        self.assertEqual(1, len(self.calls))
+        self.assertEqual(self.root, os.path.dirname(self.calls[0]))
+        self.assertNotEqual(first.path, self.calls[0])
+
+    def test_directory_template(self):
+        template = self.useFixture(TempDir(self.root)).path
+        self.fill(template)
+        fixture = self.useFixture(TempDir(self.root, template=template))
+        self.assertPopulated(fixture.path)
+        self.assertEqual(1, len(self.calls))
+
+    def test_copies_are_independent(self):
+        fixture = self.useFixture(TempDir(self.root, template=self.fill))
+        with open(fixture.join("sub", "seed"), "w") as f:
+            f.write("changed")
+        self.assertPopulated(
+            self.useFixture(TempDir(self.root, template=self.fill)).path
+        )
+
+    def test_hardlink(self):
+        fixture = self.useFixture(TempDir(self.root, template=self.fill, hardlink=True))
+        self.assertPopulated(fixture.path)
+        template_seed = os.path.join(self.calls[0], "sub", "seed")
+        self.assertTrue(os.path.samefile(template_seed, fixture.join("sub", "seed")))
+
+    def test_reset_keeps_path(self):
+        fixture = self.useFixture(TempDir(self.root, template=self.fill))
+        path = fixture.path
+        os.unlink(fixture.join("sub", "seed"))
+        with open(fixture.join("extra"), "w"):
+            pass
+        fixture.reset()
+        self.assertEqual(path, fixture.path)
+        self.assertPopulated(path)
+        self.assertEqual(["link", "sub"], sorted(os.listdir(path)))
+
+    def test_reset_only_restores_changes(self):
+        fixture = self.useFixture(TempDir(self.root, template=self.fill))
+        seed = fixture.join("sub", "seed")
+        inode = os.lstat(seed).st_ino
+        link_inode = os.lstat(fixture.join("link")).st_ino
+        fixture.reset()
+        self.assertEqual(inode, os.lstat(seed).st_ino)
+        with open(seed, "a") as f:
+            f.write(" and more")
+        fixture.reset()
+        self.assertEqual(link_inode, os.lstat(fixture.join("link")).st_ino)
+        self.assertPopulated(fixture.path)
+
+    def test_reset_removed_root(self):
+        fixture = self.useFixture(TempDir(self.root, template=self.fill))
+        shutil.rmtree(fixture.path)
+        fixture.reset()
+        self.assertPopulated(fixture.path)
+
+    def test_reset_restores_permissions(self):
+        fixture = self.useFixture(TempDir(self.root, template=self.fill))
+        seed = fixture.join("sub", "seed")
+        file_mode = stat.S_IMODE(os.stat(seed).st_mode)
+        dir_mode = stat.S_IMODE(os.stat(fixture.join("sub")).st_mode)
+        os.chmod(seed, 0o400)
+        fixture.reset()
+        self.assertEqual(file_mode, stat.S_IMODE(os.stat(seed).st_mode))
+        os.chmod(fixture.join("sub"), 0o500)
+        fixture.reset()
+        self.assertEqual(dir_mode, stat.S_IMODE(os.stat(fixture.join("sub")).st_mode))
+        self.assertPopulated(fixture.path)
+
+    def test_reset_replaced_directory(self):
+        fixture = self.useFixture(TempDir(self.root, template=self.fill))
+        os.unlink(fixture.join("sub", "seed"))
+        os.rmdir(fixture.join("sub"))
+        with open(fixture.join("sub"), "w"):
+            pass
+        os.mkdir(fixture.join("new"))
+        with open(fixture.join("new", "file"), "w"):
+            pass
+        fixture.reset()
+        self.assertPopulated(fixture.path)
+        self.assertEqual(["link", "sub"], sorted(os.listdir(fixture.path)))
+        # The restored entries are recorded, so a second reset is a no-op.
+        inode = os.lstat(fixture.join("sub", "seed")).st_ino
+        fixture.reset()
+        self.assertEqual(inode, os.lstat(fixture.join("sub", "seed")).st_ino)
+
+    def test_reset_subclass_with_template(self):
+        class Seeded(TempDir):
+            def _setUp(self):
+                super()._setUp()
+                with open(self.join("extra"), "w"):
+                    pass
+
+        fixture = self.useFixture(Seeded(self.root, template=self.fill))
+        os.unlink(fixture.join("extra"))
+        fixture.reset()
+        self.assertPopulated(fixture.path)
+        self.assertEqual(["extra", "link", "sub"], sorted(os.listdir(fixture.path)))
+
+    def test_failing_template(self):
+        def fail(path):
+            raise RuntimeError("boom")
+
+        self.assertRaises(MultipleExceptions, TempDir(self.root, template=fail).setUp)
+        self.assertEqual([], os.listdir(self.root))
+
+
+class TestTempDirMemory(testtools.TestCase):
+    def setUp(self):
+        super().setUp()
+        if _memory_dir() is None:
+            self.skipTest("No memory-backed filesystem.")
+
+    def test_filesystem_type(self):
+        self.assertEqual("tmpfs", _filesystem_type("/dev/shm"))
+
+    def test_in_memory(self):
+        fixture = TempDir(memory=True)
+        with fixture:
+            self.assertTrue(fixture.in_memory)
+            self.assertEqual(_memory_dir(), os.path.dirname(fixture.path))
+            with open(fixture.join("file"), "w") as f:
+                f.write("x" * 100)
+            self.assertEqual(100, fixture.disk_usage())
+        self.assertFalse(os.path.exists(fixture.path))
+        self.assertEqual(100, fixture.memory_used)
+
+    def test_memory_limit_falls_back_to_disk(self):
+        fixture = self.useFixture(TempDir(memory=True, memory_limit=2**62))
+        self.assertFalse(fixture.in_memory)
+        self.assertEqual(tempfile.gettempdir(), os.path.dirname(fixture.path))
+
+    def test_memory_and_rootdir(self):
+        self.assertRaises(ValueError, TempDir, "/", memory=True)
+
+    def test_nested_tempfile(self):
+        fixture = NestedTempfile(memory=True)
+        with fixture:
+            self.assertTrue(fixture.in_memory)
+            self.assertEqual(_memory_dir(), os.path.dirname(tempfile.gettempdir()))
+            with tempfile.NamedTemporaryFile(delete=False) as f:
+                f.write(b"x" * 10)
+        self.assertEqual(10, fixture.memory_used)
+
+
+class TestTempDirReaper(testtools.TestCase):
+    def make_tree(self, root, files=3):
+        path = tempfile.mkdtemp(dir=root)
+        os.mkdir(os.path.join(path, "sub"))
+        for i in range(files):
+            with open(os.path.join(path, "sub", str(i)), "w") as f:
+                f.write("x" * 10)
+        return path
+
+    def test_discard_in_background(self):
+        root = self.useFixture(TempDir()).path
+        reaper = TempDirReaper()
+        self.addCleanup(reaper.close)
+        path = self.make_tree(root)
+        reaper.discard(path)
+        self.assertFalse(os.path.exists(path))
+        reaper.flush()
+        self.assertEqual(0, reaper.pending_entries)
+        self.assertEqual(0, reaper.synchronous_deletions)
+        # Only the (now empty) graveyard is left.
+        [graveyard] = os.listdir(root)
+        self.assertThat(graveyard, StartsWith(f"fixtures-graveyard-{os.getpid()}-"))
+        self.assertEqual([], os.listdir(os.path.join(root, graveyard)))
+
+    def test_close_removes_graveyards(self):
+        root = self.useFixture(TempDir()).path
+        reaper = TempDirReaper()
+        reaper.discard(self.make_tree(root))
+        reaper.close()
+        self.assertEqual([], os.listdir(root))
+        # Once closed, directories are deleted synchronously.
+        path = self.make_tree(root)
+        reaper.discard(path)
+        self.assertEqual([], os.listdir(root))
+        self.assertEqual(1, reaper.synchronous_deletions)
+
+    def test_entry_bound(self):
+        root = self.useFixture(TempDir()).path
+        reaper = TempDirReaper(max_entries=0)
+        self.addCleanup(reaper.close)
+        reaper.discard(self.make_tree(root))
+        self.assertEqual(1, reaper.synchronous_deletions)
+        self.assertEqual([], os.listdir(root))
+
+    def test_byte_bound(self):
+        root = self.useFixture(TempDir()).path
+        reaper = TempDirReaper(max_bytes=15)
+        self.addCleanup(reaper.close)
+        reaper.discard(self.make_tree(root, files=1))
+        self.assertEqual(0, reaper.synchronous_deletions)
+        # 20 bytes would exceed the bound whether or not the first directory
+        # has been deleted yet.
+        reaper.discard(self.make_tree(root, files=2))
+        self.assertEqual(1, reaper.synchronous_deletions)
+        reaper.flush()
+        self.assertEqual(0, reaper.pending_bytes)
+
+    def test_tempdir_with_reaper(self):
+        reaper = TempDirReaper()
+        self.addCleanup(reaper.close)
+        fixture = TempDir(reaper=reaper)
+        with fixture:
+            self.assertTrue(os.path.isdir(fixture.path))
+        self.assertFalse(os.path.isdir(fixture.path))
+        reaper.flush()
+        self.assertEqual(0, reaper.synchronous_deletions)
+
+    def test_tempdir_pool_and_reaper(self):
+        reaper = TempDirReaper()
+        self.addCleanup(reaper.close)
+        pool = TempDirPool(reaper=reaper)
+        self.addCleanup(pool.close)
+        self.assertRaises(ValueError, TempDir, pool=pool, reaper=reaper)
+
+
+class TestTempDirPool(testtools.TestCase):
+    def make_pool(self, size=2):
+        root = self.useFixture(TempDir()).path
+        pool = TempDirPool(root, size=size)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_acquire_release(self):
+        pool = self.make_pool()
+        path = pool.acquire()
+        self.assertTrue(os.path.isdir(path))
+        self.assertEqual([], os.listdir(path))
+        self.assertEqual(pool.rootdir, os.path.dirname(path))
+        with open(os.path.join(path, "file"), "w"):
+            pass
+        pool.release(path)
+        self.assertFalse(os.path.exists(path))
+
+    def test_close_removes_everything(self):
+        pool = self.make_pool()
+        held = pool.acquire()
+        pool.release(pool.acquire())
+        pool.close()
+        # Only the directory still held by its user is left.
+        self.assertEqual([os.path.basename(held)], os.listdir(pool.rootdir))
+
+    def test_refills_in_background(self):
+        pool = self.make_pool(size=3)
+        pool.acquire()
+        # Wait for the background thread to make directories ready.
+        for _ in range(500):
+            with pool._condition:
+                if len(pool._ready) == 3:
+                    break
+            time.sleep(0.01)
+        self.assertEqual(3, len(pool._ready))
+        self.assertEqual(4, len(os.listdir(pool.rootdir)))
+
+    def wait_for_ready(self, pool, count):
+        for _ in range(500):
+            with pool._condition:
+                if len(pool._ready) == count:
+                    return
+            time.sleep(0.01)
+        self.fail("The pool was not refilled.")
+
+    def test_fork(self):
+        if not hasattr(os, "fork"):
+            self.skipTest("Needs os.fork.")
+        pool = self.make_pool()
+        pool.acquire()
+        self.wait_for_ready(pool, 2)
+        ready = list(pool._ready)
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                child_path = pool.acquire()
+                self.wait_for_ready(pool, 2)
+                os.write(write_fd, child_path.encode())
+                pool.close()
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            child_path = pipe.read()
+        os.waitpid(pid, 0)
+        # The child made its own directories, and left the parent's alone.
+        self.assertThat(child_path, StartsWith(pool.rootdir))
+        self.assertNotIn(child_path, ready)
+        self.assertEqual(ready, list(pool._ready))
+        for path in ready:
+            self.assertTrue(os.path.isdir(path))
+
+    def test_tempdir_with_pool(self):
+        pool = self.make_pool()
+        fixture = TempDir(pool=pool)
+        with fixture:
+            self.assertTrue(os.path.isdir(fixture.path))
+            self.assertThat(fixture.path, StartsWith(pool.rootdir))
+        self.assertFalse(os.path.isdir(fixture.path))
+
+    def test_tempdir_rootdir_and_pool(self):
+        pool = self.make_pool()
+        self.assertRaises(ValueError, TempDir, pool.rootdir, pool=pool)
+
+
 class NestedTempfileTest(testtools.TestCase):
     """Tests for `NestedTempfile`."""
 
@@ -44,3 +44,9 @@ class TestTempDir(testtools.TestCase):
         fixture.setUp()
         with fixture:
             self.assertThat(fixture.path, StartsWith(root))
+
+    def test_reset_restores_home(self):
+        fixture = self.useFixture(TempHomeDir())
+        os.environ["HOME"] = "/elsewhere"
+        fixture.reset()
+        self.assertEqual(fixture.path, os.environ["HOME"])
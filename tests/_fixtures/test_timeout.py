@@ -13,7 +13,11 @@
 # license you chose for the specific language governing permissions and
 # limitations under that license.
 
+import asyncio
 import signal
+import subprocess
+import sys
+import threading
 import time
 from unittest import SkipTest
 
@@ -38,6 +42,13 @@ def sample_long_delay_with_harsh_timeout():
         time.sleep(100)  # Expected to be killed here.
 
 
+def busy_loop():
+    # A watchdog can only interrupt a thread running Python code.
+    deadline = time.monotonic() + 100
+    while time.monotonic() < deadline:
+        pass
+
+
 class TestTimeout(testtools.TestCase, fixtures.TestWithFixtures):
     def requireUnix(self):
         if getattr(signal, "alarm", None) is None:
@@ -67,3 +78,217 @@ class TestTimeout(testtools.TestCase, fixtures.TestWithFixtures):
         old_handler = signal.signal(signal.SIGALRM, sigalrm_handler)
         self.addCleanup(signal.signal, signal.SIGALRM, old_handler)
         self.assertThat(sample_long_delay_with_harsh_timeout, raises(GotAlarm))
+
+    def test_harsh_in_thread(self):
+        self.requireUnix()
+
+        class GotAlarm(Exception):
+            pass
+
+        def sigalrm_handler(signum, frame):
+            raise GotAlarm()
+
+        old_handler = signal.signal(signal.SIGALRM, sigalrm_handler)
+        self.addCleanup(signal.signal, signal.SIGALRM, old_handler)
+        done = threading.Event()
+        errors = []
+
+        def run():
+            try:
+                with fixtures.Timeout(0.05, gentle=False):
+                    done.wait(5)
+            except BaseException as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        try:
+            # SIGALRM is handled in the main thread.
+            self.assertRaises(GotAlarm, time.sleep, 5)
+        finally:
+            done.set()
+            thread.join()
+        self.assertEqual([], errors)
+        self.assertEqual(sigalrm_handler, signal.getsignal(signal.SIGALRM))
+
+    def test_gentle_in_thread_rejected(self):
+        self.requireUnix()
+        errors = []
+
+        def run():
+            try:
+                fixtures.Timeout(1, gentle=True).setUp()
+            except fixtures.MultipleExceptions as e:
+                errors.append(e.args[0][0])
+
+        with testtools.ExpectedException(fixtures.TimeoutException):
+            with fixtures.Timeout(0.1, gentle=True):
+                thread = threading.Thread(target=run)
+                thread.start()
+                thread.join()
+                # The failed Timeout did not disarm this one.
+                time.sleep(5)
+        self.assertEqual([ValueError], errors)
+
+    def test_sub_second(self):
+        self.requireUnix()
+        start = time.monotonic()
+        with testtools.ExpectedException(fixtures.TimeoutException):
+            with fixtures.Timeout(0.05, gentle=True):
+                time.sleep(100)
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_nested_inner_fires_first(self):
+        self.requireUnix()
+        with fixtures.Timeout(100, gentle=True):
+            with testtools.ExpectedException(fixtures.TimeoutException):
+                with fixtures.Timeout(0.05, gentle=True):
+                    time.sleep(100)
+            # The outer timeout is still armed, for its own remaining time.
+            remaining, _ = signal.getitimer(signal.ITIMER_REAL)
+            self.assertThat(remaining, testtools.matchers.GreaterThan(99))
+        self.assertEqual((0.0, 0.0), signal.getitimer(signal.ITIMER_REAL))
+
+    def test_nested_outer_fires_first(self):
+        self.requireUnix()
+        outer = fixtures.Timeout(0.05, gentle=True)
+        inner = fixtures.Timeout(5, gentle=True)
+        outer.setUp()
+        try:
+            inner.setUp()
+            try:
+                self.assertRaises(fixtures.TimeoutException, time.sleep, 5)
+            finally:
+                # The expired outer deadline must not fire again.
+                inner.cleanUp()
+                time.sleep(0.01)
+        finally:
+            outer.cleanUp()
+
+    def test_fires_once(self):
+        self.requireUnix()
+        fixture = fixtures.Timeout(0.05, gentle=True)
+        fixture.setUp()
+        try:
+            self.assertRaises(fixtures.TimeoutException, time.sleep, 5)
+            with fixtures.Timeout(100, gentle=True):
+                time.sleep(0.01)
+        finally:
+            fixture.cleanUp()
+
+    def test_outer_fires_after_inner_cleaned_up(self):
+        self.requireUnix()
+        with testtools.ExpectedException(fixtures.TimeoutException):
+            with fixtures.Timeout(0.1, gentle=True):
+                with fixtures.Timeout(100, gentle=True):
+                    pass
+                time.sleep(100)
+
+    def test_restores_handler(self):
+        self.requireUnix()
+        old_handler = signal.getsignal(signal.SIGALRM)
+        with fixtures.Timeout(100, gentle=True):
+            self.assertNotEqual(old_handler, signal.getsignal(signal.SIGALRM))
+        self.assertEqual(old_handler, signal.getsignal(signal.SIGALRM))
+
+
+class TestWatchdogTimeout(testtools.TestCase):
+    def test_passes(self):
+        fixture = fixtures.Timeout(100, gentle=True, watchdog=True)
+        with fixture:
+            pass
+        self.assertIsNone(fixture.stacks)
+
+    def test_gentle(self):
+        fixture = fixtures.Timeout(0.05, gentle=True, watchdog=True)
+        fixture.setUp()
+        try:
+            self.assertRaises(fixtures.TimeoutException, busy_loop)
+            self.assertIn("in busy_loop", fixture.stacks)
+            self.assertIn("timeout-stacks", fixture.getDetails())
+        finally:
+            fixture.cleanUp()
+
+    def test_gentle_unsupported(self):
+        self.useFixture(
+            fixtures.MonkeyPatch(
+                "fixtures._fixtures.timeout._can_raise_in_thread", lambda: False
+            )
+        )
+        self.assertRaises(ValueError, fixtures.Timeout, 1, gentle=True, watchdog=True)
+        fixtures.Timeout(1, gentle=False, watchdog=True)
+
+    def test_gentle_in_thread(self):
+        raised = []
+
+        def run():
+            try:
+                with fixtures.Timeout(0.05, gentle=True, watchdog=True):
+                    busy_loop()
+            except fixtures.TimeoutException:
+                raised.append(True)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertEqual([True], raised)
+
+    def test_harsh_aborts(self):
+        code = (
+            "import time, fixtures\n"
+            "with fixtures.Timeout(0.05, gentle=False, watchdog=True):\n"
+            "    time.sleep(100)\n"
+        )
+        process = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=60
+        )
+        self.assertEqual(-signal.SIGABRT, process.returncode)
+        self.assertIn('File "<string>", line 3, in <module>', process.stderr)
+
+
+class TestAsyncTimeout(testtools.TestCase):
+    def test_passes(self):
+        async def use():
+            async with fixtures.AsyncTimeout(100) as fixture:
+                await asyncio.sleep(0)
+            return fixture.expired
+
+        self.assertFalse(asyncio.run(use()))
+
+    def test_expires(self):
+        async def use():
+            async with fixtures.AsyncTimeout(0.05):
+                await asyncio.sleep(100)
+
+        self.assertRaises(fixtures.TimeoutException, asyncio.run, use())
+
+    def test_nested(self):
+        async def use():
+            async with fixtures.AsyncTimeout(100) as outer:
+                try:
+                    async with fixtures.AsyncTimeout(0.05) as inner:
+                        await asyncio.sleep(100)
+                except fixtures.TimeoutException:
+                    pass
+                # The task can still await after the inner timeout.
+                await asyncio.sleep(0)
+            return outer.expired, inner.expired
+
+        self.assertEqual((False, True), asyncio.run(use()))
+
+    def test_outer_expires(self):
+        async def use():
+            async with fixtures.AsyncTimeout(0.05):
+                async with fixtures.AsyncTimeout(100):
+                    await asyncio.sleep(100)
+
+        self.assertRaises(fixtures.TimeoutException, asyncio.run, use())
+
+    def test_other_cancellation_propagates(self):
+        async def use():
+            task = asyncio.current_task()
+            asyncio.get_running_loop().call_soon(task.cancel)
+            async with fixtures.AsyncTimeout(100):
+                await asyncio.sleep(100)
+
+        self.assertRaises(asyncio.CancelledError, asyncio.run, use())
@@ -0,0 +1,48 @@
+#  fixtures: Fixtures with cleanups for testing and convenience.
+#
+# Copyright (c) 2010, Robert Collins <robertc@robertcollins.net>
+#
+# Licensed under either the Apache License, Version 2.0 or the BSD 3-clause
+# license at the users choice. A copy of both licenses are available in the
+# project source as Apache-2.0 and BSD. You may not use this file except in
+# compliance with one of these two licences.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under these licenses is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# license you chose for the specific language governing permissions and
+# limitations under that license.
+
+import testtools
+
+import fixtures
+
+
+class TestTimingCollector(testtools.TestCase):
+    def test_records_while_set_up(self):
+        collector = fixtures.TimingCollector()
+        with collector:
+            with fixtures.TempDir():
+                pass
+        with fixtures.TempDir():
+            pass
+        self.assertEqual(["setUp", "cleanUp"], [t.operation for t in collector.records])
+        self.assertEqual("TempDir", collector.records[0].name)
+
+    def test_totals(self):
+        collector = self.useFixture(fixtures.TimingCollector())
+        for _ in range(3):
+            with fixtures.TempDir():
+                pass
+        totals = collector.totals()
+        self.assertIn(("TempDir", "setUp"), totals)
+        self.assertIn(("TempDir", "cleanUp"), totals)
+        self.assertIn(("rmtree", "cleanup"), totals)
+        self.assertEqual(
+            sum(
+                t.duration
+                for t in collector.records
+                if (t.name, t.operation) == ("TempDir", "setUp")
+            ),
+            totals[("TempDir", "setUp")],
+        )
@@ -13,11 +13,13 @@
 # license you chose for the specific language governing permissions and
 # limitations under that license.
 
+import asyncio
+import threading
 import types
 
 import testtools
 
-from fixtures.callmany import CallMany
+from fixtures.callmany import AsyncCallMany, CallMany, MultipleExceptions
 
 
 class TestCallMany(testtools.TestCase):
@@ -71,3 +73,133 @@ class TestCallMany(testtools.TestCase):
         self.assertEqual(("woo",), exc.args[0][1].args)
         self.assertEqual(("hoo",), exc.args[1][1].args)
         self.assertEqual(["1", "2"], calls)
+
+
+class TestAsyncCallMany(testtools.TestCase):
+    def test_calls_sync_and_async_in_reverse_order(self):
+        calls = []
+
+        async def async_cleanup(value):
+            calls.append(value)
+
+        call = AsyncCallMany()
+        call.push(calls.append, "1")
+        call.push(async_cleanup, "2")
+        call.push(calls.append, "3")
+        self.assertEqual(None, asyncio.run(call()))
+        self.assertEqual(["3", "2", "1"], calls)
+
+    def test_concurrent_group_runs_together(self):
+        calls = []
+        started = []
+
+        async def slow(value):
+            started.append(value)
+            # Every member of the group starts before any finishes.
+            await asyncio.sleep(0)
+            calls.append((value, list(started)))
+
+        call = AsyncCallMany()
+        call.push(calls.append, "last")
+        call.push_concurrent(slow, "a")
+        call.push_concurrent(slow, "b")
+        call.push(calls.append, "first")
+        asyncio.run(call())
+        self.assertEqual(["first", ("b", ["b", "a"]), ("a", ["b", "a"]), "last"], calls)
+
+    def test_raise_errors_false_returns_exceptions(self):
+        async def raise_exception():
+            raise Exception("woo")
+
+        call = AsyncCallMany()
+        call.push_concurrent(raise_exception)
+        call.push_concurrent(raise_exception)
+        call.push(raise_exception)
+        exceptions = asyncio.run(call(raise_errors=False))
+        self.assertEqual(3, len(exceptions))
+        self.assertEqual(("woo",), exceptions[0][1].args)
+
+    def test_single_exception_raised_directly(self):
+        def raise_exception():
+            raise ZeroDivisionError()
+
+        call = AsyncCallMany()
+        call.push(raise_exception)
+        self.assertRaises(ZeroDivisionError, asyncio.run, call())
+
+    def test_multiple_exceptions(self):
+        def raise_exception():
+            raise ZeroDivisionError()
+
+        async def use():
+            async with AsyncCallMany() as call:
+                call.push(raise_exception)
+                call.push(raise_exception)
+
+        e = self.assertRaises(MultipleExceptions, asyncio.run, use())
+        self.assertEqual(2, len(e.args))
+
+
+class TestCallManyConcurrent(testtools.TestCase):
+    def test_concurrent_run_overlaps(self):
+        # Both functions must be running at the same time for either to
+        # finish: run one at a time, the barrier would time out.
+        barrier = threading.Barrier(2, timeout=5)
+        calls = []
+        call = CallMany()
+        call.push(calls.append, "last")
+        call.push_concurrent(barrier.wait)
+        call.push_concurrent(barrier.wait)
+        call.push(calls.append, "first")
+        call()
+        self.assertEqual(["first", "last"], calls)
+
+    def test_sequential_entries_order_concurrent_runs(self):
+        calls = []
+        call = CallMany()
+        call.push_concurrent(calls.append, "c")
+        call.push(calls.append, "b")
+        call.push_concurrent(calls.append, "a")
+        call()
+        self.assertEqual(["a", "b", "c"], calls)
+
+    def test_barrier_splits_concurrent_runs(self):
+        calls = []
+        lock = threading.Lock()
+
+        def record(value):
+            with lock:
+                calls.append(value)
+
+        call = CallMany(max_workers=4)
+        call.push_concurrent(record, "before-1")
+        call.push_concurrent(record, "before-2")
+        call.barrier()
+        call.push_concurrent(record, "after-1")
+        call.push_concurrent(record, "after-2")
+        call()
+        self.assertEqual(["after-1", "after-2"], sorted(calls[:2]))
+        self.assertEqual(["before-1", "before-2"], sorted(calls[2:]))
+
+    def test_concurrent_exceptions_gathered(self):
+        def raise_exception(value):
+            raise Exception(value)
+
+        call = CallMany()
+        call.push_concurrent(raise_exception, "2")
+        call.push_concurrent(raise_exception, "1")
+        call.push(raise_exception, "0")
+        exceptions = call(raise_errors=False)
+        self.assertEqual(
+            [("0",), ("1",), ("2",)], [value.args for _, value, _ in exceptions]
+        )
+
+    def test_concurrent_multiple_exceptions_raised(self):
+        def raise_exception():
+            raise ZeroDivisionError()
+
+        call = CallMany()
+        call.push_concurrent(raise_exception)
+        call.push_concurrent(raise_exception)
+        e = self.assertRaises(MultipleExceptions, call)
+        self.assertEqual(2, len(e.args))
@@ -13,6 +13,8 @@
 # license you chose for the specific language governing permissions and
 # limitations under that license.
 
+import asyncio
+import threading
 import types
 
 import testtools
@@ -121,6 +123,20 @@ class TestFixture(testtools.TestCase):
         self.assertEqual(("hoo",), exc.args[1][1].args)
         self.assertEqual(["1", "2"], calls)
 
+    def test_addConcurrentCleanup(self):
+        barrier = threading.Barrier(2, timeout=5)
+        calls = []
+
+        class ConcurrentFixture(fixtures.Fixture):
+            def _setUp(self):
+                self.addCleanup(calls.append, "last")
+                self.addConcurrentCleanup(barrier.wait)
+                self.addConcurrentCleanup(barrier.wait)
+
+        with ConcurrentFixture():
+            pass
+        self.assertEqual(["last"], calls)
+
     def test_useFixture(self):
         parent = LoggingFixture("-outer")
         nested = LoggingFixture("-inner", calls=parent.calls)
@@ -442,3 +458,178 @@ class TestMethodFixture(testtools.TestCase):
         self.assertEqual(126, obj.value)
         fixture.cleanUp()
         self.assertEqual(84, obj.value)
+
+
+class TestCompoundFixture(testtools.TestCase):
+    def test_sets_up_and_cleans_up_in_order(self):
+        calls = []
+        fixture = fixtures.CompoundFixture(
+            [LoggingFixture("-1", calls), LoggingFixture("-2", calls)]
+        )
+        with fixture:
+            self.assertEqual(["setUp-1", "setUp-2"], calls)
+        self.assertEqual(["setUp-1", "setUp-2", "cleanUp-2", "cleanUp-1"], calls)
+
+    def test_parallel_sets_up_concurrently(self):
+        # Both children must be in setUp at the same time for either to
+        # finish: a serial setUp would time out waiting on the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+
+        class WaitingFixture(fixtures.Fixture):
+            def _setUp(self):
+                barrier.wait()
+
+        fixture = fixtures.CompoundFixture(
+            [WaitingFixture(), WaitingFixture()], parallel=True
+        )
+        with fixture:
+            pass
+
+    def test_parallel_cleans_up_in_reverse_order(self):
+        calls = []
+        children = [LoggingFixture(f"-{i}", calls) for i in range(5)]
+        fixture = fixtures.CompoundFixture(children, parallel=True, max_workers=5)
+        fixture.setUp()
+        del calls[:]
+        fixture.cleanUp()
+        self.assertEqual([f"cleanUp-{i}" for i in reversed(range(5))], calls)
+
+    def test_parallel_failure_cleans_up_the_others(self):
+        calls = []
+
+        class BrokenFixture(fixtures.Fixture):
+            def _setUp(self):
+                self.addDetail("content", text_content("foobar"))
+                raise ZeroDivisionError()
+
+        fixture = fixtures.CompoundFixture(
+            [LoggingFixture("-1", calls), BrokenFixture(), LoggingFixture("-3", calls)],
+            parallel=True,
+        )
+        e = self.assertRaises(fixtures.MultipleExceptions, fixture.setUp)
+        self.assertEqual(["setUp-1", "setUp-3"], sorted(calls[:2]))
+        self.assertEqual(["cleanUp-3", "cleanUp-1"], calls[2:])
+        self.assertIs(fixtures.MultipleExceptions, e.args[0][0])
+        self.assertIs(ZeroDivisionError, e.args[0][1].args[0][0])
+        self.assertIs(fixtures.SetupError, e.args[-1][0])
+        self.assertEqual({"content": text_content("foobar")}, e.args[-1][1].args[0])
+
+    def test_parallel_multiple_failures(self):
+        class BrokenFixture(fixtures.Fixture):
+            def _setUp(self):
+                raise ZeroDivisionError()
+
+        fixture = fixtures.CompoundFixture(
+            [BrokenFixture(), BrokenFixture()], parallel=True
+        )
+        e = self.assertRaises(fixtures.MultipleExceptions, fixture.setUp)
+        inner = e.args[0][1]
+        self.assertIsInstance(inner, fixtures.MultipleExceptions)
+        self.assertEqual(2, len(inner.args))
+
+
+class AsyncLoggingFixture(fixtures.AsyncFixture):
+    def __init__(self, suffix="", calls=None):
+        super().__init__()
+        if calls is None:
+            calls = []
+        self.calls = calls
+        self.suffix = suffix
+
+    async def _setUp(self):
+        self.calls.append("setUp" + self.suffix)
+        self.addAsyncCleanup(self._cleanup)
+
+    async def _cleanup(self):
+        self.calls.append("cleanUp" + self.suffix)
+
+
+class TestAsyncFixture(testtools.TestCase):
+    def test_context_manager(self):
+        calls = []
+
+        async def use():
+            async with AsyncLoggingFixture(calls=calls):
+                calls.append("body")
+
+        asyncio.run(use())
+        self.assertEqual(["setUp", "body", "cleanUp"], calls)
+
+    def test_useFixture_sync_and_async(self):
+        calls = []
+
+        async def use():
+            parent = AsyncLoggingFixture("-outer", calls)
+            await parent.setUp()
+            await parent.useFixture(LoggingFixture("-sync", calls))
+            await parent.useFixture(AsyncLoggingFixture("-async", calls))
+            await parent.cleanUp()
+
+        asyncio.run(use())
+        self.assertEqual(
+            [
+                "setUp-outer",
+                "setUp-sync",
+                "setUp-async",
+                "cleanUp-async",
+                "cleanUp-sync",
+                "cleanUp-outer",
+            ],
+            calls,
+        )
+
+    def test_reset(self):
+        calls = []
+
+        async def use():
+            async with AsyncLoggingFixture(calls=calls) as fixture:
+                await fixture.reset()
+
+        asyncio.run(use())
+        self.assertEqual(["setUp", "cleanUp", "setUp", "cleanUp"], calls)
+
+    def test_concurrent_cleanups(self):
+        events = []
+
+        class Fixture(fixtures.AsyncFixture):
+            async def _setUp(self):
+                for name in ("a", "b"):
+                    self.addConcurrentCleanup(self.close, name)
+
+            async def close(self, name):
+                events.append("start-" + name)
+                await asyncio.sleep(0)
+                events.append("end-" + name)
+
+        async def use():
+            async with Fixture():
+                pass
+
+        asyncio.run(use())
+        self.assertEqual(["start-b", "start-a", "end-b", "end-a"], events)
+
+    def test_setUp_failure_cleans_up_and_reports_details(self):
+        calls = []
+
+        class BrokenFixture(fixtures.AsyncFixture):
+            async def _setUp(self):
+                self.addCleanup(calls.append, "cleaned")
+                self.addDetail("content", text_content("foobar"))
+                raise ZeroDivisionError()
+
+        e = self.assertRaises(
+            fixtures.MultipleExceptions, asyncio.run, BrokenFixture().setUp()
+        )
+        self.assertEqual(["cleaned"], calls)
+        self.assertIs(ZeroDivisionError, e.args[0][0])
+        self.assertIs(fixtures.SetupError, e.args[-1][0])
+        self.assertEqual({"content": text_content("foobar")}, e.args[-1][1].args[0])
+
+    def test_details_from_child_fixtures_are_returned(self):
+        async def use():
+            async with fixtures.AsyncFixture() as parent:
+                child = await parent.useFixture(fixtures.Fixture())
+                child.addDetail("foo", "content")
+                return parent.getDetails()
+
+        self.assertEqual({"foo": "content"}, asyncio.run(use()))
@@ -0,0 +1,103 @@
+#  fixtures: Fixtures with cleanups for testing and convenience.
+#
+# Copyright (c) 2010, Robert Collins <robertc@robertcollins.net>
+#
+# Licensed under either the Apache License, Version 2.0 or the BSD 3-clause
+# license at the users choice. A copy of both licenses are available in the
+# project source as Apache-2.0 and BSD. You may not use this file except in
+# compliance with one of these two licences.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under these licenses is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# license you chose for the specific language governing permissions and
+# limitations under that license.
+
+import testtools
+
+import fixtures
+
+
+def make_fixtures(calls):
+    """Build a diamond: App requires Web and DB, which both require Dir."""
+
+    class Logging(fixtures.Fixture):
+        def _setUp(self):
+            calls.append("setUp-" + type(self).__name__)
+            self.addCleanup(calls.append, "cleanUp-" + type(self).__name__)
+
+    class Dir(Logging):
+        pass
+
+    class DB(Logging):
+        requires = {"dir": Dir}
+
+    class Web(Logging):
+        requires = {"dir": Dir}
+
+    class App(Logging):
+        requires = {"db": DB, "web": Web}
+
+    return Dir, DB, Web, App
+
+
+class TestFixtureGraph(testtools.TestCase):
+    def test_dependencies_are_injected_and_shared(self):
+        Dir, DB, Web, App = make_fixtures([])
+        app = App()
+        with fixtures.FixtureGraph([app]):
+            self.assertIsInstance(app.db, DB)
+            self.assertIsInstance(app.web, Web)
+            self.assertIs(app.db.dir, app.web.dir)
+
+    def test_requested_fixture_satisfies_requirements(self):
+        Dir, DB, Web, App = make_fixtures([])
+        dir = Dir()
+        db = DB()
+        with fixtures.FixtureGraph([db, dir]):
+            self.assertIs(dir, db.dir)
+
+    def test_levels(self):
+        Dir, DB, Web, App = make_fixtures([])
+        app = App()
+        with fixtures.FixtureGraph([app]) as graph:
+            self.assertEqual([[app.db.dir], [app.db, app.web], [app]], graph.levels)
+
+    def test_setup_and_cleanup_order(self):
+        calls = []
+        Dir, DB, Web, App = make_fixtures(calls)
+        with fixtures.FixtureGraph([App()]):
+            self.assertEqual("setUp-Dir", calls[0])
+            self.assertEqual(["setUp-DB", "setUp-Web"], sorted(calls[1:3]))
+            self.assertEqual("setUp-App", calls[3])
+            del calls[:]
+        self.assertEqual(
+            ["cleanUp-App", "cleanUp-Web", "cleanUp-DB", "cleanUp-Dir"], calls
+        )
+
+    def test_cycle(self):
+        class A(fixtures.Fixture):
+            pass
+
+        class B(fixtures.Fixture):
+            requires = {"a": A}
+
+        A.requires = {"b": B}
+        graph = fixtures.FixtureGraph([A()])
+        e = self.assertRaises(fixtures.MultipleExceptions, graph.setUp)
+        self.assertIs(ValueError, e.args[0][0])
+        self.assertEqual(("Fixture dependency cycle: A -> B -> A",), e.args[0][1].args)
+
+    def test_failure_cleans_up_lower_levels(self):
+        calls = []
+        Dir, DB, Web, App = make_fixtures(calls)
+
+        class BrokenWeb(Web):
+            def _setUp(self):
+                raise ZeroDivisionError()
+
+        App.requires = {"db": DB, "web": BrokenWeb}
+        graph = fixtures.FixtureGraph([App()])
+        e = self.assertRaises(fixtures.MultipleExceptions, graph.setUp)
+        self.assertIs(fixtures.MultipleExceptions, e.args[0][0])
+        self.assertEqual(["setUp-Dir", "setUp-DB", "cleanUp-DB", "cleanUp-Dir"], calls)
@@ -0,0 +1,94 @@
+#  fixtures: Fixtures with cleanups for testing and convenience.
+#
+# Copyright (c) 2010, Robert Collins <robertc@robertcollins.net>
+#
+# Licensed under either the Apache License, Version 2.0 or the BSD 3-clause
+# license at the users choice. A copy of both licenses are available in the
+# project source as Apache-2.0 and BSD. You may not use this file except in
+# compliance with one of these two licences.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under these licenses is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# license you chose for the specific language governing permissions and
+# limitations under that license.
+
+import unittest
+
+import testtools
+
+import fixtures
+from tests.helpers import LoggingFixture
+
+
+class TestFixturePool(testtools.TestCase):
+    def make_pool(self, max_size=16):
+        pool = fixtures.FixturePool(max_size)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_reuses_fixture_after_reset(self):
+        pool = self.make_pool()
+        fixture = pool.acquire(LoggingFixture, "-a")
+        pool.release(fixture)
+        self.assertIs(fixture, pool.acquire(LoggingFixture, "-a"))
+        self.assertEqual(["setUp-a", "reset-a"], fixture.calls)
+
+    def test_keyed_by_arguments(self):
+        pool = self.make_pool()
+        fixture = pool.acquire(LoggingFixture, "-a")
+        pool.release(fixture)
+        other = pool.acquire(LoggingFixture, "-b")
+        self.assertIsNot(fixture, other)
+        self.assertEqual(["setUp-b"], other.calls)
+
+    def test_one_user_at_a_time(self):
+        pool = self.make_pool()
+        first = pool.acquire(fixtures.Fixture)
+        second = pool.acquire(fixtures.Fixture)
+        self.assertIsNot(first, second)
+
+    def test_evicts_least_recently_released(self):
+        pool = self.make_pool(max_size=2)
+        pooled = [pool.acquire(LoggingFixture, f"-{i}") for i in range(3)]
+        for fixture in pooled:
+            pool.release(fixture)
+        self.assertEqual("cleanUp-0", pooled[0].calls[-1])
+        self.assertEqual("reset-1", pooled[1].calls[-1])
+        self.assertIs(pooled[2], pool.acquire(LoggingFixture, "-2"))
+
+    def test_close_cleans_up_idle_and_released(self):
+        pool = fixtures.FixturePool()
+        idle = pool.acquire(LoggingFixture, "-idle")
+        busy = pool.acquire(LoggingFixture, "-busy")
+        pool.release(idle)
+        pool.close()
+        self.assertEqual("cleanUp-idle", idle.calls[-1])
+        pool.release(busy)
+        self.assertEqual("cleanUp-busy", busy.calls[-1])
+
+    def test_failed_reset_drops_fixture(self):
+        pool = self.make_pool()
+
+        class BrokenReset(fixtures.Fixture):
+            def reset(self):
+                raise ZeroDivisionError()
+
+        fixture = pool.acquire(BrokenReset)
+        self.assertRaises(ZeroDivisionError, pool.release, fixture)
+        self.assertIsNot(fixture, pool.acquire(BrokenReset))
+
+    def test_get_with_useFixture(self):
+        pool = self.make_pool()
+        seen = []
+
+        class Test(fixtures.TestWithFixtures):
+            def test_a(self):
+                seen.append(self.useFixture(pool.get(fixtures.TempDir)).fixture)
+
+            test_b = test_a
+
+        result = unittest.TestResult()
+        unittest.TestSuite([Test("test_a"), Test("test_b")]).run(result)
+        self.assertTrue(result.wasSuccessful())
+        self.assertIs(seen[0], seen[1])
@@ -113,3 +113,71 @@ class TestTestWithFixtures(unittest.TestCase):
 
         non_detailed_test_case = NonDetailedTestCase("test")
         self.assertRaises(SomethingBroke, non_detailed_test_case.setUp)
+
+
+class TestSharedFixtures(unittest.TestCase):
+    def run_tests(self, *classes):
+        suite = unittest.TestSuite()
+        for cls in classes:
+            suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(cls))
+        result = unittest.TestResult()
+        suite.run(result)
+        self.assertEqual([], result.errors + result.failures)
+
+    def test_useClassFixture(self):
+        calls = []
+        seen = []
+
+        def factory():
+            return LoggingFixture(calls=calls)
+
+        class SharingTest(TestWithFixtures):
+            def test_a(self):
+                seen.append(self.useClassFixture(factory))
+                calls.append("test")
+
+            test_b = test_a
+
+        class OtherTest(SharingTest):
+            pass
+
+        self.run_tests(SharingTest, OtherTest)
+        self.assertIs(seen[0], seen[1])
+        self.assertIsNot(seen[1], seen[2])
+        self.assertIs(seen[2], seen[3])
+        self.assertEqual(["setUp", "test", "test", "cleanUp"] * 2, calls)
+
+    def test_useClassFixture_reset(self):
+        calls = []
+
+        def factory():
+            return LoggingFixture(calls=calls)
+
+        class SharingTest(TestWithFixtures):
+            def test_a(self):
+                self.useClassFixture(factory, reset=True)
+                # Using it again within a test doesn't reset it.
+                self.useClassFixture(factory, reset=True)
+
+            test_b = test_a
+
+        self.run_tests(SharingTest)
+        self.assertEqual(["setUp", "reset", "cleanUp"], calls)
+
+    def test_useModuleFixture(self):
+        calls = []
+        seen = []
+
+        def factory():
+            return LoggingFixture(calls=calls)
+
+        class SharingTest(TestWithFixtures):
+            def test_a(self):
+                seen.append(self.useModuleFixture(factory))
+
+        class OtherTest(SharingTest):
+            pass
+
+        self.run_tests(SharingTest, OtherTest)
+        self.assertIs(seen[0], seen[1])
+        self.assertEqual(["setUp", "cleanUp"], calls)
@@ -0,0 +1,114 @@
+#  fixtures: Fixtures with cleanups for testing and convenience.
+#
+# Copyright (c) 2010, Robert Collins <robertc@robertcollins.net>
+#
+# Licensed under either the Apache License, Version 2.0 or the BSD 3-clause
+# license at the users choice. A copy of both licenses are available in the
+# project source as Apache-2.0 and BSD. You may not use this file except in
+# compliance with one of these two licences.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under these licenses is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# license you chose for the specific language governing permissions and
+# limitations under that license.
+
+import testtools
+
+import fixtures
+from fixtures import timing
+
+
+class Inner(fixtures.Fixture):
+    def _setUp(self):
+        self.addCleanup(self.forget)
+
+    def forget(self):
+        pass
+
+
+class Outer(fixtures.Fixture):
+    def _setUp(self):
+        self.useFixture(Inner())
+
+
+class TestTiming(testtools.TestCase):
+    def listen(self):
+        records = []
+        timing.add_listener(records.append)
+        self.addCleanup(timing.remove_listener, records.append)
+        return records
+
+    def test_off_without_listeners(self):
+        fixture = Outer()
+        with fixture:
+            pass
+        self.assertFalse(hasattr(fixture, "timings"))
+
+    def test_setUp_tree(self):
+        records = self.listen()
+        fixture = Outer()
+        fixture.setUp()
+        self.addCleanup(fixture.cleanUp)
+        self.assertEqual(1, len(records))
+        setup = records[0]
+        self.assertEqual(
+            ("setUp", "Outer", Outer, 0),
+            (
+                setup.operation,
+                setup.name,
+                setup.fixture_class,
+                setup.depth,
+            ),
+        )
+        self.assertGreaterEqual(setup.duration, 0)
+        [child] = setup.children
+        self.assertEqual(
+            ("setUp", Inner, 1),
+            (
+                child.operation,
+                child.fixture_class,
+                child.depth,
+            ),
+        )
+        self.assertEqual([setup], fixture.timings)
+
+    def test_cleanUp_includes_cleanups(self):
+        records = self.listen()
+        fixture = Outer()
+        fixture.setUp()
+        fixture.cleanUp()
+        cleanup = records[1]
+        self.assertEqual("cleanUp", cleanup.operation)
+        self.assertEqual(
+            [
+                ("cleanUp", "Outer"),
+                ("cleanup", "Fixture.cleanUp"),
+                ("cleanUp", "Inner"),
+                ("cleanup", "Inner.forget"),
+            ],
+            [(t.operation, t.name) for t in cleanup.walk()],
+        )
+        self.assertEqual(["setUp", "cleanUp"], [t.operation for t in fixture.timings])
+
+    def test_reset_nests_operations(self):
+        records = self.listen()
+        fixture = Outer()
+        fixture.setUp()
+        fixture.reset()
+        fixture.cleanUp()
+        self.assertEqual(
+            ["setUp", "reset", "cleanUp"], [t.operation for t in fixture.timings]
+        )
+        self.assertEqual(
+            ["cleanUp", "setUp"], [t.operation for t in records[1].children]
+        )
+
+    def test_parallel_children_nest(self):
+        records = self.listen()
+        with fixtures.CompoundFixture([Inner(), Inner()], parallel=True):
+            pass
+        self.assertEqual(
+            [("setUp", 1), ("setUp", 1)],
+            [(t.operation, t.depth) for t in records[0].children],
+        )